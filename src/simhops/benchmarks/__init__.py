@@ -0,0 +1 @@
+"""Performance and accuracy benchmarks (run as ``python -m simhops.benchmarks.<name>``)."""
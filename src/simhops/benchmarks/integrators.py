@@ -0,0 +1,619 @@
+"""Integrator and timestep accuracy/speed benchmark.
+
+Replays fixed action traces through ``Quadcopter`` for every integrator and
+timestep combination and compares the trajectories against a high-resolution
+reference (RK4 at ``--reference-dt``). Each row reports physics throughput
+next to position and attitude divergence, so the fastest acceptable physics
+settings can be picked per curriculum stage.
+
+Over a whole trace, open-loop replays compound every small difference into
+attitude and position drift, which says little about the error a policy
+sees between observations. Runs are therefore re-synced to the reference
+state at the start of every window of ``--horizons`` seconds, and the
+divergence reported for a horizon is the error accumulated within one
+window. A horizon of 0 replays the whole trace open loop. Comparison stops
+at the reference's first ground contact, where contact resolution rather
+than integration dominates the error.
+
+Traces are either random (smooth noise around hover, one per seed) or
+recorded from a trained policy flying ``QuadcopterEnv``. Actions are held
+piecewise constant over each trace's control period, so all timesteps see
+the same commands at the same simulated times.
+
+Usage:
+    python -m simhops.benchmarks.integrators --seeds 0 1 2 --output bench.json
+    python -m simhops.benchmarks.integrators --horizons 0.1 0.5 1.0
+    python -m simhops.benchmarks.integrators --policy models/run_x/final \\
+        --integrators RK4 implicitfast --timesteps 0.005 0.01 0.02 --csv bench.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import mujoco
+import numpy as np
+
+from simhops.config import Config
+from simhops.core.frame import FrameGeometry
+from simhops.core.model_factory import make_quadcopter_model
+from simhops.core.quadcopter import Quadcopter, QuadcopterParams, QuadcopterSnapshot
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+DEFAULT_INTEGRATORS = ("Euler", "RK4", "implicit", "implicitfast")
+DEFAULT_TIMESTEPS = (0.001, 0.002, 0.005, 0.01, 0.02)
+# Seconds between re-syncs to the reference state (0: whole trace open loop)
+DEFAULT_HORIZONS = (0.1, 0.5)
+
+# Comparison stops once the reference trajectory gets this close to the ground
+# or touches it (contacts dominate the error otherwise)
+MIN_REFERENCE_ALTITUDE = 0.1
+
+
+@dataclass
+class ActionTrace:
+    """Fixed command sequence replayed through every physics setting.
+
+    Attributes:
+        name: Label used in the results table
+        actions: (T, 4) raw ``Quadcopter.apply_action`` commands
+        control_dt: Seconds each action is held
+        start_position: Initial position of the drone
+    """
+
+    name: str
+    actions: NDArray[np.float64]
+    control_dt: float
+    start_position: NDArray[np.float64]
+
+    @property
+    def duration(self) -> float:
+        return len(self.actions) * self.control_dt
+
+    def save(self, path: str | Path) -> None:
+        """Save the trace as ``.npz`` for later replays."""
+        np.savez(
+            path,
+            name=self.name,
+            actions=self.actions,
+            control_dt=self.control_dt,
+            start_position=self.start_position,
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> ActionTrace:
+        with np.load(path) as data:
+            return cls(
+                name=str(data["name"]),
+                actions=data["actions"],
+                control_dt=float(data["control_dt"]),
+                start_position=data["start_position"],
+            )
+
+
+@dataclass
+class Rollout:
+    """States of one trace replay, sampled at every control period boundary.
+
+    Attributes:
+        positions: (T + 1, 3) positions
+        orientations: (T + 1, 4) quaternions
+        snapshots: States at the start of each re-sync window, keyed by
+            control step (only filled when recording)
+        first_contact: First control step during which MuJoCo reported a
+            contact, or the number of steps if there was none
+        elapsed: Wall time spent stepping physics
+    """
+
+    positions: NDArray[np.float64]
+    orientations: NDArray[np.float64]
+    snapshots: dict[int, QuadcopterSnapshot]
+    first_contact: int
+    elapsed: float
+
+
+@dataclass
+class BenchmarkResult:
+    """One row of the benchmark table."""
+
+    trace: str
+    integrator: str
+    timestep: float
+    horizon: float
+    steps_per_sec: float
+    realtime_factor: float
+    compared_seconds: float
+    pos_err_max: float
+    pos_err_rms: float
+    att_err_max_deg: float
+    att_err_rms_deg: float
+    acceptable: bool
+
+
+def quadcopter_params_from_config() -> QuadcopterParams:
+    """``QuadcopterParams`` matching the loaded config."""
+    quad_cfg = Config.schema().quadcopter
+    return QuadcopterParams(
+        mass=quad_cfg.mass,
+        arm_length=quad_cfg.arm_length,
+        thrust_to_weight=quad_cfg.thrust_to_weight,
+        inertia=quad_cfg.inertia,
+        drag_coeff=quad_cfg.drag_coeff,
+        motor_time_constant=quad_cfg.motor_time_constant,
+        frame=quad_cfg.frame,
+    )
+
+
+def random_trace(
+    seed: int,
+    params: QuadcopterParams,
+    duration: float = 5.0,
+    control_dt: float = 0.01,
+    start_height: float = 5.0,
+) -> ActionTrace:
+    """Smooth random commands around hover (Ornstein-Uhlenbeck noise).
+
+    Throttle wanders around the hover command and rates around zero, which
+    exercises attitude dynamics without flying into the ground too quickly.
+    """
+    rng = np.random.default_rng(seed)
+    steps = int(round(duration / control_dt))
+    hover = FrameGeometry(params).hover_action()
+
+    # OU process with ~0.2 s correlation time
+    decay = math.exp(-control_dt / 0.2)
+    sigma = np.array([0.1, 0.05, 0.05, 0.05]) * math.sqrt(1.0 - decay * decay)
+    noise = np.zeros(4)
+    actions = np.empty((steps, 4))
+    for k in range(steps):
+        noise = decay * noise + sigma * rng.standard_normal(4)
+        actions[k] = hover + noise
+    return ActionTrace(
+        name=f"random_{seed}",
+        actions=np.clip(actions, -1.0, 1.0),
+        control_dt=control_dt,
+        start_position=np.array([0.0, 0.0, start_height]),
+    )
+
+
+def record_policy_trace(model_path: str, seed: int = 0) -> ActionTrace:
+    """Record one deterministic episode of a trained policy in ``QuadcopterEnv``."""
+    from stable_baselines3 import PPO
+
+    from simhops.envs.quadcopter_env import QuadcopterEnv
+    from simhops.evaluate import find_model_file, load_obs_rms, normalize_observation
+
+    model_dir = Path(model_path)
+    model = PPO.load(str(find_model_file(model_dir)))
+    obs_rms = load_obs_rms(model_dir)
+
+    env = QuadcopterEnv(render_mode=None, add_sensor_noise=False)
+    obs, _ = env.reset(seed=seed)
+    assert env._quad is not None
+    start_position = env._quad.get_state().position
+
+    actions = []
+    done = False
+    while not done:
+        action, _ = model.predict(normalize_observation(obs, obs_rms), deterministic=True)
+        actions.append(np.clip(action, -1.0, 1.0) * env.action_scale)
+        obs, _, terminated, truncated, _ = env.step(action)
+        done = terminated or truncated
+    env.close()
+
+    return ActionTrace(
+        name=f"policy_{model_dir.name}_{seed}",
+        actions=np.array(actions),
+        control_dt=env.dt,
+        start_position=start_position,
+    )
+
+
+def divides(timestep: float, control_dt: float) -> bool:
+    """Whether ``control_dt`` is a whole number of ``timestep`` ticks."""
+    ratio = control_dt / timestep
+    return round(ratio) >= 1 and abs(round(ratio) - ratio) < 1e-6
+
+
+def window_steps(horizon: float, control_dt: float) -> int:
+    """Control steps per re-sync window; 0 for open-loop replays.
+
+    Raises:
+        ValueError: If ``horizon`` is not a whole number of control periods
+    """
+    if horizon <= 0:
+        return 0
+    if not divides(control_dt, horizon):
+        raise ValueError(
+            f"horizon {horizon} is not a multiple of control_dt {control_dt}"
+        )
+    return int(round(horizon / control_dt))
+
+
+def simulate(
+    trace: ActionTrace,
+    params: QuadcopterParams,
+    integrator: str,
+    timestep: float,
+    window: int = 0,
+    starts: dict[int, QuadcopterSnapshot] | None = None,
+) -> Rollout:
+    """Replay ``trace`` and sample the state at every control period boundary.
+
+    Args:
+        trace: Actions to replay
+        params: Physical parameters
+        integrator: MuJoCo integrator name
+        timestep: Physics timestep in seconds (must divide ``trace.control_dt``)
+        window: Control steps per re-sync window; 0 replays open loop
+        starts: States to restore at each window start, keyed by control step
+            (from a reference rollout). Without them, the rollout records its
+            own state at every window start.
+            A window boundary is sampled before the restore, so each sample
+            holds the error accumulated since the window started.
+    """
+    if not divides(timestep, trace.control_dt):
+        raise ValueError(
+            f"timestep {timestep} does not divide control_dt {trace.control_dt}"
+        )
+    n_substeps = int(round(trace.control_dt / timestep))
+
+    model, data = make_quadcopter_model(params, timestep=timestep, integrator=integrator)
+    quad = Quadcopter(model, data, params=params, start_position=trace.start_position)
+    quad.reset()
+
+    steps = len(trace.actions)
+    positions = np.empty((steps + 1, 3))
+    orientations = np.empty((steps + 1, 4))
+    positions[0] = data.qpos[:3]
+    orientations[0] = data.qpos[3:7]
+    snapshots: dict[int, QuadcopterSnapshot] = {}
+    first_contact = steps
+
+    elapsed = 0.0
+    for k, action in enumerate(trace.actions):
+        if window and k % window == 0:
+            if starts is None:
+                snapshots[k] = quad.snapshot()
+            else:
+                quad.restore(starts[k])
+        start = time.perf_counter()
+        for _ in range(n_substeps):
+            quad.apply_action(action, timestep)
+            mujoco.mj_step(model, data)
+            quad.invalidate_kinematics()
+            if data.ncon and first_contact == steps:
+                first_contact = k
+        elapsed += time.perf_counter() - start
+        positions[k + 1] = data.qpos[:3]
+        orientations[k + 1] = data.qpos[3:7]
+    return Rollout(positions, orientations, snapshots, first_contact, elapsed)
+
+
+def attitude_error(
+    quat: NDArray[np.float64], reference: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Rotation angle (radians) between two (T, 4) quaternion sequences."""
+    dot = np.abs(np.sum(quat * reference, axis=1))
+    return 2.0 * np.arccos(np.clip(dot, 0.0, 1.0))
+
+
+def run_benchmark(
+    traces: list[ActionTrace],
+    integrators: tuple[str, ...] | list[str] = DEFAULT_INTEGRATORS,
+    timesteps: tuple[float, ...] | list[float] = DEFAULT_TIMESTEPS,
+    horizons: tuple[float, ...] | list[float] = DEFAULT_HORIZONS,
+    reference_dt: float = 0.0002,
+    max_pos_error: float = 0.05,
+    max_att_error_deg: float = 2.0,
+    params: QuadcopterParams | None = None,
+) -> list[BenchmarkResult]:
+    """Benchmark every integrator/timestep combination on every trace.
+
+    Each combination runs once per horizon, re-synced to the reference state
+    at the start of every window (see ``simulate``), so errors measure the
+    divergence accumulated within one horizon rather than chaotic drift.
+
+    Args:
+        traces: Action traces to replay
+        integrators: MuJoCo integrator names
+        timesteps: Physics timesteps in seconds (must divide each control_dt)
+        horizons: Re-sync windows in seconds (multiples of each control_dt);
+            0 replays the whole trace open loop
+        reference_dt: Timestep of the RK4 reference run
+        max_pos_error: Max position divergence (m) within a horizon for a
+            setting to be acceptable
+        max_att_error_deg: Max attitude divergence (deg) within a horizon to
+            be acceptable
+        params: Physical parameters; defaults to the loaded config
+    """
+    params = params or quadcopter_params_from_config()
+    results = []
+    for trace in traces:
+        # The reference records its state at every control step to re-sync from
+        reference = simulate(trace, params, "RK4", reference_dt, window=1)
+        ref_pos = reference.positions
+
+        # Only compare while the reference is airborne, finite and contact-free
+        airborne = (ref_pos[:, 2] > MIN_REFERENCE_ALTITUDE) & np.isfinite(ref_pos).all(1)
+        valid = int(np.argmin(airborne)) if not airborne.all() else len(airborne)
+        valid = min(valid, reference.first_contact)
+        compared_seconds = max(valid - 1, 0) * trace.control_dt
+
+        for horizon in horizons:
+            window = window_steps(horizon, trace.control_dt)
+            for integrator in integrators:
+                for timestep in timesteps:
+                    if not divides(timestep, trace.control_dt):
+                        print(
+                            f"[Bench] Skipping dt={timestep:g} for {trace.name}: "
+                            f"does not divide control_dt={trace.control_dt:g}"
+                        )
+                        continue
+                    rollout = simulate(
+                        trace, params, integrator, timestep, window, reference.snapshots
+                    )
+                    results.append(
+                        _compare(
+                            trace,
+                            integrator,
+                            timestep,
+                            horizon,
+                            rollout,
+                            reference,
+                            valid,
+                            compared_seconds,
+                            max_pos_error,
+                            max_att_error_deg,
+                        )
+                    )
+    return results
+
+
+def _compare(
+    trace: ActionTrace,
+    integrator: str,
+    timestep: float,
+    horizon: float,
+    rollout: Rollout,
+    reference: Rollout,
+    valid: int,
+    compared_seconds: float,
+    max_pos_error: float,
+    max_att_error_deg: float,
+) -> BenchmarkResult:
+    """Score one rollout against the reference over its first ``valid`` samples."""
+    pos_err = np.linalg.norm(
+        rollout.positions[:valid] - reference.positions[:valid], axis=1
+    )
+    att_err = np.degrees(
+        attitude_error(rollout.orientations[:valid], reference.orientations[:valid])
+    )
+    if not (np.isfinite(pos_err).all() and np.isfinite(att_err).all()):
+        pos_err = np.full(1, np.inf)
+        att_err = np.full(1, np.inf)
+    if valid == 0:
+        pos_err = att_err = np.zeros(1)
+
+    elapsed = rollout.elapsed
+    ticks = len(trace.actions) * int(round(trace.control_dt / timestep))
+    result = BenchmarkResult(
+        trace=trace.name,
+        integrator=integrator,
+        timestep=timestep,
+        horizon=horizon,
+        steps_per_sec=ticks / elapsed,
+        realtime_factor=trace.duration / elapsed,
+        compared_seconds=compared_seconds,
+        pos_err_max=float(pos_err.max()),
+        pos_err_rms=float(np.sqrt(np.mean(pos_err**2))),
+        att_err_max_deg=float(att_err.max()),
+        att_err_rms_deg=float(np.sqrt(np.mean(att_err**2))),
+        acceptable=bool(
+            pos_err.max() <= max_pos_error and att_err.max() <= max_att_error_deg
+        ),
+    )
+    print(
+        f"[Bench] {trace.name:>16} {integrator:>12} dt={timestep:<7g} "
+        f"h={_horizon_label(horizon):<6} "
+        f"{result.steps_per_sec:>10.0f} steps/s "
+        f"x{result.realtime_factor:>7.1f} realtime  "
+        f"pos {result.pos_err_max:.2e} m  att {result.att_err_max_deg:.2e} deg"
+    )
+    return result
+
+
+def _horizon_label(horizon: float) -> str:
+    return f"{horizon:g}s" if horizon > 0 else "open"
+
+
+def fastest_acceptable(
+    results: list[BenchmarkResult],
+) -> dict[str, dict[str, dict[str, object]]]:
+    """Fastest acceptable setting (by realtime factor) per horizon and trace.
+
+    Keyed by horizon label ("0.5s", or "open" for open-loop replays), then by
+    trace name. The ``"all_traces"`` entry only considers settings acceptable
+    on every trace they ran on, ranked by their slowest realtime factor.
+    """
+    by_horizon: dict[float, list[BenchmarkResult]] = {}
+    for result in results:
+        by_horizon.setdefault(result.horizon, []).append(result)
+    return {
+        _horizon_label(horizon): _fastest_per_trace(rows)
+        for horizon, rows in by_horizon.items()
+    }
+
+
+def _fastest_per_trace(results: list[BenchmarkResult]) -> dict[str, dict[str, object]]:
+    """Fastest acceptable setting per trace and overall, for one horizon."""
+    best: dict[str, dict[str, object]] = {}
+    settings: dict[tuple[str, float], list[BenchmarkResult]] = {}
+    for result in results:
+        settings.setdefault((result.integrator, result.timestep), []).append(result)
+        if not result.acceptable:
+            continue
+        current = best.get(result.trace)
+        if current is None or result.realtime_factor > current["realtime_factor"]:
+            best[result.trace] = {
+                "integrator": result.integrator,
+                "timestep": result.timestep,
+                "realtime_factor": result.realtime_factor,
+            }
+
+    candidates = [
+        (min(r.realtime_factor for r in rows), key)
+        for key, rows in settings.items()
+        if all(r.acceptable for r in rows)
+    ]
+    if candidates:
+        speed, (integrator, timestep) = max(candidates)
+        best["all_traces"] = {
+            "integrator": integrator,
+            "timestep": timestep,
+            "realtime_factor": speed,
+        }
+    return best
+
+
+def write_results(
+    results: list[BenchmarkResult],
+    json_path: Path | None = None,
+    csv_path: Path | None = None,
+) -> None:
+    """Write the results table as JSON and/or CSV."""
+    rows = [asdict(result) for result in results]
+    if json_path is not None:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "mujoco_version": mujoco.__version__,
+            "results": rows,
+            "fastest_acceptable": fastest_acceptable(results),
+        }
+        json_path.write_text(json.dumps(payload, indent=2))
+        print(f"[Bench] Wrote {json_path}")
+    if csv_path is not None and rows:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[Bench] Wrote {csv_path}")
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark MuJoCo integrators")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="cfg_default.yaml",
+        help="Path to YAML config file",
+    )
+    parser.add_argument(
+        "--integrators", nargs="+", default=list(DEFAULT_INTEGRATORS)
+    )
+    parser.add_argument(
+        "--timesteps", nargs="+", type=float, default=list(DEFAULT_TIMESTEPS)
+    )
+    parser.add_argument(
+        "--horizons",
+        nargs="+",
+        type=float,
+        default=list(DEFAULT_HORIZONS),
+        help="Seconds between re-syncs to the reference (0: open loop)",
+    )
+    parser.add_argument(
+        "--reference-dt",
+        type=float,
+        default=0.0002,
+        help="RK4 timestep of the reference trajectory",
+    )
+    parser.add_argument(
+        "--seeds", nargs="*", type=int, default=[0], help="Random trace seeds"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Random trace length (s)"
+    )
+    parser.add_argument(
+        "--control-dt",
+        type=float,
+        default=0.02,
+        help="Hold time of random trace actions (s)",
+    )
+    parser.add_argument(
+        "--policy",
+        type=str,
+        default=None,
+        help="Model directory to record a policy trace from",
+    )
+    parser.add_argument(
+        "--trace",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Saved .npz traces to replay",
+    )
+    parser.add_argument(
+        "--save-trace",
+        type=str,
+        default=None,
+        help="Directory to save the generated traces",
+    )
+    parser.add_argument("--max-pos-error", type=float, default=0.05)
+    parser.add_argument("--max-att-error-deg", type=float, default=2.0)
+    parser.add_argument("--output", type=str, default=None, help="JSON output path")
+    parser.add_argument("--csv", type=str, default=None, help="CSV output path")
+
+    args = parser.parse_args()
+    Config.load(args.config)
+    params = quadcopter_params_from_config()
+
+    traces = [
+        random_trace(seed, params, args.duration, args.control_dt)
+        for seed in args.seeds
+    ]
+    if args.policy is not None:
+        traces.append(record_policy_trace(args.policy))
+    traces.extend(ActionTrace.load(path) for path in args.trace)
+    if not traces:
+        parser.error("no traces: pass --seeds, --policy or --trace")
+
+    if args.save_trace is not None:
+        trace_dir = Path(args.save_trace)
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        for trace in traces:
+            trace.save(trace_dir / f"{trace.name}.npz")
+
+    results = run_benchmark(
+        traces,
+        integrators=args.integrators,
+        timesteps=args.timesteps,
+        horizons=args.horizons,
+        reference_dt=args.reference_dt,
+        max_pos_error=args.max_pos_error,
+        max_att_error_deg=args.max_att_error_deg,
+        params=params,
+    )
+    write_results(
+        results,
+        json_path=Path(args.output) if args.output else None,
+        csv_path=Path(args.csv) if args.csv else None,
+    )
+    for horizon, best in fastest_acceptable(results).items():
+        for label, setting in best.items():
+            print(f"[Bench] Fastest acceptable ({horizon}, {label}): {setting}")
+
+
+if __name__ == "__main__":
+    main()
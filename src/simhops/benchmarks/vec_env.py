@@ -0,0 +1,316 @@
+"""Vectorized env throughput benchmark.
+
+Steps ``QuadcopterEnv`` workers with random actions through each VecEnv
+backend and reports env steps per second and per-step latency, so the
+pipe-based ``SubprocVecEnv`` can be compared with ``SharedMemoryVecEnv`` (and
+the in-process ``DummyVecEnv`` baseline) at several env counts and
+``SharedMemoryVecEnv`` group sizes (envs per worker process). The ``async``
+backend drives ``SharedMemoryVecEnv`` through ``send``/``recv`` with partial
+batches (``--async-batch-size``), as ``AsyncPPO`` does. Envs are
+built like the trainer builds them (observation buffer reuse, configured
+``info_mode``), so the numbers reflect the training setup.
+
+Usage:
+    python -m simhops.benchmarks.vec_env --n-envs 4 8 16 --steps 2000
+    python -m simhops.benchmarks.vec_env --n-envs 64 --envs-per-worker 1 4 16
+    python -m simhops.benchmarks.vec_env --backends shared_memory async \
+        --n-envs 16 --async-batch-size 8
+    python -m simhops.benchmarks.vec_env --backends subproc shared_memory \\
+        --info-mode full --output vec_env.json --csv vec_env.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+from stable_baselines3.common.vec_env import DummyVecEnv, SubprocVecEnv, VecEnv
+
+from simhops.config import Config
+from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+
+DEFAULT_BACKENDS = ("subproc", "shared_memory")
+BACKENDS = ("dummy", "subproc", "shared_memory", "async")
+
+
+@dataclass
+class VecEnvBenchmarkResult:
+    """Throughput of one backend at one worker count.
+
+    Attributes:
+        backend: VecEnv backend name
+        n_envs: Number of envs
+        envs_per_worker: Envs per worker process (``SharedMemoryVecEnv`` only)
+        steps: Timed vectorized steps
+        env_steps_per_sec: Single-env steps per wall-clock second
+        step_latency_ms: Mean wall time of one vectorized step
+        speedup: Throughput relative to ``subproc`` at the same ``n_envs``
+    """
+
+    backend: str
+    n_envs: int
+    envs_per_worker: int
+    steps: int
+    env_steps_per_sec: float
+    step_latency_ms: float
+    speedup: float | None = None
+
+
+def make_env(config_path: str | None, info_mode: str | None) -> QuadcopterEnv:
+    """Build one benchmark env, loading the config in worker processes."""
+    if config_path is not None and Config.path() != Path(config_path):
+        Config.load(config_path)
+    return QuadcopterEnv(
+        render_mode=None, info_mode=info_mode, copy_observations=False
+    )
+
+
+def make_backend(
+    backend: str,
+    n_envs: int,
+    config_path: str | None = None,
+    info_mode: str | None = None,
+    envs_per_worker: int = 1,
+    async_batch_size: int | None = None,
+) -> VecEnv:
+    """Create a ``QuadcopterEnv`` VecEnv for ``backend``."""
+    env_fns = [partial(make_env, config_path, info_mode) for _ in range(n_envs)]
+    if backend == "dummy":
+        return DummyVecEnv(env_fns)  # type: ignore[arg-type]
+    if backend == "subproc":
+        return SubprocVecEnv(env_fns)  # type: ignore[arg-type]
+    if backend in ("shared_memory", "async"):
+        return SharedMemoryVecEnv(
+            env_fns,  # type: ignore[arg-type]
+            envs_per_worker=envs_per_worker,
+            batch_size=async_batch_size if backend == "async" else None,
+        )
+    raise ValueError(f"Unknown backend {backend!r}; expected one of {BACKENDS}")
+
+
+def time_backend(
+    backend: str,
+    n_envs: int,
+    steps: int,
+    warmup: int = 100,
+    seed: int = 0,
+    config_path: str | None = None,
+    info_mode: str | None = None,
+    envs_per_worker: int = 1,
+    async_batch_size: int | None = None,
+) -> VecEnvBenchmarkResult:
+    """Time ``steps`` random-action steps of one backend (after ``warmup``).
+
+    For ``async`` every env takes ``steps`` steps at its own pace.
+    """
+    vec_env = make_backend(
+        backend, n_envs, config_path, info_mode, envs_per_worker, async_batch_size
+    )
+    try:
+        vec_env.seed(seed)
+        vec_env.reset()
+        rng = np.random.default_rng(seed)
+        low, high = vec_env.action_space.low, vec_env.action_space.high
+        actions = rng.uniform(low, high, size=(warmup + steps, n_envs, *low.shape))
+        actions = actions.astype(vec_env.action_space.dtype)
+
+        if isinstance(vec_env, SharedMemoryVecEnv) and backend == "async":
+            run_async(vec_env, actions[:warmup])
+            start = time.perf_counter()
+            run_async(vec_env, actions[warmup:])
+        else:
+            for action in actions[:warmup]:
+                vec_env.step(action)
+            start = time.perf_counter()
+            for action in actions[warmup:]:
+                vec_env.step(action)
+        elapsed = time.perf_counter() - start
+    finally:
+        vec_env.close()
+
+    pooled = backend in ("shared_memory", "async")
+    result = VecEnvBenchmarkResult(
+        backend=backend,
+        n_envs=n_envs,
+        envs_per_worker=envs_per_worker if pooled else 1,
+        steps=steps,
+        env_steps_per_sec=steps * n_envs / elapsed,
+        step_latency_ms=1000.0 * elapsed / steps,
+    )
+    print(
+        f"[Bench] {backend:>14} n_envs={n_envs:<4d} "
+        f"per_worker={result.envs_per_worker:<3d} "
+        f"{result.env_steps_per_sec:>10.0f} env steps/s "
+        f"{result.step_latency_ms:>8.3f} ms/step"
+    )
+    return result
+
+
+def run_async(pool: SharedMemoryVecEnv, actions: np.ndarray) -> None:
+    """Step every env through ``actions`` (T, n_envs, ...) via send/recv."""
+    n_steps = len(actions)
+    taken = np.zeros(pool.num_envs, dtype=np.intp)
+    env_ids = np.arange(pool.num_envs)
+    pool.send(actions[0], env_ids)
+    in_flight = pool.num_envs
+    while in_flight:
+        env_ids = pool.recv()[4]
+        in_flight -= len(env_ids)
+        taken[env_ids] += 1
+        env_ids = env_ids[taken[env_ids] < n_steps]
+        if env_ids.size:
+            pool.send(actions[taken[env_ids], env_ids], env_ids)
+            in_flight += env_ids.size
+
+
+def run_benchmark(
+    backends: tuple[str, ...] | list[str] = DEFAULT_BACKENDS,
+    n_envs_list: tuple[int, ...] | list[int] = (4, 8),
+    steps: int = 2000,
+    warmup: int = 100,
+    seed: int = 0,
+    config_path: str | None = None,
+    info_mode: str | None = None,
+    envs_per_worker_list: tuple[int, ...] | list[int] = (1,),
+    async_batch_size: int | None = None,
+) -> list[VecEnvBenchmarkResult]:
+    """Benchmark every backend at every worker count.
+
+    Args:
+        backends: Backend names from ``BACKENDS``
+        n_envs_list: Worker counts
+        steps: Timed vectorized steps per run
+        warmup: Untimed steps before timing (process start-up, caches)
+        seed: Seed for the envs and the random actions
+        config_path: YAML config loaded by every env (including workers)
+        info_mode: ``env.info_mode`` override; the config value when None
+        envs_per_worker_list: Group sizes tried for ``shared_memory``/``async``
+        async_batch_size: ``recv`` batch size of ``async``; half the envs
+            when None
+    """
+    results = []
+    for n_envs in n_envs_list:
+        runs = []
+        for backend in backends:
+            pooled = backend in ("shared_memory", "async")
+            group_sizes = envs_per_worker_list if pooled else [1]
+            batch_size = async_batch_size or max(1, n_envs // 2)
+            for envs_per_worker in group_sizes:
+                runs.append(
+                    time_backend(
+                        backend,
+                        n_envs,
+                        steps,
+                        warmup,
+                        seed,
+                        config_path,
+                        info_mode,
+                        envs_per_worker,
+                        batch_size if backend == "async" else None,
+                    )
+                )
+        baseline = next((r for r in runs if r.backend == "subproc"), None)
+        if baseline is not None:
+            for result in runs:
+                result.speedup = result.env_steps_per_sec / baseline.env_steps_per_sec
+        results.extend(runs)
+    return results
+
+
+def write_results(
+    results: list[VecEnvBenchmarkResult],
+    json_path: Path | None = None,
+    csv_path: Path | None = None,
+) -> None:
+    """Write the results table as JSON and/or CSV."""
+    rows = [asdict(result) for result in results]
+    if json_path is not None:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps({"results": rows}, indent=2))
+        print(f"[Bench] Wrote {json_path}")
+    if csv_path is not None and rows:
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"[Bench] Wrote {csv_path}")
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark VecEnv backends")
+    parser.add_argument(
+        "--config",
+        type=str,
+        default="cfg_default.yaml",
+        help="Path to YAML config file",
+    )
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=list(DEFAULT_BACKENDS),
+    )
+    parser.add_argument("--n-envs", nargs="+", type=int, default=[4, 8])
+    parser.add_argument(
+        "--envs-per-worker",
+        nargs="+",
+        type=int,
+        default=[1],
+        help="shared_memory/async group sizes to try",
+    )
+    parser.add_argument(
+        "--async-batch-size",
+        type=int,
+        default=None,
+        help="recv batch size of the async backend (default: half the envs)",
+    )
+    parser.add_argument("--steps", type=int, default=2000, help="Timed steps")
+    parser.add_argument("--warmup", type=int, default=100, help="Untimed steps")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--info-mode",
+        type=str,
+        default=None,
+        help="env.info_mode override (full, episode_end, none)",
+    )
+    parser.add_argument("--output", type=str, default=None, help="JSON output path")
+    parser.add_argument("--csv", type=str, default=None, help="CSV output path")
+
+    args = parser.parse_args()
+    Config.load(args.config)
+
+    results = run_benchmark(
+        backends=args.backends,
+        n_envs_list=args.n_envs,
+        steps=args.steps,
+        warmup=args.warmup,
+        seed=args.seed,
+        config_path=args.config,
+        info_mode=args.info_mode,
+        envs_per_worker_list=args.envs_per_worker,
+        async_batch_size=args.async_batch_size,
+    )
+    write_results(
+        results,
+        json_path=Path(args.output) if args.output else None,
+        csv_path=Path(args.csv) if args.csv else None,
+    )
+    for result in results:
+        if result.speedup is not None and result.backend != "subproc":
+            print(
+                f"[Bench] {result.backend} (x{result.envs_per_worker} per worker) "
+                f"vs subproc at n_envs={result.n_envs}: x{result.speedup:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,12 @@ class TrainingConfig:
     n_envs: int = 8
     seed: int = 42
     resume_from: str | None = None
+    resume_vecnormalize: str | None = None
     use_rerun: bool = False
     device: str = "auto"
+    vec_env: str = "subproc"
+    envs_per_worker: int = 1
+    async_batch_size: int | None = None
 
 
 @dataclass
@@ -30,6 +34,8 @@ class CurriculumStageConfig:
     action_scale: float | None = None
     random_start_position: bool | None = None
     start_position_noise: float | None = None
+    vecnormalize_decay: float | None = None
+    vecnormalize_reset: str | None = None
 
 
 @dataclass
@@ -66,6 +72,8 @@ class VecNormalizeConfig:
     clip_obs: float = 10.0
     clip_reward: float = 10.0
     eval_norm_reward: bool = False
+    stage_decay: float = 1.0
+    stage_reset: str = "none"
 
 
 @dataclass
@@ -89,7 +97,17 @@ class EnvConfig:
     speed_normalization: float = 5.0
     bounds_margin: float = 5.0
     ground_threshold: float = 0.05
-    timestep: float = 0.01
+    physics_dt: float = 0.01
+    control_dt: float | None = None
+    integrator: str = "RK4"
+    model_cache_dir: str | None = None
+    reset_pool_size: int = 0
+    course_bank_size: int = 0
+    course_bank_seed: int = 0
+    course_bank_dir: str | None = None
+    course_file: str | None = None
+    dtype: str = "float64"
+    info_mode: str = "episode_end"
 
 
 @dataclass
@@ -116,6 +134,7 @@ class QuadcopterConfig:
     inertia: tuple[float, float, float] = (0.0023, 0.0023, 0.004)
     drag_coeff: float = 0.01
     motor_time_constant: float = 0.02
+    frame: str = "+"
 
 
 @dataclass
@@ -128,6 +147,14 @@ class SensorConfig:
     gyro_bias_time_constant: float = 100.0
     position_noise_std: float = 0.01
     velocity_noise_std: float = 0.05
+    position_rate: float = 0.0
+    velocity_rate: float = 0.0
+    orientation_rate: float = 0.0
+    imu_rate: float = 0.0
+    position_delay: float = 0.0
+    velocity_delay: float = 0.0
+    orientation_delay: float = 0.0
+    imu_delay: float = 0.0
 
 
 @dataclass
@@ -140,6 +167,11 @@ class CallbackConfig:
     summary_update_freq: int = 10
     eval_checkpoint_enabled: bool = True
     eval_checkpoint_episodes: int = 1
+    eval_checkpoint_workers: int = 1
+    eval_checkpoint_max_backlog: int = 2
+    async_eval: bool = False
+    async_eval_workers: int = 2
+    async_eval_max_pending: int = 2
 
 
 @dataclass
@@ -208,6 +240,21 @@ def deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any
     return base
 
 
+def _env_data(env_data: dict[str, Any]) -> dict[str, Any]:
+    """Map legacy env keys (``timestep`` is now ``physics_dt``)."""
+    env_data = dict(env_data)
+    if "timestep" in env_data:
+        env_data["physics_dt"] = env_data.pop("timestep")
+    return env_data
+
+
+def _callback_data(callback_data: dict[str, Any]) -> dict[str, Any]:
+    """Drop removed callback keys (``eval_checkpoint_model_cache``)."""
+    callback_data = dict(callback_data)
+    callback_data.pop("eval_checkpoint_model_cache", None)
+    return callback_data
+
+
 def build_config(data: dict[str, Any]) -> SimHopsConfig:
     curriculum_data = data.get("curriculum", {})
     stages_data = curriculum_data.get("stages", [])
@@ -233,7 +280,7 @@ def build_config(data: dict[str, Any]) -> SimHopsConfig:
             net_arch=NetArchConfig(**data["ppo"]["net_arch"]),
         ),
         vecnormalize=VecNormalizeConfig(**data["vecnormalize"]),
-        env=EnvConfig(**data["env"]),
+        env=EnvConfig(**_env_data(data["env"])),
         reward=RewardConfig(**data["reward"]),
         quadcopter=QuadcopterConfig(
             mass=data["quadcopter"]["mass"],
@@ -242,9 +289,10 @@ def build_config(data: dict[str, Any]) -> SimHopsConfig:
             inertia=tuple(data["quadcopter"]["inertia"]),
             drag_coeff=data["quadcopter"]["drag_coeff"],
             motor_time_constant=data["quadcopter"]["motor_time_constant"],
+            frame=data["quadcopter"]["frame"],
         ),
         sensor=SensorConfig(**data["sensor"]),
-        callbacks=CallbackConfig(**data["callbacks"]),
+        callbacks=CallbackConfig(**_callback_data(data["callbacks"])),
         evaluation=EvaluationConfig(
             realtime=data["evaluation"]["realtime"],
             slow_motion=data["evaluation"]["slow_motion"],
@@ -1,13 +1,19 @@
 """Core simulation components."""
 
+from simhops.core.batched import BatchedQuadcopter
+from simhops.core.frame import FrameGeometry
+from simhops.core.model_factory import make_quadcopter_model
 from simhops.core.quadcopter import Quadcopter, QuadcopterParams, QuadcopterState
 from simhops.core.sensors import SensorModel, SensorNoiseParams, SensorReadings
 
 __all__ = [
+    "BatchedQuadcopter",
+    "FrameGeometry",
     "Quadcopter",
     "QuadcopterParams",
     "QuadcopterState",
     "SensorModel",
     "SensorNoiseParams",
     "SensorReadings",
+    "make_quadcopter_model",
 ]
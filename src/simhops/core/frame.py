@@ -0,0 +1,147 @@
+"""Multirotor frame geometry: motor layout, mixer and wrench allocation."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from simhops.core.quadcopter import QuadcopterParams
+
+
+GRAVITY = 9.81
+
+# Mixer gains (fraction of full motor speed per unit command)
+THROTTLE_MIX = 0.5
+ROLL_MIX = 0.3
+PITCH_MIX = 0.3
+YAW_MIX = 0.2
+
+# Motor speed at zero throttle command (throttle in [-1, 1] maps to [0, 1])
+MIXER_OFFSET = 0.5
+
+MOTOR_COUNTS: dict[str, int] = {"+": 4, "x": 4, "hex": 6}
+
+
+def frame_layout(frame: str) -> str:
+    """Canonical layout name for ``frame``; names are case-insensitive ("X" is "x").
+
+    Raises:
+        ValueError: If ``frame`` names no known layout
+    """
+    layout = frame.lower()
+    if layout not in MOTOR_COUNTS:
+        raise ValueError(
+            f"Unknown frame layout {frame!r}; expected one of {sorted(MOTOR_COUNTS)}"
+        )
+    return layout
+
+
+def _layout(frame: str) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Unit arm directions (N, 2) and spin directions (N,) for a frame.
+
+    Spin direction +1 is CW, -1 is CCW (sign of the reactive yaw torque).
+    """
+    frame = frame_layout(frame)
+    if frame == "+":
+        # Motor 0: +X (front), 1: -X (back), 2: +Y (left), 3: -Y (right)
+        directions = np.array([[1.0, 0.0], [-1.0, 0.0], [0.0, 1.0], [0.0, -1.0]])
+        spins = np.array([1.0, 1.0, -1.0, -1.0])
+    elif frame == "x":
+        # Motors around the ring from front-left, diagonal pairs spin together
+        s = math.sqrt(0.5)
+        directions = np.array([[s, s], [-s, s], [-s, -s], [s, -s]])
+        spins = np.array([1.0, -1.0, 1.0, -1.0])
+    else:
+        # "hex": motor 0 at +X, counter-clockwise every 60 degrees, alternating spin
+        angles = np.arange(6) * (math.pi / 3.0)
+        directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+        directions[np.abs(directions) < 1e-12] = 0.0
+        spins = np.array([1.0, -1.0, 1.0, -1.0, 1.0, -1.0])
+    return directions, spins
+
+
+class FrameGeometry:
+    """Precomputed mixer and allocation matrices for one ``QuadcopterParams``.
+
+    Attributes:
+        num_motors: Number of motors N
+        motor_positions: (N, 3) motor positions in the body frame
+        spin_directions: (N,) +1 for CW, -1 for CCW
+        mixer: (N, 4) motor target = MIXER_OFFSET + mixer @ [throttle, roll, pitch, yaw]
+        allocation: (6, N) body-frame wrench [fx, fy, fz, tx, ty, tz] per unit
+            normalized motor speed
+    """
+
+    def __init__(self, params: QuadcopterParams) -> None:
+        self.frame = frame_layout(params.frame)
+        directions, spins = _layout(self.frame)
+        self.num_motors = len(spins)
+        self.spin_directions = spins
+
+        arm = params.arm_length
+        self.motor_positions = np.zeros((self.num_motors, 3))
+        self.motor_positions[:, :2] = directions * arm
+
+        # Roll/pitch columns are normalized so the outermost motors get the full
+        # mix gain; this reproduces the original "+" mixer exactly.
+        x = directions[:, 0]
+        y = directions[:, 1]
+        self.mixer = np.zeros((self.num_motors, 4))
+        self.mixer[:, 0] = THROTTLE_MIX
+        self.mixer[:, 1] = -y / np.max(np.abs(y)) * ROLL_MIX
+        self.mixer[:, 2] = -x / np.max(np.abs(x)) * PITCH_MIX
+        self.mixer[:, 3] = spins * YAW_MIX
+
+        max_thrust = params.max_thrust_per_motor
+        self.allocation = np.zeros((6, self.num_motors))
+        self.allocation[2] = max_thrust
+        self.allocation[3] = self.motor_positions[:, 1] * max_thrust
+        self.allocation[4] = -self.motor_positions[:, 0] * max_thrust
+        self.allocation[5] = spins * params.torque_to_thrust * max_thrust
+
+        # Inverse maps: [fz, tx, ty, tz] -> motor speeds, motor speeds -> action
+        self.allocation_pinv = np.linalg.pinv(self.allocation[2:])
+        self.mixer_pinv = np.linalg.pinv(self.mixer)
+
+        self._mass = params.mass
+
+    def motor_targets(self, action: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Mix a clipped [throttle, roll, pitch, yaw] action to motor speeds in [0, 1]."""
+        return np.clip(MIXER_OFFSET + self.mixer @ action, 0.0, 1.0)
+
+    def body_wrench(self, motor_speeds: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Body-frame wrench [fx, fy, fz, tx, ty, tz] for normalized motor speeds."""
+        return self.allocation @ motor_speeds
+
+    def motor_speeds_for_wrench(
+        self, thrust: float, torque: NDArray[np.float64] | None = None
+    ) -> NDArray[np.float64]:
+        """Motor speeds producing a body thrust (N) and torque (N*m).
+
+        Exact for four motors, minimum-norm for hex. Results are not clipped,
+        so values outside [0, 1] mean the wrench is not achievable.
+        """
+        wrench = np.zeros(4)
+        wrench[0] = thrust
+        if torque is not None:
+            wrench[1:] = torque
+        return self.allocation_pinv @ wrench
+
+    def action_for_motor_speeds(
+        self, motor_speeds: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Least-squares [throttle, roll, pitch, yaw] command for motor speeds."""
+        return self.mixer_pinv @ (motor_speeds - MIXER_OFFSET)
+
+    def hover_motor_speeds(self) -> NDArray[np.float64]:
+        """Motor speeds that balance gravity with zero torque."""
+        return self.motor_speeds_for_wrench(self._mass * GRAVITY)
+
+    def hover_action(self) -> NDArray[np.float64]:
+        """Unscaled action that holds hover (throttle only, zero rates)."""
+        return self.action_for_motor_speeds(self.hover_motor_speeds())
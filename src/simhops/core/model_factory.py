@@ -0,0 +1,110 @@
+"""Compiled MuJoCo model cache for quadcopter worlds.
+
+Models are generated from ``QuadcopterParams`` plus the physics options
+(timestep, integrator) and compiled once per unique XML. Compiled models are
+kept in an in-process LRU and, when a cache directory is given, saved as
+``.mjb`` binaries so new worker processes load them without parsing XML.
+
+Cache keys are the SHA-256 of the generated XML and the MuJoCo version, so any
+change to params, options or the XML templates produces a new entry.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import mujoco
+
+from simhops.core.quadcopter import QuadcopterParams, build_quadcopter_xml
+from simhops.logging import log
+
+# Compiled models kept per process (domain randomization can create many keys)
+MAX_CACHED_MODELS = 64
+
+_MODEL_CACHE: OrderedDict[str, mujoco.MjModel] = OrderedDict()
+
+
+def model_key(xml: str) -> str:
+    """Content hash identifying a compiled model."""
+    digest = hashlib.sha256()
+    digest.update(mujoco.__version__.encode())
+    digest.update(b"\0")
+    digest.update(xml.encode())
+    return digest.hexdigest()
+
+
+def _load_or_compile(xml: str, key: str, cache_dir: Path | None) -> mujoco.MjModel:
+    """Load the ``.mjb`` for ``key`` from disk, or compile and save it."""
+    if cache_dir is None:
+        return mujoco.MjModel.from_xml_string(xml)
+
+    path = cache_dir / f"{key}.mjb"
+    if path.exists():
+        try:
+            return mujoco.MjModel.from_binary_path(str(path))
+        except Exception as exc:
+            log(f"[ModelCache] Ignoring unreadable {path}: {exc}")
+
+    model = mujoco.MjModel.from_xml_string(xml)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename so concurrent workers never read a
+    # partially written binary
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".mjb.tmp")
+    os.close(fd)
+    try:
+        mujoco.mj_saveModel(model, tmp_name, None)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    return model
+
+
+def compile_model(xml: str, cache_dir: str | Path | None = None) -> mujoco.MjModel:
+    """Compiled model for ``xml``, served from the cache when possible.
+
+    Returns a private copy, so callers may change options on it freely.
+    """
+    key = model_key(xml)
+    model = _MODEL_CACHE.get(key)
+    if model is None:
+        model = _load_or_compile(
+            xml, key, Path(cache_dir) if cache_dir is not None else None
+        )
+        _MODEL_CACHE[key] = model
+        if len(_MODEL_CACHE) > MAX_CACHED_MODELS:
+            _MODEL_CACHE.popitem(last=False)
+    else:
+        _MODEL_CACHE.move_to_end(key)
+    return copy.copy(model)
+
+
+def make_quadcopter_model(
+    params: QuadcopterParams | None = None,
+    num_drones: int = 1,
+    timestep: float = 0.01,
+    integrator: str = "RK4",
+    cache_dir: str | Path | None = None,
+) -> tuple[mujoco.MjModel, mujoco.MjData]:
+    """Cached model and fresh data for ``num_drones`` quadcopters.
+
+    Args:
+        params: Physical parameters (mass, inertia, frame layout)
+        num_drones: Number of drone bodies in the model
+        timestep: Physics timestep in seconds
+        integrator: MuJoCo integrator name ("Euler", "RK4", "implicit", ...)
+        cache_dir: Directory for ``.mjb`` binaries; None keeps the cache in memory
+    """
+    xml = build_quadcopter_xml(num_drones, params, timestep, integrator)
+    model = compile_model(xml, cache_dir)
+    return model, mujoco.MjData(model)
+
+
+def clear_model_cache() -> None:
+    """Drop all in-process compiled models (the disk cache is kept)."""
+    _MODEL_CACHE.clear()
@@ -3,23 +3,71 @@
 from __future__ import annotations
 
 import math
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 import mujoco
 import numpy as np
 
+from simhops.core.frame import MOTOR_COUNTS, FrameGeometry, frame_layout
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
 
-# MuJoCo XML model for quadcopter
-QUADCOPTER_XML = """
-<mujoco model="quadcopter">
+# Per-drone body and sensors. ``{prefix}`` namespaces every element so several
+# drones can share one model; ``{pos}`` is the spawn position. Mass, inertia and
+# the per-motor elements (``QUADCOPTER_MOTOR_XML``) come from QuadcopterParams.
+QUADCOPTER_BODY_XML = """
+    <body name="{prefix}quadcopter" pos="{pos}">
+      <freejoint name="{prefix}root"/>
+      <inertial pos="0 0 0" mass="{mass}" diaginertia="{inertia}"/>
+      
+      <!-- Main body -->
+      <geom name="{prefix}body" type="box" size="0.05 0.05 0.02" material="body"/>
+      
+      <!-- Arms -->
+{arms}
+      <!-- Motor mounts (visual only, mass in inertial) -->
+{motors}
+      <!-- Sites for force application -->
+{sites}
+      <site name="{prefix}body_center" pos="0 0 0" size="0.01"/>
+      
+      <!-- IMU sensor site -->
+      <site name="{prefix}imu_site" pos="0 0 0" size="0.005"/>
+    </body>
+"""
+
+# Arm, motor mount and force site of one motor, keyed by ``{arms}``, ``{motors}``
+# and ``{sites}`` in the body template
+QUADCOPTER_MOTOR_XML = {
+    "arms": '      <geom name="{prefix}arm{index}" type="capsule" fromto="0 0 0 {pos}" size="0.01" rgba="0.4 0.4 0.4 1"/>\n',
+    "motors": '      <geom name="{prefix}motor{index}" type="cylinder" pos="{pos}" size="0.02 0.01" material="{material}"/>\n',
+    "sites": '      <site name="{prefix}motor{index}_site" pos="{site_pos}" size="0.01"/>\n',
+}
+
+QUADCOPTER_SENSOR_XML = """
+    <accelerometer name="{prefix}accel" site="{prefix}imu_site"/>
+    <gyro name="{prefix}gyro" site="{prefix}imu_site"/>
+    <framepos name="{prefix}pos" objtype="site" objname="{prefix}body_center"/>
+    <framequat name="{prefix}quat" objtype="site" objname="{prefix}body_center"/>
+    <framelinvel name="{prefix}linvel" objtype="site" objname="{prefix}body_center"/>
+    <frameangvel name="{prefix}angvel" objtype="site" objname="{prefix}body_center"/>
+"""
+
+# Drone geoms use contype=2/conaffinity=1 and the ground contype=1/conaffinity=1,
+# so drones collide with the ground but never with each other.
+QUADCOPTER_WORLD_XML = """
+<mujoco model="{model_name}">
   <compiler angle="radian"/>
   
-  <option timestep="0.01" gravity="0 0 -9.81" integrator="RK4"/>
+  <option timestep="{timestep}" gravity="0 0 -9.81" integrator="{integrator}"/>
+  
+  <default>
+    <geom contype="2" conaffinity="1"/>
+  </default>
   
   <asset>
     <texture type="skybox" builtin="gradient" rgb1="0.3 0.5 0.7" rgb2="0 0 0" width="512" height="512"/>
@@ -32,46 +80,12 @@ QUADCOPTER_XML = """
   
   <worldbody>
     <light directional="true" diffuse="0.8 0.8 0.8" specular="0.3 0.3 0.3" pos="0 0 5" dir="0 0 -1"/>
-    <geom name="ground" type="plane" size="50 50 0.1" material="grid"/>
-    
-    <body name="quadcopter" pos="0 0 1">
-      <freejoint name="root"/>
-      <inertial pos="0 0 0" mass="0.5" diaginertia="0.0023 0.0023 0.004"/>
-      
-      <!-- Main body -->
-      <geom name="body" type="box" size="0.05 0.05 0.02" material="body"/>
-      
-      <!-- Arms -->
-      <geom name="arm_front" type="capsule" fromto="0 0 0 0.17 0 0" size="0.01" rgba="0.5 0.5 0.5 1"/>
-      <geom name="arm_back" type="capsule" fromto="0 0 0 -0.17 0 0" size="0.01" rgba="0.3 0.3 0.3 1"/>
-      <geom name="arm_left" type="capsule" fromto="0 0 0 0 0.17 0" size="0.01" rgba="0.4 0.4 0.4 1"/>
-      <geom name="arm_right" type="capsule" fromto="0 0 0 0 -0.17 0" size="0.01" rgba="0.4 0.4 0.4 1"/>
-      
-      <!-- Motor mounts (visual only, mass in inertial) -->
-      <geom name="motor0" type="cylinder" pos="0.17 0 0" size="0.02 0.01" material="motor_cw"/>
-      <geom name="motor1" type="cylinder" pos="-0.17 0 0" size="0.02 0.01" material="motor_cw"/>
-      <geom name="motor2" type="cylinder" pos="0 0.17 0" size="0.02 0.01" material="motor_ccw"/>
-      <geom name="motor3" type="cylinder" pos="0 -0.17 0" size="0.02 0.01" material="motor_ccw"/>
-      
-      <!-- Sites for force application -->
-      <site name="motor0_site" pos="0.17 0 0.01" size="0.01"/>
-      <site name="motor1_site" pos="-0.17 0 0.01" size="0.01"/>
-      <site name="motor2_site" pos="0 0.17 0.01" size="0.01"/>
-      <site name="motor3_site" pos="0 -0.17 0.01" size="0.01"/>
-      <site name="body_center" pos="0 0 0" size="0.01"/>
-      
-      <!-- IMU sensor site -->
-      <site name="imu_site" pos="0 0 0" size="0.005"/>
-    </body>
+    <geom name="ground" type="plane" size="50 50 0.1" material="grid" contype="1" conaffinity="1"/>
+    {bodies}
   </worldbody>
   
   <sensor>
-    <accelerometer name="accel" site="imu_site"/>
-    <gyro name="gyro" site="imu_site"/>
-    <framepos name="pos" objtype="site" objname="body_center"/>
-    <framequat name="quat" objtype="site" objname="body_center"/>
-    <framelinvel name="linvel" objtype="site" objname="body_center"/>
-    <frameangvel name="angvel" objtype="site" objname="body_center"/>
+    {sensors}
   </sensor>
   
   <actuator>
@@ -81,6 +95,84 @@ QUADCOPTER_XML = """
 """
 
 
+# Obstacle groups checked by ``Quadcopter.collision_group``: group name -> geom
+# names (exact match or name prefix). Earlier groups win when several are hit.
+DEFAULT_OBSTACLE_GROUPS: dict[str, tuple[str, ...]] = {"ground": ("ground",)}
+
+# ``Quadcopter._geom_group`` value for geoms outside every obstacle group
+NO_GROUP = -1
+
+# MuJoCo state captured by ``Quadcopter.snapshot`` when it owns the whole model:
+# time, qpos, qvel, act, warmstart, ctrl, applied forces, mocap and userdata
+SNAPSHOT_STATE = mujoco.mjtState.mjSTATE_INTEGRATION
+
+
+def drone_prefix(index: int) -> str:
+    """Element name prefix for drone ``index`` in a multi-drone model."""
+    return f"drone{index}_"
+
+
+def _fmt(*values: float) -> str:
+    """Format numbers for MJCF attributes (stable text for cache keys)."""
+    return " ".join(f"{value:.9g}" for value in values)
+
+
+def build_quadcopter_xml(
+    num_drones: int = 1,
+    params: QuadcopterParams | None = None,
+    timestep: float = 0.01,
+    integrator: str = "RK4",
+) -> str:
+    """Build MJCF XML with ``num_drones`` independent quadcopter bodies.
+
+    A single drone keeps the unprefixed element names ("quadcopter", "body",
+    "motor0_site", ...). Multiple drones are namespaced with ``drone_prefix``.
+    Every drone gets the mass, inertia and motor layout of ``params``.
+    """
+    if num_drones < 1:
+        raise ValueError(f"num_drones must be >= 1, got {num_drones}")
+    params = params or QuadcopterParams()
+    frame = FrameGeometry(params)
+
+    prefixes = [""] if num_drones == 1 else [drone_prefix(i) for i in range(num_drones)]
+    bodies = []
+    for prefix in prefixes:
+        motor_fields = [
+            {
+                "prefix": prefix,
+                "index": index,
+                "pos": _fmt(*position),
+                "site_pos": _fmt(position[0], position[1], position[2] + 0.01),
+                "material": "motor_cw" if spin > 0 else "motor_ccw",
+            }
+            for index, (position, spin) in enumerate(
+                zip(frame.motor_positions, frame.spin_directions)
+            )
+        ]
+        elements = {
+            key: "".join(template.format(**fields) for fields in motor_fields)
+            for key, template in QUADCOPTER_MOTOR_XML.items()
+        }
+        bodies.append(
+            QUADCOPTER_BODY_XML.format(
+                prefix=prefix,
+                pos="0 0 1",
+                mass=_fmt(params.mass),
+                inertia=_fmt(*params.inertia),
+                **elements,
+            )
+        )
+    sensors = "".join(QUADCOPTER_SENSOR_XML.format(prefix=prefix) for prefix in prefixes)
+    model_name = "quadcopter" if num_drones == 1 else f"quadcopter_x{num_drones}"
+    return QUADCOPTER_WORLD_XML.format(
+        model_name=model_name,
+        timestep=_fmt(timestep),
+        integrator=integrator,
+        bodies="".join(bodies),
+        sensors=sensors,
+    )
+
+
 @dataclass
 class QuadcopterParams:
     """Physical parameters for the quadcopter."""
@@ -91,11 +183,17 @@ class QuadcopterParams:
     inertia: tuple[float, float, float] = (0.0023, 0.0023, 0.004)  # Ixx, Iyy, Izz
     drag_coeff: float = 0.01  # linear drag coefficient
     motor_time_constant: float = 0.02  # seconds, first-order motor response
+    frame: str = "+"  # motor layout: "+", "x" or "hex" (any case)
+
+    @property
+    def num_motors(self) -> int:
+        """Number of motors for the frame layout."""
+        return MOTOR_COUNTS[frame_layout(self.frame)]
 
     @property
     def max_thrust_per_motor(self) -> float:
         """Maximum thrust per motor in Newtons."""
-        return (self.mass * 9.81 * self.thrust_to_weight) / 4.0
+        return (self.mass * 9.81 * self.thrust_to_weight) / self.num_motors
 
     @property
     def torque_to_thrust(self) -> float:
@@ -103,9 +201,13 @@ class QuadcopterParams:
         return 0.01  # typical value
 
 
-@dataclass
+# MuJoCo XML model for quadcopter
+QUADCOPTER_XML = build_quadcopter_xml()
+
+
+@dataclass(slots=True)
 class QuadcopterState:
-    """Full state of the quadcopter."""
+    """Full state of the quadcopter (owned copies, safe to keep)."""
 
     position: NDArray[np.float64] = field(default_factory=lambda: np.zeros(3))
     velocity: NDArray[np.float64] = field(default_factory=lambda: np.zeros(3))
@@ -118,17 +220,89 @@ class QuadcopterState:
     )  # normalized 0-1
 
 
+@dataclass(slots=True)
+class QuadcopterSnapshot:
+    """Restorable physics and motor-lag state of one drone.
+
+    ``physics`` is the full ``mj_getState`` vector for single-drone models, or
+    the drone's own [qpos (7), qvel (6), xfrc_applied (6)] slices in a shared
+    multi-drone model.
+    """
+
+    physics: NDArray[np.float64]
+    current_motor_speeds: NDArray[np.float64]
+    target_motor_speeds: NDArray[np.float64]
+
+
+class QuadcopterKinematics:
+    """Per-step kinematics of one drone, valid until the next mj_step/reset.
+
+    ``position``, ``velocity``, ``orientation`` and ``angular_velocity`` are
+    read-only views into ``MjData.qpos``/``qvel`` (no copies). ``rotation``,
+    ``body_z`` and ``tilt`` are derived once per step on first access through
+    ``Quadcopter.kinematics``. Copy the arrays to keep them across steps.
+    """
+
+    __slots__ = (
+        "position",
+        "velocity",
+        "orientation",
+        "angular_velocity",
+        "rotation",
+        "body_z",
+        "tilt",
+        "valid",
+        "_rotation_flat",
+    )
+
+    def __init__(
+        self,
+        position: NDArray[np.float64],
+        velocity: NDArray[np.float64],
+        orientation: NDArray[np.float64],
+        angular_velocity: NDArray[np.float64],
+    ) -> None:
+        for view in (position, velocity, orientation, angular_velocity):
+            view.flags.writeable = False
+        self.position = position
+        self.velocity = velocity
+        self.orientation = orientation  # quaternion wxyz
+        self.angular_velocity = angular_velocity  # body frame (free joint qvel)
+        self._rotation_flat = np.zeros(9)
+        self.rotation = self._rotation_flat.reshape(3, 3)
+        self.body_z = self.rotation[:, 2]
+        self.tilt = 0.0
+        self.valid = False
+
+    def refresh(self) -> None:
+        """Recompute the derived quantities from the current orientation."""
+        mujoco.mju_quat2Mat(self._rotation_flat, self.orientation)
+        cos_tilt = min(1.0, max(-1.0, float(self._rotation_flat[8])))
+        self.tilt = math.acos(cos_tilt)
+        self.valid = True
+
+
 class Quadcopter:
     """MuJoCo-based quadcopter simulation.
 
-    The quadcopter uses a "+" configuration:
+    The default "+" configuration:
         Motor 0: +X (front)
         Motor 1: -X (back)
         Motor 2: +Y (left)
         Motor 3: -Y (right)
 
+    ``params.frame`` selects "x" or "hex" layouts instead (see ``FrameGeometry``).
+
     Action space: [throttle, roll_rate, pitch_rate, yaw_rate] in [-1, 1]
-    These are mixed to motor commands using a standard mixer.
+    These are mixed to motor commands using the frame's precomputed mixer.
+
+    ``prefix`` selects one drone in a multi-drone model (see
+    ``build_quadcopter_xml``); state is read from that drone's slices of
+    qpos/qvel and forces go to its row of xfrc_applied.
+
+    ``obstacle_groups`` maps group names to geom names (or name prefixes) that
+    count as collisions; geom ids are resolved once here so contacts are
+    classified with array lookups instead of name comparisons.
     """
 
     def __init__(
@@ -138,6 +312,8 @@ class Quadcopter:
         params: QuadcopterParams | None = None,
         start_position: NDArray[np.float64] | None = None,
         start_orientation: NDArray[np.float64] | None = None,
+        prefix: str = "",
+        obstacle_groups: Mapping[str, Sequence[str]] | None = None,
     ) -> None:
         self.model = model
         self.data = data
@@ -152,26 +328,59 @@ class Quadcopter:
             else np.array([1.0, 0.0, 0.0, 0.0])
         )
 
-        self._motor_positions = self._compute_motor_positions()
-        self._target_motor_speeds = np.zeros(4)
-        self._current_motor_speeds = np.zeros(4)
+        self.frame = FrameGeometry(self.params)
+        self._target_motor_speeds = np.zeros(self.frame.num_motors)
+        self._current_motor_speeds = np.zeros(self.frame.num_motors)
+
+        # Preallocated wrench buffers: [force | torque] columns for one matmul
+        self._wrench = np.zeros(6)
+        self._wrench_pairs = self._wrench.reshape(2, 3).T
+        self._world_wrench = np.zeros((3, 2))
 
         # Get site IDs for force application
         self._motor_site_ids = [
-            mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_SITE, f"motor{i}_site")
-            for i in range(4)
-        ]
-        self._body_id = mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_BODY, "quadcopter")
-
-    def _compute_motor_positions(self) -> list[NDArray[np.float64]]:
-        """Compute motor positions relative to body center."""
-        L = self.params.arm_length
-        return [
-            np.array([L, 0.0, 0.0]),  # front (+X)
-            np.array([-L, 0.0, 0.0]),  # back (-X)
-            np.array([0.0, L, 0.0]),  # left (+Y)
-            np.array([0.0, -L, 0.0]),  # right (-Y)
+            mujoco.mj_name2id(model, mujoco.mjtObj.mjOBJ_SITE, f"{prefix}motor{i}_site")
+            for i in range(self.frame.num_motors)
         ]
+        self._body_id = mujoco.mj_name2id(
+            model, mujoco.mjtObj.mjOBJ_BODY, f"{prefix}quadcopter"
+        )
+        if self._body_id < 0:
+            raise ValueError(f"No quadcopter body with prefix {prefix!r} in model")
+
+        # Free joint slices of this drone in qpos (3 pos + 4 quat) and qvel (6)
+        joint_id = model.body_jntadr[self._body_id]
+        qpos_adr = int(model.jnt_qposadr[joint_id])
+        dof_adr = int(model.jnt_dofadr[joint_id])
+        self._pos_slice = slice(qpos_adr, qpos_adr + 3)
+        self._quat_slice = slice(qpos_adr + 3, qpos_adr + 7)
+        self._linvel_slice = slice(dof_adr, dof_adr + 3)
+        self._angvel_slice = slice(dof_adr + 3, dof_adr + 6)
+        self._dof_slice = slice(dof_adr, dof_adr + 6)
+        # Only a single-drone model may be reset wholesale with mj_resetData
+        self._owns_data = model.njnt == 1
+
+        # qpos/qvel buffers are never reallocated, so the views stay live
+        self._kinematics = QuadcopterKinematics(
+            position=data.qpos[self._pos_slice],
+            velocity=data.qvel[self._linvel_slice],
+            orientation=data.qpos[self._quat_slice],
+            angular_velocity=data.qvel[self._angvel_slice],
+        )
+
+        # Contact classification tables, indexed by geom id
+        groups = DEFAULT_OBSTACLE_GROUPS if obstacle_groups is None else obstacle_groups
+        self.obstacle_groups: tuple[str, ...] = tuple(groups)
+        self._own_geom = model.geom_bodyid == self._body_id
+        self._geom_group = np.full(model.ngeom, NO_GROUP, dtype=np.intp)
+        for geom_id in range(model.ngeom):
+            if self._own_geom[geom_id]:
+                continue
+            name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, geom_id) or ""
+            for group_index, names in enumerate(groups.values()):
+                if any(name.startswith(entry) for entry in names):
+                    self._geom_group[geom_id] = group_index
+                    break
 
     def reset(
         self,
@@ -182,37 +391,85 @@ class Quadcopter:
         pos = position if position is not None else self._start_pos
         orn = orientation if orientation is not None else self._start_orn
 
-        mujoco.mj_resetData(self.model, self.data)
+        if self._owns_data:
+            mujoco.mj_resetData(self.model, self.data)
 
         # Set initial position and orientation (freejoint: 3 pos + 4 quat)
-        self.data.qpos[:3] = pos
-        self.data.qpos[3:7] = orn  # wxyz
+        self.data.qpos[self._pos_slice] = pos
+        self.data.qpos[self._quat_slice] = orn  # wxyz
 
-        # Zero velocities
-        self.data.qvel[:] = 0
+        # Zero velocities and external forces
+        self.data.qvel[self._dof_slice] = 0
+        self.data.xfrc_applied[self._body_id] = 0
 
-        self._current_motor_speeds = np.zeros(4)
-        self._target_motor_speeds = np.zeros(4)
+        self._current_motor_speeds = np.zeros(self.frame.num_motors)
+        self._target_motor_speeds = np.zeros(self.frame.num_motors)
 
         mujoco.mj_forward(self.model, self.data)
+        self.invalidate_kinematics()
 
         return self.get_state()
 
-    def get_state(self) -> QuadcopterState:
-        """Get current quadcopter state."""
-        # Position and orientation from qpos
-        pos = self.data.qpos[:3].copy()
-        orn = self.data.qpos[3:7].copy()  # wxyz
+    def snapshot(self) -> QuadcopterSnapshot:
+        """Capture the state needed to resume this drone exactly."""
+        if self._owns_data:
+            physics = np.empty(mujoco.mj_stateSize(self.model, SNAPSHOT_STATE))
+            mujoco.mj_getState(self.model, self.data, physics, SNAPSHOT_STATE)
+        else:
+            physics = np.concatenate(
+                [
+                    self.data.qpos[self._pos_slice],
+                    self.data.qpos[self._quat_slice],
+                    self.data.qvel[self._dof_slice],
+                    self.data.xfrc_applied[self._body_id],
+                ]
+            )
+        return QuadcopterSnapshot(
+            physics=physics,
+            current_motor_speeds=self._current_motor_speeds.copy(),
+            target_motor_speeds=self._target_motor_speeds.copy(),
+        )
+
+    def restore(self, snapshot: QuadcopterSnapshot) -> None:
+        """Restore a state captured by ``snapshot`` (same model layout)."""
+        if self._owns_data:
+            mujoco.mj_setState(self.model, self.data, snapshot.physics, SNAPSHOT_STATE)
+        else:
+            physics = snapshot.physics
+            self.data.qpos[self._pos_slice] = physics[0:3]
+            self.data.qpos[self._quat_slice] = physics[3:7]
+            self.data.qvel[self._dof_slice] = physics[7:13]
+            self.data.xfrc_applied[self._body_id] = physics[13:19]
+
+        self._current_motor_speeds = snapshot.current_motor_speeds.copy()
+        self._target_motor_speeds = snapshot.target_motor_speeds.copy()
+
+        mujoco.mj_forward(self.model, self.data)
+        self.invalidate_kinematics()
+
+    @property
+    def kinematics(self) -> QuadcopterKinematics:
+        """Cached kinematics for the current physics step."""
+        kinematics = self._kinematics
+        if not kinematics.valid:
+            kinematics.refresh()
+        return kinematics
+
+    def invalidate_kinematics(self) -> None:
+        """Mark the kinematics cache stale; call after every mj_step."""
+        self._kinematics.valid = False
 
-        # Velocities from qvel
-        vel = self.data.qvel[:3].copy()
-        ang_vel = self.data.qvel[3:6].copy()
+    def get_state(self) -> QuadcopterState:
+        """Get a copy of the current quadcopter state.
 
+        Hot paths should read ``kinematics`` instead, which does not copy.
+        """
+        kinematics = self._kinematics
         return QuadcopterState(
-            position=pos,
-            velocity=vel,
-            orientation=orn,
-            angular_velocity=ang_vel,
+            position=kinematics.position.copy(),
+            velocity=kinematics.velocity.copy(),
+            orientation=kinematics.orientation.copy(),  # wxyz
+            angular_velocity=kinematics.angular_velocity.copy(),
             motor_speeds=self._current_motor_speeds.copy(),
         )
 
@@ -223,33 +480,9 @@ class Quadcopter:
             action: [throttle, roll_rate, pitch_rate, yaw_rate] each in [-1, 1]
             dt: timestep in seconds
         """
-        # Clamp action
+        # Clamp action and mix to motor speeds
         action = np.clip(action, -1.0, 1.0)
-        throttle, roll_cmd, pitch_cmd, yaw_cmd = action
-
-        # Mix to motor speeds (+ configuration)
-        base_throttle = (throttle + 1.0) / 2.0
-
-        # Mixer gains
-        roll_mix = 0.3
-        pitch_mix = 0.3
-        yaw_mix = 0.2
-
-        self._target_motor_speeds[0] = (
-            base_throttle - pitch_cmd * pitch_mix + yaw_cmd * yaw_mix
-        )
-        self._target_motor_speeds[1] = (
-            base_throttle + pitch_cmd * pitch_mix + yaw_cmd * yaw_mix
-        )
-        self._target_motor_speeds[2] = (
-            base_throttle - roll_cmd * roll_mix - yaw_cmd * yaw_mix
-        )
-        self._target_motor_speeds[3] = (
-            base_throttle + roll_cmd * roll_mix - yaw_cmd * yaw_mix
-        )
-
-        # Clamp motor speeds
-        self._target_motor_speeds = np.clip(self._target_motor_speeds, 0.0, 1.0)
+        self._target_motor_speeds = self.frame.motor_targets(action)
 
         # First-order motor dynamics
         alpha = dt / (self.params.motor_time_constant + dt)
@@ -261,87 +494,65 @@ class Quadcopter:
         self._apply_motor_forces()
 
     def _apply_motor_forces(self) -> None:
-        """Apply thrust and torque from each motor."""
-        state = self.get_state()
-
-        # Get rotation matrix from quaternion (wxyz)
-        rot_matrix = np.zeros(9)
-        mujoco.mju_quat2Mat(rot_matrix, state.orientation)
-        rot_matrix = rot_matrix.reshape(3, 3)
+        """Apply thrust, thrust torque, reactive torque and drag to the body."""
+        kinematics = self.kinematics
 
-        # Body Z-axis in world frame (thrust direction)
-        body_z = rot_matrix @ np.array([0.0, 0.0, 1.0])
+        # Body-frame wrench from the allocation matrix, rotated to world frame
+        np.matmul(self.frame.allocation, self._current_motor_speeds, out=self._wrench)
+        xfrc = self.data.xfrc_applied[self._body_id]
+        np.matmul(kinematics.rotation, self._wrench_pairs, out=self._world_wrench)
+        xfrc[:3] = self._world_wrench[:, 0]
+        xfrc[3:6] = self._world_wrench[:, 1]
 
-        # Clear external forces
-        self.data.xfrc_applied[self._body_id] = 0
-
-        total_force = np.zeros(3)
-        total_torque = np.zeros(3)
+        # Apply drag
+        xfrc[:3] -= self.params.drag_coeff * kinematics.velocity
 
-        for i, (motor_pos, speed) in enumerate(
-            zip(self._motor_positions, self._current_motor_speeds)
-        ):
-            # Thrust force
-            thrust = speed * self.params.max_thrust_per_motor
-            force = thrust * body_z
-            total_force += force
+    def check_collision(self) -> bool:
+        """Check if the quadcopter has collided with any obstacle group."""
+        return self.collision_group() is not None
 
-            # Torque from thrust at offset position
-            world_motor_pos = rot_matrix @ motor_pos
-            thrust_torque = np.cross(world_motor_pos, force)
-            total_torque += thrust_torque
+    def collision_group(self) -> str | None:
+        """Name of the obstacle group the quadcopter is touching, if any.
 
-            # Reaction torque (yaw) - motors 0,1 spin CW, motors 2,3 spin CCW
-            direction = 1.0 if i < 2 else -1.0
-            reaction_torque = direction * thrust * self.params.torque_to_thrust * body_z
-            total_torque += reaction_torque
+        When several groups are in contact, the one listed first in
+        ``obstacle_groups`` is returned.
+        """
+        ncon = self.data.ncon
+        if ncon == 0:
+            return None
+        contact = self.data.contact
+        geom1 = contact.geom1[:ncon]
+        geom2 = contact.geom2[:ncon]
+        own1 = self._own_geom[geom1]
+        own2 = self._own_geom[geom2]
+
+        # Group of the geom on the other side of each contact involving us
+        other = np.where(own1, geom2, geom1)
+        groups = self._geom_group[other[own1 | own2]]
+        groups = groups[groups != NO_GROUP]
+        if groups.size == 0:
+            return None
+        return self.obstacle_groups[int(groups.min())]
 
-        # Apply drag
-        drag_force = -self.params.drag_coeff * state.velocity
-        total_force += drag_force
+    def get_tilt_angle(self) -> float:
+        """Get the tilt angle from vertical in radians."""
+        return self.kinematics.tilt
 
-        # Apply to body (xfrc_applied: [force, torque])
-        self.data.xfrc_applied[self._body_id, :3] = total_force
-        self.data.xfrc_applied[self._body_id, 3:6] = total_torque
 
-    def check_collision(self) -> bool:
-        """Check if the quadcopter has collided with anything."""
-        for i in range(self.data.ncon):
-            contact = self.data.contact[i]
-            geom1 = self.model.geom(contact.geom1).name
-            geom2 = self.model.geom(contact.geom2).name
-            # Check if either geom belongs to quadcopter and other is ground
-            quad_geoms = {
-                "body",
-                "arm_front",
-                "arm_back",
-                "arm_left",
-                "arm_right",
-                "motor0",
-                "motor1",
-                "motor2",
-                "motor3",
-            }
-            if (geom1 in quad_geoms and geom2 == "ground") or (
-                geom2 in quad_geoms and geom1 == "ground"
-            ):
-                return True
-        return False
+def create_quadcopter_model(
+    num_drones: int = 1,
+    params: QuadcopterParams | None = None,
+) -> tuple[mujoco.MjModel, mujoco.MjData]:
+    """Compile MuJoCo model and data for one or more quadcopters.
 
-    def get_tilt_angle(self) -> float:
-        """Get the tilt angle from vertical in radians."""
-        state = self.get_state()
-        rot_matrix = np.zeros(9)
-        mujoco.mju_quat2Mat(rot_matrix, state.orientation)
-        rot_matrix = rot_matrix.reshape(3, 3)
-        body_z = rot_matrix @ np.array([0.0, 0.0, 1.0])
-        world_z = np.array([0.0, 0.0, 1.0])
-        cos_angle = np.clip(np.dot(body_z, world_z), -1.0, 1.0)
-        return math.acos(cos_angle)
-
-
-def create_quadcopter_model() -> tuple[mujoco.MjModel, mujoco.MjData]:
-    """Create MuJoCo model and data for quadcopter."""
-    model = mujoco.MjModel.from_xml_string(QUADCOPTER_XML)
+    This always parses XML; envs go through ``simhops.core.model_factory``,
+    which caches compiled models.
+    """
+    xml = (
+        QUADCOPTER_XML
+        if num_drones == 1 and params is None
+        else build_quadcopter_xml(num_drones, params)
+    )
+    model = mujoco.MjModel.from_xml_string(xml)
     data = mujoco.MjData(model)
     return model, data
@@ -1,9 +1,25 @@
-"""Sensor simulation with realistic noise models."""
+"""Sensor simulation with realistic noise models.
+
+Readings come from the MuJoCo sensors declared in ``QUADCOPTER_SENSOR_XML``
+(accelerometer, gyro and frame sensors on the drone's sites). MuJoCo evaluates
+sensors at the start of ``mj_step``, before integrating, so the step loops
+call ``refresh_sensordata`` after every ``mj_step``: ``data.sensordata`` then
+describes the state the tick ended in, the same state reward and termination
+are computed from. Contacts are not recomputed, so contact termination sees
+the contacts ``mj_step`` detected at the start of the tick.
+
+Each channel (position, velocity, orientation, IMU) can be sampled at its own
+rate with a transport delay (``SensorNoiseParams.*_rate`` / ``*_delay``). When
+any is set, the model is ticked once per physics step, samples due channels
+into per-channel ring buffers and holds the last delayed sample between them.
+With the defaults every reading is taken from the latest physics tick.
+"""
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import mujoco
 import numpy as np
@@ -11,7 +27,48 @@ import numpy as np
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
-    from simhops.core.quadcopter import QuadcopterState
+
+def refresh_sensordata(model: mujoco.MjModel, data: mujoco.MjData) -> None:
+    """Re-evaluate ``data.sensordata`` at the current ``qpos``/``qvel``.
+
+    Runs the kinematics, velocity and acceleration stages of ``mj_forward``
+    with their sensors but skips collision detection, so ``data.contact`` and
+    the constraint forces stay those of the last ``mj_step``. While nothing
+    touches the drone, the readings equal ``mj_forward``'s.
+    """
+    mujoco.mj_kinematics(model, data)
+    mujoco.mj_comPos(model, data)
+    mujoco.mj_sensorPos(model, data)
+    mujoco.mj_crb(model, data)
+    mujoco.mj_makeM(model, data)
+    mujoco.mj_factorM(model, data)
+    mujoco.mj_forwardSkip(model, data, mujoco.mjtStage.mjSTAGE_POS, 0)
+
+
+# Sensor names (without the drone prefix) in ``SensorReadings.to_array`` order
+SENSOR_NAMES = ("pos", "linvel", "quat", "accel", "gyro")
+
+# Noise is pre-drawn in blocks of NOISE_BLOCK_STEPS readings x NOISE_CHANNELS
+# standard normals: accel bias, gyro bias, position, velocity, accel, gyro (3 each)
+NOISE_BLOCK_STEPS = 4096
+NOISE_CHANNELS = 18
+
+# Independently scheduled channels: reading buffer / sensordata index slice and
+# measurement noise columns (orientation is left noise-free, it comes from
+# sensor fusion)
+SENSOR_CHANNELS = ("position", "velocity", "orientation", "imu")
+CHANNEL_SLICES = {
+    "position": slice(0, 3),
+    "velocity": slice(3, 6),
+    "orientation": slice(6, 10),
+    "imu": slice(10, 16),
+}
+CHANNEL_NOISE = {
+    "position": slice(6, 9),
+    "velocity": slice(9, 12),
+    "orientation": None,
+    "imu": slice(12, 18),
+}
 
 
 @dataclass
@@ -34,6 +91,85 @@ class SensorNoiseParams:
     # Velocity
     velocity_noise_std: float = 0.05  # m/s
 
+    # Sample rates (Hz, 0 = every physics tick) and transport delays (seconds)
+    position_rate: float = 0.0
+    velocity_rate: float = 0.0
+    orientation_rate: float = 0.0
+    imu_rate: float = 0.0
+    position_delay: float = 0.0
+    velocity_delay: float = 0.0
+    orientation_delay: float = 0.0
+    imu_delay: float = 0.0
+
+
+@dataclass(frozen=True)
+class ChannelTiming:
+    """Sample period and transport delay of one channel, in physics ticks.
+
+    Samples are taken at ticks 0, period, 2 * period, ... after a reset; the
+    ring buffer holds the ``capacity`` most recent ones, enough to serve a
+    reading ``delay`` ticks in the past.
+    """
+
+    period: int
+    delay: int
+
+    @property
+    def capacity(self) -> int:
+        return self.delay // self.period + 2
+
+    def delayed_sample(self, tick: int) -> int:
+        """Number of the sample visible at ``tick`` (0 until the delay has passed)."""
+        return max(tick - self.delay, 0) // self.period
+
+
+def channel_timings(
+    params: SensorNoiseParams, physics_dt: float
+) -> dict[str, ChannelTiming] | None:
+    """Per-channel timing in physics ticks, or None when nothing is scheduled.
+
+    Rates are rounded to a whole number of physics ticks (at most one sample
+    per tick) and delays to the nearest tick.
+    """
+    timings: dict[str, ChannelTiming] = {}
+    scheduled = False
+    for name in SENSOR_CHANNELS:
+        rate = getattr(params, f"{name}_rate")
+        delay = getattr(params, f"{name}_delay")
+        if rate < 0 or delay < 0:
+            raise ValueError(f"{name} rate and delay must be non-negative")
+        period = max(1, round(1.0 / (rate * physics_dt))) if rate > 0 else 1
+        delay_ticks = round(delay / physics_dt)
+        scheduled |= period > 1 or delay_ticks > 0
+        timings[name] = ChannelTiming(period=period, delay=delay_ticks)
+    return timings if scheduled else None
+
+
+def noise_scale(
+    params: SensorNoiseParams, dt: float
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Per-channel noise scale and bias decay for one reading interval.
+
+    Returns:
+        (scale, decay): ``scale`` (NOISE_CHANNELS,) multiplies a row of
+        standard normals; the stacked [accel, gyro] biases evolve as
+        ``bias = decay * bias + scale[:6] * n[:6]``.
+    """
+    # Exact discretization of db = -b / tau dt + sigma / sqrt(tau) dW, the
+    # process behind the Euler step (1 - dt/tau) b + sigma sqrt(dt/tau) n;
+    # exact for any dt, stationary std sigma / sqrt(2)
+    accel_decay = math.exp(-dt / params.accel_bias_time_constant)
+    gyro_decay = math.exp(-dt / params.gyro_bias_time_constant)
+    scale = np.empty(NOISE_CHANNELS)
+    scale[0:3] = params.accel_bias_std * math.sqrt(0.5 * (1.0 - accel_decay**2))
+    scale[3:6] = params.gyro_bias_std * math.sqrt(0.5 * (1.0 - gyro_decay**2))
+    scale[6:9] = params.position_noise_std
+    scale[9:12] = params.velocity_noise_std
+    scale[12:15] = params.accel_noise_std
+    scale[15:18] = params.gyro_noise_std
+    decay = np.repeat([accel_decay, gyro_decay], 3)
+    return scale, decay
+
 
 @dataclass
 class SensorState:
@@ -43,6 +179,25 @@ class SensorState:
     gyro_bias: NDArray[np.float64] = field(default_factory=lambda: np.zeros(3))
 
 
+@dataclass
+class SensorSnapshot:
+    """Restorable sensor state: biases and noise stream position.
+
+    ``rng_state`` is the generator state the current noise block was drawn
+    from and ``noise_cursor`` the next unused row of that block, so the block
+    itself never needs to be stored. With scheduled channels, ``tick`` and
+    ``rings`` hold the sample clock and ring buffers (None before the first
+    sample of an episode).
+    """
+
+    accel_bias: NDArray[np.float64]
+    gyro_bias: NDArray[np.float64]
+    rng_state: dict[str, Any]
+    noise_cursor: int
+    tick: int = 0
+    rings: tuple[NDArray[np.float64], ...] | None = None
+
+
 @dataclass
 class SensorReadings:
     """Sensor readings with noise applied."""
@@ -53,7 +208,7 @@ class SensorReadings:
     orientation: NDArray[np.float64]  # quaternion wxyz (MuJoCo convention)
 
     # Body frame
-    acceleration: NDArray[np.float64]  # m/s^2 (includes gravity in body frame)
+    acceleration: NDArray[np.float64]  # m/s^2 specific force (+g up at rest)
     angular_velocity: NDArray[np.float64]  # rad/s
 
     def to_array(self) -> NDArray[np.float64]:
@@ -74,121 +229,302 @@ class SensorReadings:
         return 16  # 3 + 3 + 4 + 3 + 3
 
 
+class _Channel:
+    """Ring buffer and addresses of one scheduled channel."""
+
+    __slots__ = ("name", "timing", "index", "out", "noise", "ring")
+
+    def __init__(
+        self, name: str, timing: ChannelTiming, index: NDArray[np.intp]
+    ) -> None:
+        self.name = name
+        self.timing = timing
+        self.out = CHANNEL_SLICES[name]
+        self.index = index[self.out]
+        self.noise = CHANNEL_NOISE[name]
+        self.ring = np.zeros((timing.capacity, len(self.index)))
+
+
 class SensorModel:
-    """Simulates noisy IMU and position sensors."""
+    """Simulates noisy IMU and position sensors on top of MuJoCo sensordata.
+
+    Call ``bind`` once with the model (and drone prefix) before reading; the
+    sensordata addresses are resolved there so each reading is a single
+    gather from ``data.sensordata`` into a preallocated buffer.
+
+    Noise comes from blocks of standard normals drawn with one generator call
+    and consumed one row per reading (or per sampling tick when channels are
+    scheduled), so the output is a deterministic function of the seed.
+
+    With scheduled channels, call ``tick`` after every physics step; ticks
+    where no channel is due cost one comparison.
+    """
 
     def __init__(
         self,
         params: SensorNoiseParams | None = None,
         seed: int | None = None,
     ) -> None:
-        self.params = params or SensorNoiseParams()
         self.rng = np.random.default_rng(seed)
-        self.state = SensorState()
-        self._prev_velocity: NDArray[np.float64] | None = None
-        self._prev_time: float | None = None
+        # Stacked [accel, gyro] biases; ``state`` holds views into it
+        self._bias = np.zeros(6)
+        self.state = SensorState(accel_bias=self._bias[0:3], gyro_bias=self._bias[3:6])
+        self._index: NDArray[np.intp] | None = None
+
+        # Reading buffer in ``SensorReadings.to_array`` layout; the returned
+        # readings are views into it
+        self._buffer = np.zeros(SensorReadings.observation_size())
+        self._readings = SensorReadings(
+            position=self._buffer[0:3],
+            velocity=self._buffer[3:6],
+            orientation=self._buffer[6:10],
+            acceleration=self._buffer[10:13],
+            angular_velocity=self._buffer[13:16],
+        )
+
+        self._noise_block = np.empty((NOISE_BLOCK_STEPS, NOISE_CHANNELS))
+        self._noise_cursor = NOISE_BLOCK_STEPS  # empty, drawn on first use
+        self._block_rng_state = self.rng.bit_generator.state
+        self._noise = np.empty(NOISE_CHANNELS)
+
+        # Per-channel noise scale and bias decay, cached for one dt
+        self._noise_scale = np.empty(NOISE_CHANNELS)
+        self._bias_decay = np.ones(6)
+        self._scale_dt: float | None = None
+
+        # Multi-rate schedule, built by ``bind`` when any channel has a rate
+        # or delay
+        self._physics_dt: float | None = None
+        self._channels: list[_Channel] | None = None
+        self._imu_dt = 0.0
+        self._tick = 0
+        self._next_due = 0
+        self._primed = False
+        self.params = params or SensorNoiseParams()
+
+    @property
+    def params(self) -> SensorNoiseParams:
+        """Noise parameters."""
+        return self._params
+
+    @params.setter
+    def params(self, params: SensorNoiseParams) -> None:
+        self._params = params
+        self._scale_dt = None
+        if self._physics_dt is not None:
+            self._build_schedule()
+
+    @property
+    def scheduled(self) -> bool:
+        """Whether channels are sampled by ``tick`` instead of on reading."""
+        return self._channels is not None
+
+    def bind(self, model: mujoco.MjModel, prefix: str = "") -> None:
+        """Resolve the sensordata addresses of one drone's sensors.
+
+        Args:
+            model: Compiled model containing ``QUADCOPTER_SENSOR_XML``
+            prefix: Drone name prefix (see ``drone_prefix``)
+        """
+        index: list[int] = []
+        for name in SENSOR_NAMES:
+            sensor_id = mujoco.mj_name2id(
+                model, mujoco.mjtObj.mjOBJ_SENSOR, f"{prefix}{name}"
+            )
+            if sensor_id < 0:
+                raise ValueError(f"Model has no sensor named {prefix + name!r}")
+            adr = int(model.sensor_adr[sensor_id])
+            index.extend(range(adr, adr + int(model.sensor_dim[sensor_id])))
+        self._index = np.asarray(index, dtype=np.intp)
+        self._physics_dt = float(model.opt.timestep)
+        self._build_schedule()
+
+    def _build_schedule(self) -> None:
+        """Allocate ring buffers for the channel rates and delays."""
+        assert self._index is not None and self._physics_dt is not None
+        timings = channel_timings(self._params, self._physics_dt)
+        self._primed = False
+        if timings is None:
+            self._channels = None
+            return
+        self._channels = [
+            _Channel(name, timings[name], self._index) for name in SENSOR_CHANNELS
+        ]
+        self._imu_dt = timings["imu"].period * self._physics_dt
 
     def reset(self, seed: int | None = None) -> None:
-        """Reset sensor biases."""
+        """Reset sensor biases (and the noise stream when seeded)."""
         if seed is not None:
             self.rng = np.random.default_rng(seed)
-        self.state = SensorState()
-        self._prev_velocity = None
-        self._prev_time = None
+            self._noise_cursor = NOISE_BLOCK_STEPS
+            self._block_rng_state = self.rng.bit_generator.state
+        self._bias[:] = 0.0
+        self._primed = False
+
+    def snapshot(self) -> SensorSnapshot:
+        """Capture bias and noise stream state."""
+        if self._noise_cursor >= NOISE_BLOCK_STEPS:
+            rng_state = self.rng.bit_generator.state
+        else:
+            rng_state = self._block_rng_state
+        return SensorSnapshot(
+            accel_bias=self.state.accel_bias.copy(),
+            gyro_bias=self.state.gyro_bias.copy(),
+            rng_state=rng_state,
+            noise_cursor=self._noise_cursor,
+            tick=self._tick,
+            rings=tuple(channel.ring.copy() for channel in self._channels)
+            if self._channels is not None and self._primed
+            else None,
+        )
+
+    def restore(self, snapshot: SensorSnapshot, restore_rng: bool = True) -> None:
+        """Restore a captured state.
+
+        Args:
+            snapshot: State from ``snapshot``
+            restore_rng: Also rewind the noise stream (exact replay); keep
+                False to draw fresh noise from the current stream
+        """
+        self._bias[0:3] = snapshot.accel_bias
+        self._bias[3:6] = snapshot.gyro_bias
+        if restore_rng:
+            self.rng.bit_generator.state = snapshot.rng_state
+            if snapshot.noise_cursor < NOISE_BLOCK_STEPS:
+                # Redraw the block the snapshot was consuming
+                self._draw_noise_block()
+            self._noise_cursor = snapshot.noise_cursor
+
+        if self._channels is not None:
+            self._primed = snapshot.rings is not None
+            if snapshot.rings is not None:
+                for channel, ring in zip(self._channels, snapshot.rings):
+                    channel.ring[:] = ring
+                self._tick = snapshot.tick
+                self._schedule_next()
+
+    def _draw_noise_block(self) -> None:
+        """Draw a fresh block from the generator and rewind the cursor."""
+        self._block_rng_state = self.rng.bit_generator.state
+        self.rng.standard_normal(out=self._noise_block)
+        self._noise_cursor = 0
+
+    def _update_scale(self, dt: float) -> None:
+        """Recompute the noise scale and bias decay for a reading interval."""
+        self._noise_scale, self._bias_decay = noise_scale(self._params, dt)
+        self._scale_dt = dt
+
+    def _next_noise(self, dt: float) -> NDArray[np.float64]:
+        """Scaled noise for one reading (valid until the next call)."""
+        if self._noise_cursor >= NOISE_BLOCK_STEPS:
+            self._draw_noise_block()
+        if dt != self._scale_dt:
+            self._update_scale(dt)
+        np.multiply(
+            self._noise_block[self._noise_cursor], self._noise_scale, out=self._noise
+        )
+        self._noise_cursor += 1
+        return self._noise
+
+    def _step_biases(self, noise: NDArray[np.float64]) -> None:
+        """Decay the biases and add their scaled noise (channels 0-5)."""
+        self._bias *= self._bias_decay
+        self._bias += noise[0:6]
 
     def update_biases(self, dt: float) -> None:
-        """Update sensor biases with random walk."""
-        # Ornstein-Uhlenbeck process for bias drift
-        alpha_accel = dt / self.params.accel_bias_time_constant
-        alpha_gyro = dt / self.params.gyro_bias_time_constant
+        """Advance the bias Ornstein-Uhlenbeck processes by ``dt``.
 
-        self.state.accel_bias = (1 - alpha_accel) * self.state.accel_bias + np.sqrt(
-            alpha_accel
-        ) * self.params.accel_bias_std * self.rng.standard_normal(3)
+        Consumes one noise row, like a reading.
+        """
+        self._step_biases(self._next_noise(dt))
 
-        self.state.gyro_bias = (1 - alpha_gyro) * self.state.gyro_bias + np.sqrt(
-            alpha_gyro
-        ) * self.params.gyro_bias_std * self.rng.standard_normal(3)
+    def tick(self, data: mujoco.MjData, add_noise: bool = True) -> None:
+        """Advance the sample clock one physics tick and sample due channels.
+
+        A no-op unless channels are scheduled.
+        """
+        if self._channels is None:
+            return
+        if not self._primed:
+            self._prime(data, add_noise)
+            return
+        self._tick += 1
+        if self._tick >= self._next_due:
+            self._sample(data, add_noise)
+
+    def _prime(self, data: mujoco.MjData, add_noise: bool) -> None:
+        """Take the first sample of every channel after a reset."""
+        self._tick = 0
+        self._sample(data, add_noise)
+        self._primed = True
+
+    def _sample(self, data: mujoco.MjData, add_noise: bool) -> None:
+        """Write the channels due at the current tick into their ring buffers."""
+        assert self._channels is not None
+        tick = self._tick
+        noise = self._next_noise(self._imu_dt) if add_noise else None
+        for channel in self._channels:
+            period = channel.timing.period
+            if tick % period == 0:
+                slot = channel.ring[(tick // period) % channel.timing.capacity]
+                np.take(data.sensordata, channel.index, out=slot)
+                if noise is not None and channel.noise is not None:
+                    if channel.name == "imu":
+                        self._step_biases(noise)
+                        noise[12:18] += self._bias
+                    slot += noise[channel.noise]
+        self._schedule_next()
+
+    def _schedule_next(self) -> None:
+        """Set the tick at which the next channel is due."""
+        assert self._channels is not None
+        self._next_due = min(
+            (self._tick // channel.timing.period + 1) * channel.timing.period
+            for channel in self._channels
+        )
 
     def get_readings(
         self,
-        state: QuadcopterState,
+        data: mujoco.MjData,
         dt: float,
         add_noise: bool = True,
     ) -> SensorReadings:
-        """Get noisy sensor readings from true state.
+        """Get noisy sensor readings from the current sensordata.
+
+        With scheduled channels this returns the latest delayed sample of
+        each channel; ``dt`` is unused since the biases advance per IMU sample.
 
         Args:
-            state: True quadcopter state
+            data: Simulation data of the bound model
             dt: Time since last reading
             add_noise: Whether to add noise (disable for debugging)
 
         Returns:
-            Noisy sensor readings
+            Noisy sensor readings. The arrays are views into an internal
+            buffer and are overwritten by the next call.
         """
-        # Update biases
-        if add_noise:
-            self.update_biases(dt)
-
-        # Get rotation matrix from quaternion (wxyz - MuJoCo convention)
-        rot_matrix = np.zeros(9)
-        mujoco.mju_quat2Mat(rot_matrix, state.orientation)
-        rot_matrix = rot_matrix.reshape(3, 3)
-
-        # Compute true acceleration in world frame
-        if self._prev_velocity is not None and self._prev_time is not None:
-            true_accel_world = (state.velocity - self._prev_velocity) / dt
-        else:
-            true_accel_world = np.zeros(3)
+        if self._index is None:
+            raise RuntimeError("SensorModel.bind must be called before get_readings")
 
-        self._prev_velocity = state.velocity.copy()
+        buffer = self._buffer
+        if self._channels is not None:
+            if not self._primed:
+                self._prime(data, add_noise)
+            for channel in self._channels:
+                timing = channel.timing
+                slot = timing.delayed_sample(self._tick) % timing.capacity
+                buffer[channel.out] = channel.ring[slot]
+            return self._readings
 
-        # Add gravity to get specific force (what accelerometer measures)
-        gravity = np.array([0.0, 0.0, -9.81])
-        specific_force_world = true_accel_world - gravity
-
-        # Transform to body frame
-        body_accel = rot_matrix.T @ specific_force_world
-        body_angular_vel = rot_matrix.T @ state.angular_velocity
+        np.take(data.sensordata, self._index, out=buffer)
 
         if add_noise:
-            # Add noise to position
-            position = state.position + self.rng.normal(
-                0, self.params.position_noise_std, 3
-            )
+            noise = self._next_noise(dt)
+            self._step_biases(noise)
+            noise[12:18] += self._bias
 
-            # Add noise to velocity
-            velocity = state.velocity + self.rng.normal(
-                0, self.params.velocity_noise_std, 3
-            )
+            # Orientation is left noise-free (it comes from sensor fusion)
+            buffer[0:6] += noise[6:12]
+            buffer[10:16] += noise[12:18]
 
-            # Add noise and bias to accelerometer
-            acceleration = (
-                body_accel
-                + self.state.accel_bias
-                + self.rng.normal(0, self.params.accel_noise_std, 3)
-            )
-
-            # Add noise and bias to gyroscope
-            angular_velocity = (
-                body_angular_vel
-                + self.state.gyro_bias
-                + self.rng.normal(0, self.params.gyro_noise_std, 3)
-            )
-
-            # Orientation is typically less noisy (from sensor fusion)
-            orientation = state.orientation.copy()
-        else:
-            position = state.position.copy()
-            velocity = state.velocity.copy()
-            acceleration = body_accel
-            angular_velocity = body_angular_vel
-            orientation = state.orientation.copy()
-
-        return SensorReadings(
-            position=position,
-            velocity=velocity,
-            orientation=orientation,
-            acceleration=acceleration,
-            angular_velocity=angular_velocity,
-        )
+        return self._readings
@@ -1,5 +1,32 @@
 """Gymnasium environments."""
 
-from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.batched_env import BatchedQuadcopterVecEnv
+from simhops.envs.course import Course, load_course
+from simhops.envs.course_bank import CourseBank
+from simhops.envs.multi_drone_env import MultiDroneVecEnv
+from simhops.envs.observation import OBSERVATION_GROUPS, ObservationLayout
+from simhops.envs.quadcopter_env import EnvSnapshot, QuadcopterEnv
+from simhops.envs.reset_pool import ResetPool
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+from simhops.envs.vec_normalize import (
+    DtypeVecNormalize,
+    load_normalization,
+    transfer_normalization,
+)
 
-__all__ = ["QuadcopterEnv"]
+__all__ = [
+    "BatchedQuadcopterVecEnv",
+    "Course",
+    "CourseBank",
+    "DtypeVecNormalize",
+    "EnvSnapshot",
+    "MultiDroneVecEnv",
+    "OBSERVATION_GROUPS",
+    "ObservationLayout",
+    "QuadcopterEnv",
+    "ResetPool",
+    "SharedMemoryVecEnv",
+    "load_course",
+    "load_normalization",
+    "transfer_normalization",
+]
@@ -0,0 +1,673 @@
+"""Stable-Baselines3 VecEnv backed by the batched NumPy dynamics engine."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from numpy.typing import NDArray
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import (
+    VecEnvIndices,
+    VecEnvObs,
+    VecEnvStepReturn,
+)
+
+from simhops.config import Config
+from simhops.config.schema import EnvConfig, RewardConfig
+from simhops.core.batched import BatchedQuadcopter
+from simhops.core.quadcopter import QuadcopterParams
+from simhops.core.sensors import (
+    CHANNEL_NOISE,
+    CHANNEL_SLICES,
+    NOISE_CHANNELS,
+    SENSOR_CHANNELS,
+    SensorNoiseParams,
+    channel_timings,
+    noise_scale,
+)
+from simhops.envs.course import Course, arc_lengths, arc_progress, load_course
+from simhops.envs.course_bank import CourseBank, generate_courses
+from simhops.envs.observation import ObservationLayout, observation_dtype
+from simhops.envs.quadcopter_env import (
+    FIXED_ENV_SETTINGS,
+    QuadcopterEnv,
+    check_fixed_settings,
+    control_substeps,
+)
+
+
+class BatchedQuadcopterVecEnv(VecEnv):
+    """N quadcopter waypoint-tracking envs stepped together in one process.
+
+    Mirrors ``QuadcopterEnv`` (observation layout, reward, terminations and
+    sensor noise model) but advances every drone with ``BatchedQuadcopter``
+    instead of one MuJoCo model per env, so thousands of drones can be stepped
+    without worker processes or pipes.
+
+    Rows reset automatically when they terminate or truncate; the final
+    observation is returned in ``info["terminal_observation"]`` as SB3 expects.
+    Episode diagnostics (the same keys ``QuadcopterEnv`` reports) are only
+    filled in for rows that finished on the current step, so infos are always
+    at most as verbose as ``info_mode="episode_end"``; ``env.info_mode`` is
+    ignored.
+
+    Attributes and methods are shared by all rows, so ``get_attr`` reports
+    the same value for every index, and ``set_attr`` and ``env_method`` act
+    once on the whole batch and need indices covering every env. The
+    exception is ``get_ground_truth``, which ``env_method`` calls per index.
+    """
+
+    # Methods ``env_method`` calls once per env, with the env index first
+    PER_ENV_METHODS = ("get_ground_truth",)
+
+    def __init__(
+        self,
+        num_envs: int,
+        env_cfg: EnvConfig | None = None,
+        reward_cfg: RewardConfig | None = None,
+        quad_params: QuadcopterParams | None = None,
+        sensor_params: SensorNoiseParams | None = None,
+        seed: int | None = None,
+    ) -> None:
+        cfg = Config.schema()
+        self._env_cfg = env_cfg or cfg.env
+        self._reward_cfg = reward_cfg or cfg.reward
+
+        quad_defaults = cfg.quadcopter
+        sensor_defaults = cfg.sensor
+        self._quad_params = quad_params or QuadcopterParams(
+            mass=quad_defaults.mass,
+            arm_length=quad_defaults.arm_length,
+            thrust_to_weight=quad_defaults.thrust_to_weight,
+            inertia=quad_defaults.inertia,
+            drag_coeff=quad_defaults.drag_coeff,
+            motor_time_constant=quad_defaults.motor_time_constant,
+            frame=quad_defaults.frame,
+        )
+        self._sensor_params = sensor_params or SensorNoiseParams(
+            accel_noise_std=sensor_defaults.accel_noise_std,
+            accel_bias_std=sensor_defaults.accel_bias_std,
+            accel_bias_time_constant=sensor_defaults.accel_bias_time_constant,
+            gyro_noise_std=sensor_defaults.gyro_noise_std,
+            gyro_bias_std=sensor_defaults.gyro_bias_std,
+            gyro_bias_time_constant=sensor_defaults.gyro_bias_time_constant,
+            position_noise_std=sensor_defaults.position_noise_std,
+            velocity_noise_std=sensor_defaults.velocity_noise_std,
+            position_rate=sensor_defaults.position_rate,
+            velocity_rate=sensor_defaults.velocity_rate,
+            orientation_rate=sensor_defaults.orientation_rate,
+            imu_rate=sensor_defaults.imu_rate,
+            position_delay=sensor_defaults.position_delay,
+            velocity_delay=sensor_defaults.velocity_delay,
+            orientation_delay=sensor_defaults.orientation_delay,
+            imu_delay=sensor_defaults.imu_delay,
+        )
+
+        self.physics_dt = self._env_cfg.physics_dt
+        self.n_substeps = control_substeps(self.physics_dt, self._env_cfg.control_dt)
+        self.dt = self.physics_dt * self.n_substeps
+        self.dtype = observation_dtype(self._env_cfg.dtype)
+        self.observation_layout = ObservationLayout.for_env(
+            self._env_cfg.include_position
+        )
+        observation_space = spaces.Box(
+            low=-np.inf,
+            high=np.inf,
+            shape=(self.observation_layout.size,),
+            dtype=self.dtype,
+        )
+        action_space = spaces.Box(low=-1.0, high=1.0, shape=(4,), dtype=self.dtype)
+        super().__init__(num_envs, observation_space, action_space)
+
+        self._rng = np.random.default_rng(seed)
+        self._quad = BatchedQuadcopter(num_envs, self._quad_params, self.physics_dt)
+        self._actions = np.zeros((num_envs, 4))
+
+        # Episode state (one row per env)
+        self._setup_course()
+        self._waypoint_yaw = np.zeros(num_envs)
+        self._course_index = np.full(num_envs, -1, dtype=np.int64)  # -1: no bank
+        self._current_waypoint_idx = np.zeros(num_envs, dtype=np.int64)
+        self._episode_step = np.zeros(num_envs, dtype=np.int64)
+        self._prev_distance = np.full(num_envs, np.nan)
+        self._episode_speed_sum = np.zeros(num_envs)
+        self._episode_speed_ticks = np.zeros(num_envs, dtype=np.int64)
+        self._episode_max_tilt = np.zeros(num_envs)
+        self._time_to_first_wp = np.full(num_envs, -1, dtype=np.int64)
+
+        # Sensor state
+        self._accel_bias = np.zeros((num_envs, 3))
+        self._gyro_bias = np.zeros((num_envs, 3))
+
+        # Multi-rate schedule with the same semantics as ``SensorModel``:
+        # per-row sample clocks and (capacity, num_envs, width) ring buffers
+        self._sensor_timings = channel_timings(self._sensor_params, self.physics_dt)
+        self._sensor_tick = np.zeros(num_envs, dtype=np.int64)
+        self._sensor_rings: dict[str, NDArray[np.float64]] = {}
+        bias_dt = self.dt
+        if self._sensor_timings is not None:
+            for name, timing in self._sensor_timings.items():
+                width = CHANNEL_SLICES[name].stop - CHANNEL_SLICES[name].start
+                self._sensor_rings[name] = np.zeros((timing.capacity, num_envs, width))
+            bias_dt = self._sensor_timings["imu"].period * self.physics_dt
+        self._noise_scale, self._bias_decay = noise_scale(self._sensor_params, bias_dt)
+
+    def _setup_course(self) -> None:
+        """Load the base course and course bank for ``self._env_cfg``."""
+        env_cfg = self._env_cfg
+        if env_cfg.course_file is not None:
+            self.base_course = load_course(env_cfg.course_file, env_cfg.waypoint_radius)
+        else:
+            self.base_course = Course.from_waypoints(
+                QuadcopterEnv.FIXED_WAYPOINTS, env_cfg.waypoint_radius, name="default"
+            )
+        self.num_waypoints = len(self.base_course)
+        self._base_waypoints = self.base_course.positions
+        self._waypoint_radii = self.base_course.radii
+        self._course_bank: CourseBank | None = None
+        if env_cfg.course_bank_size > 0:
+            self._course_bank = CourseBank.load(
+                self._base_waypoints,
+                env_cfg.course_bank_size,
+                env_cfg.waypoint_noise,
+                env_cfg.waypoint_yaw_random,
+                seed=env_cfg.course_bank_seed,
+                bank_dir=env_cfg.course_bank_dir,
+            )
+        self._waypoints = np.zeros((self.num_envs, self.num_waypoints, 3))
+        self._arc_length = np.zeros((self.num_envs, self.num_waypoints))
+        self._max_waypoints_effective = self._resolve_max_waypoints()
+
+    def configure(self, env_cfg: EnvConfig) -> None:
+        """Apply a new env config to every row without rebuilding the env.
+
+        Same contract as ``QuadcopterEnv.configure``: settings in
+        ``FIXED_ENV_SETTINGS`` must not change, and the new settings apply
+        from the next reset, so call ``reset()`` afterwards.
+        """
+        check_fixed_settings(
+            {name: getattr(self._env_cfg, name) for name in FIXED_ENV_SETTINGS},
+            env_cfg,
+        )
+        self._env_cfg = env_cfg
+        self._setup_course()
+
+    def _resolve_max_waypoints(self) -> int:
+        max_waypoints = self._env_cfg.max_waypoints
+        if max_waypoints is None:
+            max_waypoints = self.num_waypoints
+        return max(1, min(max_waypoints, self.num_waypoints))
+
+    def _reset_rows(self, rows: NDArray[np.intp]) -> None:
+        """Reset the selected rows to the start of a new episode."""
+        n = len(rows)
+        if n == 0:
+            return
+        env_cfg = self._env_cfg
+
+        start_pos = np.tile(np.array([0.0, 0.0, 1.0]), (n, 1))
+        if env_cfg.random_start_position:
+            if env_cfg.start_position_noise > 0:
+                jitter = env_cfg.start_position_noise
+            else:
+                jitter = env_cfg.ground_threshold + 0.1
+            start_pos += self._rng.uniform(-jitter, jitter, size=(n, 3))
+            start_pos[:, 2] = np.maximum(start_pos[:, 2], env_cfg.ground_threshold + 0.1)
+        self._quad.reset(rows, start_pos)
+
+        # Waypoints: draw bank courses, or rotate the fixed path by a random
+        # yaw and add noise
+        if self._course_bank is not None:
+            index = self._rng.integers(len(self._course_bank), size=n)
+            waypoints = self._course_bank.waypoints[index]
+            yaw = self._course_bank.yaws[index]
+            self._course_index[rows] = index
+        else:
+            waypoints, yaw = generate_courses(
+                self._base_waypoints,
+                n,
+                env_cfg.waypoint_noise,
+                env_cfg.waypoint_yaw_random,
+                self._rng,
+            )
+            self._course_index[rows] = -1
+        self._waypoints[rows] = waypoints
+        self._arc_length[rows] = arc_lengths(waypoints)
+        self._waypoint_yaw[rows] = yaw
+
+        if env_cfg.random_start_waypoint:
+            self._current_waypoint_idx[rows] = self._rng.integers(
+                0, self._max_waypoints_effective, size=n
+            )
+        else:
+            self._current_waypoint_idx[rows] = 0
+        self._episode_step[rows] = 0
+        self._prev_distance[rows] = np.nan
+        self._episode_speed_sum[rows] = 0.0
+        self._episode_speed_ticks[rows] = 0
+        self._episode_max_tilt[rows] = 0.0
+        self._time_to_first_wp[rows] = -1
+
+        self._accel_bias[rows] = 0.0
+        self._gyro_bias[rows] = 0.0
+        if self._sensor_timings is not None:
+            self._sensor_tick[rows] = 0
+            self._sample_sensors(rows)
+
+    def _channel_values(self, name: str, rows: NDArray[np.intp]) -> NDArray[np.float64]:
+        """Noise-free values of one sensor channel for the selected rows."""
+        quad = self._quad
+        if name == "position":
+            return quad.position[rows]
+        if name == "velocity":
+            return quad.velocity[rows]
+        if name == "orientation":
+            return quad.orientation[rows]
+        return np.concatenate(
+            [quad.specific_force()[rows], quad.angular_velocity[rows]], axis=1
+        )
+
+    def _sample_sensors(self, rows: NDArray[np.intp]) -> None:
+        """Write the channels due at each row's sensor tick into the ring buffers."""
+        assert self._sensor_timings is not None
+        add_noise = self._env_cfg.add_sensor_noise
+        scale = self._noise_scale
+        ticks = self._sensor_tick[rows]
+        for name, timing in self._sensor_timings.items():
+            due = ticks % timing.period == 0
+            if not due.any():
+                continue
+            due_rows = rows[due]
+            values = self._channel_values(name, due_rows)
+            noise_columns = CHANNEL_NOISE[name]
+            if add_noise and noise_columns is not None:
+                if name == "imu":
+                    noise = self._rng.standard_normal((len(due_rows), 12))
+                    bias_noise = noise[:, 0:6] * scale[0:6]
+                    accel_bias = (
+                        self._bias_decay[0:3] * self._accel_bias[due_rows]
+                        + bias_noise[:, 0:3]
+                    )
+                    gyro_bias = (
+                        self._bias_decay[3:6] * self._gyro_bias[due_rows]
+                        + bias_noise[:, 3:6]
+                    )
+                    self._accel_bias[due_rows] = accel_bias
+                    self._gyro_bias[due_rows] = gyro_bias
+                    values[:, 0:3] += accel_bias
+                    values[:, 3:6] += gyro_bias
+                    values += noise[:, 6:12] * scale[noise_columns]
+                else:
+                    values = values + (
+                        self._rng.standard_normal(values.shape) * scale[noise_columns]
+                    )
+            slots = (ticks[due] // timing.period) % timing.capacity
+            self._sensor_rings[name][slots, due_rows] = values
+
+    def _sensor_readings(
+        self, rows: NDArray[np.intp]
+    ) -> tuple[NDArray[np.float64], ...]:
+        """Noisy sensor readings for the selected rows (same model as ``SensorModel``)."""
+        if self._sensor_timings is not None:
+            # Latest delayed sample of each channel
+            ticks = self._sensor_tick[rows]
+            channels = []
+            for name in SENSOR_CHANNELS:
+                timing = self._sensor_timings[name]
+                sample = np.maximum(ticks - timing.delay, 0) // timing.period
+                channels.append(self._sensor_rings[name][sample % timing.capacity, rows])
+            position, velocity, orientation, imu = channels
+            return position, velocity, orientation, imu[:, 0:3], imu[:, 3:6]
+
+        quad = self._quad
+        add_noise = self._env_cfg.add_sensor_noise
+        n = len(rows)
+
+        true_position = quad.position[rows]
+        true_velocity = quad.velocity[rows]
+        orientation = quad.orientation[rows]
+        body_accel = quad.specific_force()[rows]
+        body_angular_vel = quad.angular_velocity[rows]
+
+        if add_noise:
+            # One draw for all rows, same channel layout as ``SensorModel``
+            noise = self._rng.standard_normal((n, NOISE_CHANNELS))
+            noise *= self._noise_scale
+            accel_bias = self._bias_decay[0:3] * self._accel_bias[rows] + noise[:, 0:3]
+            gyro_bias = self._bias_decay[3:6] * self._gyro_bias[rows] + noise[:, 3:6]
+            self._accel_bias[rows] = accel_bias
+            self._gyro_bias[rows] = gyro_bias
+
+            position = true_position + noise[:, 6:9]
+            velocity = true_velocity + noise[:, 9:12]
+            acceleration = body_accel + accel_bias + noise[:, 12:15]
+            angular_velocity = body_angular_vel + gyro_bias + noise[:, 15:18]
+        else:
+            position = true_position
+            velocity = true_velocity
+            acceleration = body_accel
+            angular_velocity = body_angular_vel
+
+        return position, velocity, orientation, acceleration, angular_velocity
+
+    def _get_observations(self, rows: NDArray[np.intp]) -> NDArray[np.floating[Any]]:
+        """Build observations for the selected rows (same layout as ``QuadcopterEnv``)."""
+        position, velocity, orientation, acceleration, angular_velocity = (
+            self._sensor_readings(rows)
+        )
+        current_idx = self._current_waypoint_idx[rows]
+        wp_idx = np.minimum(current_idx, self.num_waypoints - 1)
+        relative_wp = self._waypoints[rows, wp_idx] - position
+        distance = np.linalg.norm(relative_wp, axis=1)
+        goal_max_distance = self._env_cfg.goal_max_distance
+
+        relative_wp_normalized = np.clip(relative_wp / goal_max_distance, -1.0, 1.0)
+        distance_normalized = np.minimum(distance / goal_max_distance, 1.0)
+        speed = np.linalg.norm(velocity, axis=1)
+        speed_normalized = np.minimum(speed / self._env_cfg.speed_normalization, 1.0)
+
+        # Arc-length progress along each row's path
+        progress = arc_progress(
+            self._arc_length[rows], current_idx, self._max_waypoints_effective
+        )
+
+        # A new array per call: SB3 keeps the previous observation around
+        return self.observation_layout.write(
+            {
+                "position": position,
+                "velocity": velocity,
+                "orientation": orientation,
+                "acceleration": acceleration,
+                "angular_velocity": angular_velocity,
+                "relative_waypoint": relative_wp_normalized,
+                "progress": progress,
+                "distance": distance_normalized,
+                "speed": speed_normalized,
+            },
+            self.observation_layout.new_buffer(len(rows), dtype=self.dtype),
+        )
+
+    def reset(self) -> VecEnvObs:
+        """Reset all rows."""
+        seed = self._seeds[0]
+        if seed is not None:
+            self._rng = np.random.default_rng(seed)
+        self._reset_seeds()
+        self._reset_options()
+        rows = np.arange(self.num_envs)
+        self._reset_rows(rows)
+        return self._get_observations(rows)
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = np.asarray(actions, dtype=np.float64).reshape(self.num_envs, 4)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        env_cfg = self._env_cfg
+        quad = self._quad
+        n = self.num_envs
+
+        self._episode_step += 1
+        scaled_actions = self._actions * env_cfg.action_scale
+
+        # Per-step accumulators; rows that terminate stop accumulating but
+        # coast through the remaining ticks (they are reset below)
+        rewards = np.zeros(n)
+        active = np.ones(n, dtype=bool)
+        distance = np.zeros(n)
+        speed = np.zeros(n)
+        waypoint_reached = np.zeros(n, dtype=bool)
+        success = np.zeros(n, dtype=bool)
+        collision = np.zeros(n, dtype=bool)
+        excessive_tilt = np.zeros(n, dtype=bool)
+        out_of_bounds = np.zeros(n, dtype=bool)
+
+        all_rows = np.arange(n)
+        for _ in range(self.n_substeps):
+            quad.apply_action(scaled_actions)
+            quad.step()
+            if self._sensor_timings is not None:
+                self._sensor_tick += 1
+                self._sample_sensors(all_rows)
+            tick = self._evaluate_tick(active)
+            rewards[active] += tick["reward"][active]
+            distance[active] = tick["distance"][active]
+            speed[active] = tick["speed"][active]
+            waypoint_reached |= tick["waypoint_reached"] & active
+            success |= tick["success"] & active
+            collision |= tick["collision"] & active
+            excessive_tilt |= tick["excessive_tilt"] & active
+            out_of_bounds |= tick["out_of_bounds"] & active
+            active &= ~tick["terminated"]
+            if not active.any():
+                break
+
+        terminated = ~active
+        truncated = self._episode_step >= env_cfg.max_episode_steps
+        dones = terminated | truncated
+
+        obs = self._get_observations(all_rows)
+        infos: list[dict[str, Any]] = [{} for _ in range(n)]
+
+        done_rows = np.flatnonzero(dones)
+        for row in done_rows:
+            infos[row] = self._episode_info(
+                int(row),
+                obs[row].copy(),
+                float(distance[row]),
+                float(speed[row]),
+                bool(waypoint_reached[row]),
+                bool(success[row]),
+                "out_of_bounds"
+                if out_of_bounds[row]
+                else "excessive_tilt"
+                if excessive_tilt[row]
+                else "collision"
+                if collision[row]
+                else None,
+                bool(terminated[row]),
+                bool(truncated[row]),
+            )
+            if collision[row]:
+                # The batched engine only models the ground plane
+                infos[row]["collision_group"] = "ground"
+
+        if len(done_rows) > 0:
+            self._reset_rows(done_rows)
+            obs[done_rows] = self._get_observations(done_rows)
+
+        return obs, rewards, dones, infos
+
+    def _evaluate_tick(self, active: NDArray[np.bool_]) -> dict[str, NDArray[Any]]:
+        """Reward and termination flags after one physics tick.
+
+        Episode state (waypoint index, progress baseline, statistics) is only
+        advanced for ``active`` rows.
+        """
+        env_cfg = self._env_cfg
+        reward_cfg = self._reward_cfg
+        quad = self._quad
+        rows = np.arange(self.num_envs)
+
+        # Distance and speed from ground truth (rows that finished the path
+        # earlier in this step are clamped; their values are masked out)
+        wp_idx = np.minimum(self._current_waypoint_idx, self.num_waypoints - 1)
+        current_wp = self._waypoints[rows, wp_idx]
+        distance = np.linalg.norm(quad.position - current_wp, axis=1)
+        speed = np.linalg.norm(quad.velocity, axis=1)
+        self._episode_speed_sum += np.where(active, speed, 0.0)
+        self._episode_speed_ticks += active
+
+        tilt = quad.tilt_angles()
+        self._episode_max_tilt = np.where(
+            active, np.maximum(self._episode_max_tilt, tilt), self._episode_max_tilt
+        )
+
+        radius = self._waypoint_radii[wp_idx]
+        waypoint_reached = distance < radius
+
+        # Reward (same shaping as QuadcopterEnv._compute_reward)
+        has_prev = ~np.isnan(self._prev_distance)
+        rewards = np.where(
+            has_prev,
+            (self._prev_distance - distance) * reward_cfg.progress_multiplier,
+            0.0,
+        )
+        rewards -= reward_cfg.time_penalty
+        rewards += waypoint_reached * reward_cfg.waypoint_bonus
+        close_3x = distance < radius * reward_cfg.close_proximity_3x_radius
+        close_1_5x = close_3x & (
+            distance < radius * reward_cfg.close_proximity_1_5x_radius
+        )
+        rewards += close_3x * reward_cfg.close_proximity_3x_bonus
+        rewards += close_1_5x * reward_cfg.close_proximity_1_5x_bonus
+        self._prev_distance = np.where(active, distance, self._prev_distance)
+
+        # Waypoint advance and path completion
+        advance = waypoint_reached & active
+        self._current_waypoint_idx += advance
+        self._prev_distance[advance] = np.nan
+        first_wp = advance & (self._time_to_first_wp < 0)
+        self._time_to_first_wp[first_wp] = self._episode_step[first_wp]
+        success = waypoint_reached & (
+            self._current_waypoint_idx >= self._max_waypoints_effective
+        )
+        time_bonus = np.maximum(
+            0,
+            (env_cfg.max_episode_steps - self._episode_step)
+            / reward_cfg.completion_time_divisor,
+        )
+        rewards += success * (reward_cfg.path_complete_bonus + time_bonus)
+
+        # Crashes (later checks take precedence for the reported crash type)
+        collision = quad.check_ground_contact()
+        rewards -= collision * reward_cfg.collision_penalty
+        excessive_tilt = np.zeros(self.num_envs, dtype=bool)
+        if not env_cfg.disable_tilt_termination:
+            excessive_tilt = tilt > env_cfg.max_tilt_angle
+            rewards -= excessive_tilt * reward_cfg.tilt_penalty
+        pos = quad.position
+        bound = env_cfg.arena_size / 2 + env_cfg.bounds_margin
+        out_of_bounds = (
+            (np.abs(pos[:, 0]) > bound)
+            | (np.abs(pos[:, 1]) > bound)
+            | (pos[:, 2] > env_cfg.max_altitude + env_cfg.bounds_margin)
+            | (pos[:, 2] < env_cfg.ground_threshold)
+        )
+        rewards -= out_of_bounds * reward_cfg.out_of_bounds_penalty
+
+        return {
+            "reward": rewards,
+            "distance": distance,
+            "speed": speed,
+            "waypoint_reached": waypoint_reached,
+            "success": success,
+            "collision": collision,
+            "excessive_tilt": excessive_tilt,
+            "out_of_bounds": out_of_bounds,
+            "terminated": success | collision | excessive_tilt | out_of_bounds,
+        }
+
+    def _episode_info(
+        self,
+        row: int,
+        terminal_obs: NDArray[np.float64],
+        distance: float,
+        speed: float,
+        waypoint_reached: bool,
+        success: bool,
+        crash: str | None,
+        terminated: bool,
+        truncated: bool,
+    ) -> dict[str, Any]:
+        """Episode-end info dict with the keys ``QuadcopterEnv`` reports."""
+        episode_step = int(self._episode_step[row])
+        time_to_first_wp = int(self._time_to_first_wp[row])
+        info: dict[str, Any] = {
+            "distance": distance,
+            "speed": speed,
+            "mean_speed": float(self._episode_speed_sum[row])
+            / max(1, int(self._episode_speed_ticks[row])),
+            "max_tilt_deg": math.degrees(float(self._episode_max_tilt[row])),
+            "time_to_first_wp": time_to_first_wp if time_to_first_wp >= 0 else None,
+            "current_waypoint_idx": int(self._current_waypoint_idx[row]),
+            "max_waypoints": self._max_waypoints_effective,
+            "waypoint_reached": waypoint_reached,
+            "episode_step": episode_step,
+            "waypoint_yaw": float(self._waypoint_yaw[row]),
+            "terminal_observation": terminal_obs,
+            "TimeLimit.truncated": truncated and not terminated,
+        }
+        if success:
+            info["success"] = True
+            info["completion_steps"] = episode_step
+        if crash is not None:
+            info["crash"] = crash
+        if truncated:
+            info["time_limit_reached"] = True
+        return info
+
+    def close(self) -> None:
+        return None
+
+    def get_ground_truth(self, index: int = 0) -> dict[str, Any]:
+        """True state and course of env ``index`` (see ``QuadcopterEnv``)."""
+        quad = self._quad
+        course_index = int(self._course_index[index])
+        return {
+            "position": quad.position[index].copy(),
+            "velocity": quad.velocity[index].copy(),
+            "orientation": quad.orientation[index].copy(),
+            "angular_velocity": quad.angular_velocity[index].copy(),
+            "waypoints": self._waypoints[index].copy(),
+            "current_waypoint_idx": int(self._current_waypoint_idx[index]),
+            "waypoint_yaw": float(self._waypoint_yaw[index]),
+            "course_index": course_index if course_index >= 0 else None,
+        }
+
+    def _batch_indices(self, name: str, indices: VecEnvIndices) -> list[int]:
+        """Resolve ``indices`` for a batch-level call, which affects every env.
+
+        Raises:
+            ValueError: If ``indices`` select only some of the envs
+        """
+        env_indices = list(self._get_indices(indices))
+        if sorted(set(env_indices)) != list(range(self.num_envs)):
+            raise ValueError(
+                f"{name!r} applies to every env of a BatchedQuadcopterVecEnv; "
+                f"got indices {env_indices}"
+            )
+        return env_indices
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> list[Any]:
+        value = getattr(self, attr_name)
+        return [value for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        self._batch_indices(attr_name, indices)
+        setattr(self, attr_name, value)
+
+    def env_method(
+        self,
+        method_name: str,
+        *method_args: Any,
+        indices: VecEnvIndices = None,
+        **method_kwargs: Any,
+    ) -> list[Any]:
+        method = getattr(self, method_name)
+        if method_name in self.PER_ENV_METHODS:
+            return [
+                method(index, *method_args, **method_kwargs)
+                for index in self._get_indices(indices)
+            ]
+        env_indices = self._batch_indices(method_name, indices)
+        result = method(*method_args, **method_kwargs)
+        return [result for _ in env_indices]
+
+    def env_is_wrapped(
+        self, wrapper_class: type[gym.Wrapper], indices: VecEnvIndices = None
+    ) -> list[bool]:
+        return [False for _ in self._get_indices(indices)]
@@ -0,0 +1,225 @@
+"""Waypoint courses as contiguous arrays, loadable from YAML or CSV files.
+
+A ``Course`` stores gate positions and radii together with the segment
+vectors, segment lengths and cumulative arc length between consecutive
+gates, all precomputed once per course. Progress, distance to the next gate
+and remaining path length are then O(1) lookups per step, independent of
+the number of gates.
+
+Course files list gates in flight order:
+
+YAML::
+
+    name: oval            # optional
+    radius: 1.5           # optional default gate radius (meters)
+    waypoints:
+      - [5.0, 0.0, 3.0]
+      - [10.0, 5.0, 4.0, 2.0]   # optional 4th value: this gate's radius
+
+CSV, with an optional ``x,y,z[,radius]`` header::
+
+    x,y,z,radius
+    5.0,0.0,3.0,1.5
+    10.0,5.0,4.0,2.0
+"""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import yaml
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+COURSE_SUFFIXES = (".yaml", ".yml", ".csv")
+
+
+def arc_lengths(positions: ArrayLike) -> NDArray[np.float64]:
+    """Path length from the first gate to every gate.
+
+    Args:
+        positions: (..., n_gates, 3) gate positions; leading axes are batch axes
+
+    Returns:
+        (..., n_gates) cumulative arc length, 0 at the first gate
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    out = np.zeros(positions.shape[:-1])
+    segment_lengths = np.linalg.norm(np.diff(positions, axis=-2), axis=-1)
+    np.cumsum(segment_lengths, axis=-1, out=out[..., 1:])
+    return out
+
+
+def arc_progress(
+    arc_length: NDArray[np.float64], index: NDArray[np.integer[Any]], n_active: int
+) -> NDArray[np.float64]:
+    """Batched ``Course.progress`` for (batch, n_gates) arc lengths."""
+    last = max(1, n_active) - 1
+    rows = np.arange(len(arc_length))
+    covered = arc_length[rows, np.minimum(index, last)]
+    total = arc_length[:, last]
+    return np.divide(covered, total, out=np.zeros_like(covered), where=total > 0)
+
+
+@dataclass(frozen=True, eq=False)
+class Course:
+    """Gates to fly through in order, with precomputed path geometry.
+
+    Attributes:
+        positions: (n, 3) gate centers (meters)
+        radii: (n,) gate radii; a gate counts as passed within its radius
+        segments: (n, 3) vector from the previous gate to each gate (zero for
+            the first gate)
+        segment_lengths: (n,) length of ``segments``
+        arc_length: (n,) path length from the first gate to each gate
+        name: Course name (file stem for loaded courses)
+    """
+
+    positions: NDArray[np.float64]
+    radii: NDArray[np.float64]
+    segments: NDArray[np.float64]
+    segment_lengths: NDArray[np.float64]
+    arc_length: NDArray[np.float64]
+    name: str = ""
+
+    @classmethod
+    def from_waypoints(
+        cls,
+        positions: ArrayLike,
+        radius: float | ArrayLike = 1.0,
+        name: str = "",
+    ) -> Course:
+        """Build a course from (n, 3) gate positions and scalar or (n,) radii."""
+        positions = np.array(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3 or len(positions) == 0:
+            raise ValueError(
+                f"Course needs (n, 3) gate positions with n >= 1, "
+                f"got shape {positions.shape}"
+            )
+        radii = np.broadcast_to(
+            np.asarray(radius, dtype=np.float64), (len(positions),)
+        ).copy()
+        if np.any(radii <= 0):
+            raise ValueError("Gate radii must be positive")
+        segments = np.zeros_like(positions)
+        segments[1:] = np.diff(positions, axis=0)
+        segment_lengths = np.linalg.norm(segments, axis=1)
+        arc_length = np.cumsum(segment_lengths)
+        for array in (positions, radii, segments, segment_lengths, arc_length):
+            array.flags.writeable = False
+        return cls(positions, radii, segments, segment_lengths, arc_length, name)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @property
+    def total_length(self) -> float:
+        """Path length from the first to the last gate."""
+        return float(self.arc_length[-1])
+
+    def with_positions(self, positions: ArrayLike) -> Course:
+        """Same gates (radii, name) moved to ``positions``, e.g. randomized."""
+        return Course.from_waypoints(positions, self.radii, self.name)
+
+    def progress(self, index: int, n_active: int | None = None) -> float:
+        """Fraction of the path's arc length covered up to gate ``index``.
+
+        0 at the first gate and 1 at the last active gate: gate
+        ``n_active - 1`` when only a prefix of the course is flown
+        (``max_waypoints``).
+        """
+        last = (len(self) if n_active is None else max(1, n_active)) - 1
+        total = self.arc_length[last]
+        if total <= 0:
+            return 0.0
+        return float(self.arc_length[min(index, last)] / total)
+
+    def remaining_length(
+        self, index: int, distance: float, n_active: int | None = None
+    ) -> float:
+        """Path length left: ``distance`` to gate ``index``, then gate to gate.
+
+        Args:
+            index: Next gate to pass
+            distance: Current distance to that gate
+            n_active: Number of gates flown (prefix of the course)
+        """
+        last = (len(self) if n_active is None else max(1, n_active)) - 1
+        if index > last:
+            return 0.0
+        return distance + float(self.arc_length[last] - self.arc_length[index])
+
+
+def load_course(path: str | Path, default_radius: float = 1.0) -> Course:
+    """Load a course from a ``.yaml``/``.yml`` or ``.csv`` file.
+
+    Args:
+        path: Course file (format in the module docstring)
+        default_radius: Radius of gates without one when the file sets none
+
+    Raises:
+        ValueError: On unknown file types or malformed gates
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".yaml", ".yml"):
+        with open(path) as f:
+            data = yaml.safe_load(f)
+        if isinstance(data, dict):
+            rows = data.get("waypoints")
+            default_radius = float(data.get("radius", default_radius))
+            name = str(data.get("name", path.stem))
+        else:
+            rows, name = data, path.stem
+        if not isinstance(rows, list):
+            raise ValueError(f"{path}: expected a list of waypoints")
+    elif suffix == ".csv":
+        rows = _read_csv_rows(path)
+        name = path.stem
+    else:
+        raise ValueError(
+            f"Unsupported course file {path}; expected one of {COURSE_SUFFIXES}"
+        )
+    positions, radii = _parse_rows(rows, default_radius, path)
+    return Course.from_waypoints(positions, radii, name)
+
+
+def _read_csv_rows(path: Path) -> list[list[float]]:
+    """Gate rows of a CSV course, reordered to x, y, z[, radius]."""
+    with open(path, newline="") as f:
+        lines = [line for line in csv.reader(f) if line and line[0].strip()]
+    if not lines:
+        return []
+    header = [cell.strip().lower() for cell in lines[0]]
+    if not {"x", "y", "z"} <= set(header):
+        return [[float(cell) for cell in line] for line in lines]
+    columns = [header.index(axis) for axis in ("x", "y", "z")]
+    if "radius" in header:
+        columns.append(header.index("radius"))
+    return [[float(line[column]) for column in columns] for line in lines[1:]]
+
+
+def _parse_rows(
+    rows: Sequence[Any], default_radius: float, path: Path
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Split ``[x, y, z]`` / ``[x, y, z, radius]`` rows into arrays."""
+    if not rows:
+        raise ValueError(f"{path}: course has no waypoints")
+    positions = np.empty((len(rows), 3))
+    radii = np.full(len(rows), default_radius)
+    for i, row in enumerate(rows):
+        if len(row) not in (3, 4):
+            raise ValueError(
+                f"{path}: waypoint {i} must be [x, y, z] or [x, y, z, radius], "
+                f"got {row}"
+            )
+        positions[i] = row[:3]
+        if len(row) == 4:
+            radii[i] = row[3]
+    return positions, radii
@@ -0,0 +1,236 @@
+"""Precomputed banks of randomized waypoint courses.
+
+A course is the base waypoint path rotated by a yaw about the origin, then
+jittered per axis by up to ``waypoint_noise`` meters (z kept above 0.5 m).
+``generate_courses`` samples any number of courses in one vectorized pass;
+``QuadcopterEnv`` and ``BatchedQuadcopterVecEnv`` use it on reset.
+
+A ``CourseBank`` holds ``n_courses`` courses sampled once from a fixed seed.
+Envs draw courses from it by index, so evaluation can replay exact courses.
+When a bank directory is given, the bank is saved as a ``.npy`` named after
+the hash of everything that shapes it and loaded memory-mapped read-only, so
+all worker processes share one page-cache copy instead of regenerating it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from simhops.logging import log
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+# Minimum waypoint altitude after noise (meters)
+MIN_WAYPOINT_Z = 0.5
+
+# Bump when the sampling procedure changes, so stale bank files are not reused
+COURSE_BANK_VERSION = 1
+
+_BANK_CACHE: dict[str, CourseBank] = {}
+
+
+def generate_courses(
+    base_waypoints: ArrayLike,
+    n_courses: int,
+    waypoint_noise: float,
+    yaw_random: bool,
+    rng: np.random.Generator,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Sample ``n_courses`` rotated and noised copies of ``base_waypoints``.
+
+    Draws all yaws, then all noise, from ``rng`` (nothing is drawn for a
+    disabled randomization).
+
+    Args:
+        base_waypoints: (n_waypoints, 3) unrandomized path
+        n_courses: Number of courses
+        waypoint_noise: +/- meters of uniform noise per axis (0 disables)
+        yaw_random: Rotate each course by a uniform yaw in [0, 2*pi)
+        rng: NumPy random generator
+
+    Returns:
+        (n_courses, n_waypoints, 3) waypoints and (n_courses,) yaws in rad
+    """
+    base = np.asarray(base_waypoints, dtype=np.float64)
+    if yaw_random:
+        yaw = rng.uniform(0.0, 2 * math.pi, size=n_courses)
+    else:
+        yaw = np.zeros(n_courses)
+    cos_yaw = np.cos(yaw)[:, None]
+    sin_yaw = np.sin(yaw)[:, None]
+    waypoints = np.empty((n_courses, *base.shape))
+    waypoints[:, :, 0] = base[:, 0] * cos_yaw - base[:, 1] * sin_yaw
+    waypoints[:, :, 1] = base[:, 0] * sin_yaw + base[:, 1] * cos_yaw
+    waypoints[:, :, 2] = base[:, 2]
+    if waypoint_noise > 0:
+        waypoints += rng.uniform(-waypoint_noise, waypoint_noise, size=waypoints.shape)
+        waypoints[:, :, 2] = np.maximum(waypoints[:, :, 2], MIN_WAYPOINT_Z)
+    return waypoints, yaw
+
+
+def course_bank_key(
+    base_waypoints: ArrayLike,
+    n_courses: int,
+    waypoint_noise: float,
+    yaw_random: bool,
+    seed: int,
+) -> str:
+    """Content hash identifying a course bank."""
+    digest = hashlib.sha256()
+    digest.update(f"v{COURSE_BANK_VERSION}\0{n_courses}\0{seed}\0".encode())
+    digest.update(f"{float(waypoint_noise)!r}\0{bool(yaw_random)}\0".encode())
+    digest.update(np.ascontiguousarray(base_waypoints, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def _bank_dtype(n_waypoints: int) -> np.dtype[Any]:
+    return np.dtype([("yaw", np.float64), ("waypoints", np.float64, (n_waypoints, 3))])
+
+
+class CourseBank:
+    """Fixed set of randomized courses drawn by index.
+
+    Attributes:
+        waypoints: (n_courses, n_waypoints, 3) course waypoints (read-only)
+        yaws: (n_courses,) yaw each course was rotated by (rad)
+        key: Content hash of the bank parameters
+    """
+
+    def __init__(
+        self, waypoints: NDArray[np.float64], yaws: NDArray[np.float64], key: str
+    ) -> None:
+        if len(waypoints) == 0:
+            raise ValueError("CourseBank needs at least one course")
+        if len(waypoints) != len(yaws):
+            raise ValueError(f"Got {len(waypoints)} courses but {len(yaws)} yaws")
+        self.waypoints = waypoints
+        self.yaws = yaws
+        self.key = key
+
+    def __len__(self) -> int:
+        return len(self.waypoints)
+
+    def course(self, index: int) -> tuple[NDArray[np.float64], float]:
+        """(n_waypoints, 3) waypoints (a read-only view) and yaw of a course."""
+        if not 0 <= index < len(self):
+            raise IndexError(
+                f"Course index {index} out of range for a bank of {len(self)}"
+            )
+        return self.waypoints[index], float(self.yaws[index])
+
+    @classmethod
+    def generate(
+        cls,
+        base_waypoints: Sequence[Sequence[float]] | ArrayLike,
+        n_courses: int,
+        waypoint_noise: float,
+        yaw_random: bool,
+        seed: int = 0,
+    ) -> CourseBank:
+        """Sample a bank in memory from ``seed``."""
+        if n_courses < 1:
+            raise ValueError(f"n_courses must be >= 1, got {n_courses}")
+        waypoints, yaws = generate_courses(
+            base_waypoints,
+            n_courses,
+            waypoint_noise,
+            yaw_random,
+            np.random.default_rng(seed),
+        )
+        waypoints.flags.writeable = False
+        yaws.flags.writeable = False
+        key = course_bank_key(
+            base_waypoints, n_courses, waypoint_noise, yaw_random, seed
+        )
+        return cls(waypoints, yaws, key)
+
+    @classmethod
+    def load(
+        cls,
+        base_waypoints: Sequence[Sequence[float]] | ArrayLike,
+        n_courses: int,
+        waypoint_noise: float,
+        yaw_random: bool,
+        seed: int = 0,
+        bank_dir: str | Path | None = None,
+    ) -> CourseBank:
+        """Bank for these parameters, shared within and across processes.
+
+        Banks are kept per process; with ``bank_dir`` they are also saved as
+        ``courses_<key>.npy`` and memory-mapped read-only, so every worker
+        maps the same file.
+
+        Args:
+            base_waypoints: (n_waypoints, 3) unrandomized path
+            n_courses: Number of courses in the bank
+            waypoint_noise: +/- meters of uniform noise per axis
+            yaw_random: Rotate each course by a uniform yaw
+            seed: Seed the courses are sampled from
+            bank_dir: Directory for bank files; None keeps the bank in memory
+        """
+        key = course_bank_key(
+            base_waypoints, n_courses, waypoint_noise, yaw_random, seed
+        )
+        bank = _BANK_CACHE.get(key)
+        if bank is not None:
+            return bank
+        if bank_dir is None:
+            bank = cls.generate(
+                base_waypoints, n_courses, waypoint_noise, yaw_random, seed
+            )
+        else:
+            path = Path(bank_dir) / f"courses_{key}.npy"
+            records = _load_records(path)
+            if records is None:
+                generated = cls.generate(
+                    base_waypoints, n_courses, waypoint_noise, yaw_random, seed
+                )
+                _save_records(path, generated)
+                records = np.load(path, mmap_mode="r")
+            bank = cls(records["waypoints"], records["yaw"], key)
+        _BANK_CACHE[key] = bank
+        return bank
+
+
+def _load_records(path: Path) -> np.ndarray | None:
+    """Memory-map a saved bank, or None if it is missing or unreadable."""
+    if not path.exists():
+        return None
+    try:
+        return np.load(path, mmap_mode="r")
+    except Exception as exc:
+        log(f"[CourseBank] Ignoring unreadable {path}: {exc}")
+        return None
+
+
+def _save_records(path: Path, bank: CourseBank) -> None:
+    """Save ``bank`` as one structured ``.npy`` record per course."""
+    records = np.empty(len(bank), dtype=_bank_dtype(bank.waypoints.shape[1]))
+    records["yaw"] = bank.yaws
+    records["waypoints"] = bank.waypoints
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file and rename so concurrent workers never map a
+    # partially written bank
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, records)
+        os.replace(tmp_name, path)
+    finally:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+    log(f"[CourseBank] Saved {len(bank)} courses to {path}")
+
+
+def clear_course_bank_cache() -> None:
+    """Drop all in-process banks (bank files are kept)."""
+    _BANK_CACHE.clear()
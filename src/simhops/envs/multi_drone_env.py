@@ -0,0 +1,86 @@
+"""VecEnv that advances many drones with one MuJoCo model and one mj_step."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from copy import deepcopy
+
+import mujoco
+import numpy as np
+from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvStepReturn
+
+from simhops.core.model_factory import make_quadcopter_model
+from simhops.core.quadcopter import drone_prefix
+from simhops.core.sensors import refresh_sensordata
+from simhops.envs.quadcopter_env import QuadcopterEnv
+
+
+class MultiDroneVecEnv(DummyVecEnv):
+    """Vectorized ``QuadcopterEnv`` where all drones share one ``MjModel``.
+
+    The model contains one free-floating body per env (drone-drone collisions
+    are excluded), so a single ``mj_step`` advances every drone and the fixed
+    per-call overhead is paid once per physics tick instead of once per env. Each env
+    keeps its own episode logic and reads its drone's slices of
+    qpos/qvel/xfrc_applied. All drones share the physical parameters and
+    physics options of the first env.
+
+    Envs must be unwrapped ``QuadcopterEnv`` instances; wrap the result in
+    ``VecMonitor`` for episode statistics.
+    """
+
+    def __init__(self, env_fns: list[Callable[[], QuadcopterEnv]]) -> None:
+        super().__init__(env_fns)  # type: ignore[arg-type]
+        for env in self.envs:
+            if not isinstance(env, QuadcopterEnv):
+                raise TypeError(
+                    f"MultiDroneVecEnv needs unwrapped QuadcopterEnv, got {type(env)}"
+                )
+        # Every drone uses the physics of the first env
+        self._model, self._data = make_quadcopter_model(
+            num_drones=self.num_envs,
+            **self.envs[0].model_spec(),  # type: ignore[attr-defined]
+        )
+        self._n_substeps = self.envs[0].n_substeps  # type: ignore[attr-defined]
+        for index, env in enumerate(self.envs):
+            prefix = drone_prefix(index) if self.num_envs > 1 else ""
+            env.attach_physics(self._model, self._data, prefix)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        envs: list[QuadcopterEnv] = self.envs  # type: ignore[assignment]
+        for env_idx, env in enumerate(envs):
+            env.apply_action(self.actions[env_idx])
+
+        # Drones whose episode ends mid-step coast through the remaining ticks;
+        # they are reset below, so only their terminal observation sees it
+        active = envs
+        for _ in range(self._n_substeps):
+            for env in active:
+                env.apply_motor_commands()
+            mujoco.mj_step(self._model, self._data)
+            # Sensors are evaluated before integrating; refresh them
+            refresh_sensordata(self._model, self._data)
+            active = [env for env in active if not env.finish_substep()]
+            if not active:
+                break
+
+        # Finish every drone before resetting any, since a reset runs mj_forward
+        results = [env.finish_step() for env in envs]
+        for env_idx, (obs, reward, terminated, truncated, info) in enumerate(results):
+            self.buf_rews[env_idx] = float(reward)
+            self.buf_dones[env_idx] = terminated or truncated
+            info["TimeLimit.truncated"] = truncated and not terminated
+            self.buf_infos[env_idx] = info
+
+            if self.buf_dones[env_idx]:
+                info["terminal_observation"] = obs
+                obs, self.reset_infos[env_idx] = envs[env_idx].reset()
+            self._save_obs(env_idx, obs)
+
+        return (
+            self._obs_from_buf(),
+            np.copy(self.buf_rews),
+            np.copy(self.buf_dones),
+            deepcopy(self.buf_infos),
+        )
@@ -0,0 +1,132 @@
+"""Named layout of the flat observation vector shared by the quadcopter envs."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+
+# Every known observation group and its width, in canonical order. The sensor
+# groups are named after the ``SensorReadings`` fields they come from.
+OBSERVATION_GROUPS: dict[str, int] = {
+    "position": 3,  # world frame, meters (optional, see include_position)
+    "velocity": 3,  # world frame, m/s
+    "orientation": 4,  # quaternion wxyz
+    "acceleration": 3,  # body-frame specific force, m/s^2
+    "angular_velocity": 3,  # body frame, rad/s
+    "relative_waypoint": 3,  # (waypoint - position) / goal_max_distance, clipped
+    "progress": 1,  # path arc length up to the current waypoint / total
+    "distance": 1,  # distance to waypoint / goal_max_distance, capped at 1
+    "speed": 1,  # speed / speed_normalization, capped at 1
+}
+
+SUPPORTED_DTYPES = ("float32", "float64")
+
+
+def observation_dtype(name: str) -> np.dtype[np.floating[Any]]:
+    """NumPy dtype for the ``env.dtype`` config value."""
+    if name not in SUPPORTED_DTYPES:
+        raise ValueError(
+            f"Unsupported observation dtype {name!r}; "
+            f"expected one of {SUPPORTED_DTYPES}"
+        )
+    return np.dtype(name)
+
+
+class ObservationLayout:
+    """Fixed, named slices of a flat observation vector.
+
+    Wrappers, normalizers and loggers should index fields through the layout
+    (``obs[..., layout["velocity"]]``) rather than hard-coded offsets, so
+    groups can be added or dropped without touching them.
+
+    Attributes:
+        groups: Group names in vector order
+        slices: Slice of each group
+        size: Total observation length
+    """
+
+    def __init__(self, groups: Sequence[str]) -> None:
+        unknown = [name for name in groups if name not in OBSERVATION_GROUPS]
+        if unknown:
+            raise ValueError(
+                f"Unknown observation groups {unknown}; "
+                f"expected names from {list(OBSERVATION_GROUPS)}"
+            )
+        if len(set(groups)) != len(groups):
+            raise ValueError(f"Duplicate observation groups in {list(groups)}")
+
+        self.groups = tuple(groups)
+        self.slices: dict[str, slice] = {}
+        offset = 0
+        for name in self.groups:
+            width = OBSERVATION_GROUPS[name]
+            self.slices[name] = slice(offset, offset + width)
+            offset += width
+        self.size = offset
+
+    @classmethod
+    def for_env(cls, include_position: bool) -> ObservationLayout:
+        """Layout used by ``QuadcopterEnv`` and ``BatchedQuadcopterVecEnv``."""
+        groups = list(OBSERVATION_GROUPS)
+        if not include_position:
+            groups.remove("position")
+        return cls(groups)
+
+    def __getitem__(self, name: str) -> slice:
+        return self.slices[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.slices
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"ObservationLayout({list(self.groups)})"
+
+    def new_buffer(
+        self, batch_size: int | None = None, dtype: DTypeLike = np.float64
+    ) -> NDArray[Any]:
+        """Zeroed buffer for one observation, or ``batch_size`` stacked ones."""
+        shape = (self.size,) if batch_size is None else (batch_size, self.size)
+        return np.zeros(shape, dtype=dtype)
+
+    def write(
+        self,
+        values: Mapping[str, ArrayLike],
+        out: NDArray[Any] | None = None,
+    ) -> NDArray[Any]:
+        """Write every group of the layout from ``values`` into ``out``.
+
+        Works for single observations and (batch, size) arrays alike; scalar
+        or (batch,) values fill width-1 groups.
+
+        Args:
+            values: Value per group name; may contain groups not in the layout
+            out: Destination, a new single observation when None
+
+        Returns:
+            ``out``
+        """
+        if out is None:
+            out = self.new_buffer()
+        if out.ndim == 1:
+            for name, dst in self.slices.items():
+                out[dst] = values[name]
+            return out
+        for name, dst in self.slices.items():
+            value = values[name]
+            if OBSERVATION_GROUPS[name] == 1 and np.ndim(value) == 1:
+                value = value[:, None]  # type: ignore[index]
+            out[:, dst] = value
+        return out
+
+    def field(self, obs: NDArray[Any], name: str) -> NDArray[Any]:
+        """View of one group in a single or batched observation."""
+        return obs[..., self.slices[name]]
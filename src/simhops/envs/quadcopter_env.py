@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from typing import Any, SupportsFloat
 
 import gymnasium as gym
@@ -12,18 +13,100 @@ from gymnasium import spaces
 from numpy.typing import NDArray
 
 from simhops.config import Config
-from simhops.core.quadcopter import (
-    Quadcopter,
-    QuadcopterParams,
-    create_quadcopter_model,
+from simhops.config.schema import EnvConfig
+from simhops.core.model_factory import make_quadcopter_model
+from simhops.core.quadcopter import Quadcopter, QuadcopterParams, QuadcopterSnapshot
+from simhops.core.sensors import (
+    SensorModel,
+    SensorNoiseParams,
+    SensorReadings,
+    SensorSnapshot,
+    refresh_sensordata,
 )
-from simhops.core.sensors import SensorModel, SensorNoiseParams, SensorReadings
+from simhops.envs.course import Course, load_course
+from simhops.envs.course_bank import CourseBank, generate_courses
+from simhops.envs.observation import ObservationLayout, observation_dtype
+from simhops.envs.reset_pool import ResetPool
+
+# Verbosity of step/reset info dicts (env.info_mode):
+#   full: scalar diagnostics plus ground-truth state and waypoints every step
+#   episode_end: scalar diagnostics every step, episode summary at the end
+#   none: only events (crash/success) and the episode summary at the end
+INFO_MODES = ("full", "episode_end", "none")
+
+# EnvConfig fields that shape the observation space or the physics model; they
+# cannot change on a live env (see QuadcopterEnv.configure)
+FIXED_ENV_SETTINGS = (
+    "include_position",
+    "dtype",
+    "physics_dt",
+    "control_dt",
+    "integrator",
+)
+
+
+def check_fixed_settings(current: dict[str, Any], env_cfg: EnvConfig) -> None:
+    """Raise if ``env_cfg`` changes any of the ``current`` fixed settings.
+
+    Raises:
+        ValueError: Naming the changed settings
+    """
+    changed = [
+        name for name, value in current.items() if getattr(env_cfg, name) != value
+    ]
+    if changed:
+        raise ValueError(
+            f"Cannot reconfigure {changed} on a live env: they fix the observation "
+            "space or physics model; create a new env instead"
+        )
+
+
+def control_substeps(physics_dt: float, control_dt: float | None) -> int:
+    """Number of physics ticks per policy action.
 
+    Args:
+        physics_dt: MuJoCo timestep in seconds
+        control_dt: Policy period in seconds; None runs the policy every tick
 
-class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
+    Raises:
+        ValueError: If ``control_dt`` is not a positive multiple of ``physics_dt``
+    """
+    if control_dt is None:
+        return 1
+    n_substeps = round(control_dt / physics_dt)
+    if n_substeps < 1 or abs(n_substeps * physics_dt - control_dt) > 1e-9:
+        raise ValueError(
+            f"control_dt ({control_dt}) must be a positive multiple of "
+            f"physics_dt ({physics_dt})"
+        )
+    return n_substeps
+
+
+@dataclass
+class EnvSnapshot:
+    """Full restorable state of a ``QuadcopterEnv`` between steps."""
+
+    quad: QuadcopterSnapshot
+    sensor: SensorSnapshot
+    course: Course
+    waypoint_yaw: float
+    current_waypoint_idx: int
+    max_waypoints_effective: int
+    episode_step: int
+    total_reward: float
+    prev_distance: float | None
+    episode_speed_sum: float
+    episode_speed_steps: int
+    episode_max_tilt: float
+    time_to_first_wp: int | None
+    course_index: int | None = None
+
+
+class QuadcopterEnv(gym.Env[NDArray[np.floating[Any]], NDArray[np.floating[Any]]]):
     """Gymnasium environment for quadcopter waypoint path following.
 
-    The goal is to navigate through a 10-waypoint base path as quickly as possible.
+    The goal is to navigate through a waypoint course as quickly as possible: the
+    built-in 10-waypoint path or any number of gates loaded from ``course_file``.
     The base path can be rotated around the origin each episode to avoid overfitting.
 
     Observation space (19 or 22 dimensions):
@@ -32,7 +115,7 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         - Body acceleration (3): body frame [ax, ay, az]
         - Body angular velocity (3): body frame [wx, wy, wz]
         - Relative waypoint (3): normalized to [-1, 1] (direction to goal)
-        - Waypoint progress (1): 0 = first waypoint, 1 = last waypoint
+        - Waypoint progress (1): arc length covered, 0 = first waypoint, 1 = last
         - Distance to waypoint (1): normalized 0 = at target, 1 = far (>=goal_max_distance)
         - Speed (1): normalized 0 = stopped, 1 = fast (>=5 m/s)
         - Optional global position (3): included only if include_position=True
@@ -53,7 +136,8 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
 
     metadata = {"render_modes": ["human", "rgb_array"], "render_fps": 30}
 
-    # Fixed 10-waypoint path - an expanded course with wider spread and varied heights
+    # Default 10-waypoint path (env.course_file replaces it) - an expanded course
+    # with wider spread and varied heights
     # Each waypoint can be randomized by +/- waypoint_noise meters on reset
     FIXED_WAYPOINTS: list[tuple[float, float, float]] = [
         (5.5, 0.0, 3.3),  # 1: Forward
@@ -92,6 +176,13 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         quad_params: QuadcopterParams | None = None,
         sensor_params: SensorNoiseParams | None = None,
         add_sensor_noise: bool | None = None,
+        copy_observations: bool = True,  # False: step() reuses one obs buffer
+        info_mode: str | None = None,  # See INFO_MODES
+        course_file: str | None = None,  # YAML/CSV course instead of FIXED_WAYPOINTS
+        physics_dt: float | None = None,  # MuJoCo timestep (s)
+        control_dt: float | None = None,  # Policy period (s), multiple of physics_dt
+        integrator: str | None = None,  # MuJoCo integrator name
+        dtype: str | None = None,  # Observation/action dtype (see env.dtype)
     ) -> None:
         super().__init__()
 
@@ -99,11 +190,13 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         env_cfg = cfg.env
 
         self.render_mode = render_mode
-        self.num_waypoints = len(self.FIXED_WAYPOINTS)  # Always 10
-        self._max_waypoints_effective = self.num_waypoints
         self.waypoint_radius = (
             waypoint_radius if waypoint_radius is not None else env_cfg.waypoint_radius
         )
+        self.course_file = (
+            course_file if course_file is not None else env_cfg.course_file
+        )
+        self._load_base_course()
         self.waypoint_noise = (
             waypoint_noise if waypoint_noise is not None else env_cfg.waypoint_noise
         )
@@ -165,6 +258,11 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             if start_position_noise is not None
             else env_cfg.start_position_noise
         )
+        self.info_mode = info_mode if info_mode is not None else env_cfg.info_mode
+        if self.info_mode not in INFO_MODES:
+            raise ValueError(
+                f"Unknown info_mode {self.info_mode!r}; expected one of {INFO_MODES}"
+            )
         self._speed_normalization = env_cfg.speed_normalization
         self._bounds_margin = env_cfg.bounds_margin
         self._ground_threshold = env_cfg.ground_threshold
@@ -180,6 +278,7 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             inertia=quad_defaults.inertia,
             drag_coeff=quad_defaults.drag_coeff,
             motor_time_constant=quad_defaults.motor_time_constant,
+            frame=quad_defaults.frame,
         )
         self._sensor_params = sensor_params or SensorNoiseParams(
             accel_noise_std=sensor_defaults.accel_noise_std,
@@ -190,10 +289,24 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             gyro_bias_time_constant=sensor_defaults.gyro_bias_time_constant,
             position_noise_std=sensor_defaults.position_noise_std,
             velocity_noise_std=sensor_defaults.velocity_noise_std,
+            position_rate=sensor_defaults.position_rate,
+            velocity_rate=sensor_defaults.velocity_rate,
+            orientation_rate=sensor_defaults.orientation_rate,
+            imu_rate=sensor_defaults.imu_rate,
+            position_delay=sensor_defaults.position_delay,
+            velocity_delay=sensor_defaults.velocity_delay,
+            orientation_delay=sensor_defaults.orientation_delay,
+            imu_delay=sensor_defaults.imu_delay,
         )
 
-        # Physics timestep (100 Hz)
-        self.dt = env_cfg.timestep
+        # Physics runs at physics_dt; the policy acts every control_dt (self.dt),
+        # holding its action for n_substeps physics ticks
+        self.physics_dt = physics_dt if physics_dt is not None else env_cfg.physics_dt
+        self.control_dt = control_dt if control_dt is not None else env_cfg.control_dt
+        self.n_substeps = control_substeps(self.physics_dt, self.control_dt)
+        self.dt = self.physics_dt * self.n_substeps
+        self._integrator = integrator if integrator is not None else env_cfg.integrator
+        self._model_cache_dir = env_cfg.model_cache_dir
 
         # MuJoCo setup
         self._model: mujoco.MjModel | None = None
@@ -201,10 +314,20 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         self._quad: Quadcopter | None = None
         self._sensor: SensorModel | None = None
         self._renderer: mujoco.Renderer | None = None
-
-        # Episode state
-        self._waypoints: list[NDArray[np.float64]] = []
+        self._drone_prefix: str = ""
+        self._reset_pool_size = env_cfg.reset_pool_size
+        self._reset_pool: ResetPool | None = None
+        self._course_bank_size = env_cfg.course_bank_size
+        self._course_bank_seed = env_cfg.course_bank_seed
+        self._course_bank_dir = env_cfg.course_bank_dir
+        self._course_bank: CourseBank | None = None
+
+        # Episode state; _waypoints is the (read-only) position array of _course
+        self._course: Course = self.base_course
+        self._waypoints: NDArray[np.float64] = self._course.positions
         self._waypoint_yaw: float = 0.0
+        self._course_index: int | None = None  # bank course of this episode
+        self._requested_course: int | None = None
         self._current_waypoint_idx: int = 0
         self._episode_step: int = 0
         self._total_reward: float = 0.0
@@ -215,14 +338,36 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         self._time_to_first_wp: int | None = None
         self._has_been_seeded: bool = False
 
-        # Observation space: sensor readings + waypoint info
-        base_obs_dim = SensorReadings.observation_size() + 6
-        obs_dim = base_obs_dim if self.include_position else base_obs_dim - 3
+        # Per-control-step accumulators (see apply_action / finish_substep)
+        self._scaled_action: NDArray[np.float64] = np.zeros(4)
+        self._step_reward: float = 0.0
+        self._step_terminated: bool = False
+        self._step_waypoint_reached: bool = False
+        self._step_distance: float = 0.0
+        self._step_path_remaining: float = 0.0
+        self._step_speed: float = 0.0
+        self._step_events: dict[str, Any] = {}
+
+        # Observation space: sensor readings + waypoint info, written group by
+        # group into a preallocated buffer. Observations and actions use
+        # env.dtype at the boundary; physics stays float64.
+        self.dtype = observation_dtype(dtype if dtype is not None else env_cfg.dtype)
+        # Values this env was built with (arguments or config), see configure
+        self._fixed_settings: dict[str, Any] = {
+            "include_position": self.include_position,
+            "dtype": self.dtype.name,
+            "physics_dt": self.physics_dt,
+            "control_dt": self.control_dt,
+            "integrator": self._integrator,
+        }
+        self.observation_layout = ObservationLayout.for_env(self.include_position)
+        self.copy_observations = copy_observations
+        self._obs_buffer = self.observation_layout.new_buffer(dtype=self.dtype)
         self.observation_space = spaces.Box(
             low=-np.inf,
             high=np.inf,
-            shape=(obs_dim,),
-            dtype=np.float64,
+            shape=(self.observation_layout.size,),
+            dtype=self.dtype,
         )
 
         # Action space: [throttle, roll_rate, pitch_rate, yaw_rate]
@@ -230,22 +375,112 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             low=-1.0,
             high=1.0,
             shape=(4,),
-            dtype=np.float64,
+            dtype=self.dtype,
         )
 
+    def _load_base_course(self) -> None:
+        """Load the unrandomized course (``course_file`` or ``FIXED_WAYPOINTS``).
+
+        ``waypoint_radius`` is the radius of gates whose file sets none.
+        """
+        if self.course_file is not None:
+            self.base_course = load_course(self.course_file, self.waypoint_radius)
+        else:
+            self.base_course = Course.from_waypoints(
+                self.FIXED_WAYPOINTS, self.waypoint_radius, name="default"
+            )
+        self.num_waypoints = len(self.base_course)
+        self._max_waypoints_effective = self.num_waypoints
+
+    def configure(self, env_cfg: EnvConfig) -> None:
+        """Apply a new env config without rebuilding the env.
+
+        Updates every setting a curriculum stage can change (course and its
+        randomization, ``max_waypoints``, ``action_scale``, episode length,
+        start randomization, termination limits, sensor noise, ``info_mode``)
+        so worker pools can be reused across stages. The physics model,
+        quadcopter and sensor model are kept. Changes take effect from the
+        next reset, which rebuilds the reset pool; reset the env after
+        configuring it.
+
+        Args:
+            env_cfg: Full env config, e.g. a curriculum stage's
+
+        Raises:
+            ValueError: If a ``FIXED_ENV_SETTINGS`` field differs, or for an
+                unknown ``info_mode``
+        """
+        check_fixed_settings(self._fixed_settings, env_cfg)
+        if env_cfg.info_mode not in INFO_MODES:
+            raise ValueError(
+                f"Unknown info_mode {env_cfg.info_mode!r}; expected one of {INFO_MODES}"
+            )
+        self.info_mode = env_cfg.info_mode
+        self.waypoint_radius = env_cfg.waypoint_radius
+        self.waypoint_noise = env_cfg.waypoint_noise
+        self.waypoint_yaw_random = env_cfg.waypoint_yaw_random
+        self.max_episode_steps = env_cfg.max_episode_steps
+        self.arena_size = env_cfg.arena_size
+        self.max_altitude = env_cfg.max_altitude
+        self.max_tilt_angle = env_cfg.max_tilt_angle
+        self.disable_tilt_termination = env_cfg.disable_tilt_termination
+        self.goal_max_distance = env_cfg.goal_max_distance
+        self.random_start_waypoint = env_cfg.random_start_waypoint
+        self.max_waypoints = env_cfg.max_waypoints
+        self.add_sensor_noise = env_cfg.add_sensor_noise
+        self.action_scale = env_cfg.action_scale
+        self.random_start_position = env_cfg.random_start_position
+        self.start_position_noise = env_cfg.start_position_noise
+        self._speed_normalization = env_cfg.speed_normalization
+        self._bounds_margin = env_cfg.bounds_margin
+        self._ground_threshold = env_cfg.ground_threshold
+        self._model_cache_dir = env_cfg.model_cache_dir
+        self.course_file = env_cfg.course_file
+        self._load_base_course()
+        self._course_bank_size = env_cfg.course_bank_size
+        self._course_bank_seed = env_cfg.course_bank_seed
+        self._course_bank_dir = env_cfg.course_bank_dir
+        self._course_bank = None  # banks depend on the course and its noise
+        self._reset_pool_size = env_cfg.reset_pool_size
+        self._reset_pool = None  # start states depend on the new settings
+
     def _setup_physics(self) -> None:
-        """Initialize MuJoCo model and data."""
-        self._model, self._data = create_quadcopter_model()
+        """Initialize MuJoCo model and data from the model cache."""
+        self._model, self._data = make_quadcopter_model(**self.model_spec())
+
+    def model_spec(self) -> dict[str, Any]:
+        """Keyword arguments for ``make_quadcopter_model`` matching this env."""
+        return {
+            "params": self._quad_params,
+            "timestep": self.physics_dt,
+            "integrator": self._integrator,
+            "cache_dir": self._model_cache_dir,
+        }
+
+    def attach_physics(
+        self, model: mujoco.MjModel, data: mujoco.MjData, prefix: str
+    ) -> None:
+        """Drive one drone of a shared multi-drone model instead of owning one.
 
-        # Ensure timestep matches our desired dt
-        self._model.opt.timestep = self.dt
+        The caller owns ``mj_step``: call ``apply_action`` once per control
+        step, then for each of ``n_substeps`` ticks ``apply_motor_commands``,
+        one ``mj_step`` advancing every drone, ``refresh_sensordata`` (so
+        sensordata matches the new state) and ``finish_substep``, and finally
+        ``finish_step``.
+        """
+        model.opt.timestep = self.physics_dt
+        self._model = model
+        self._data = data
+        self._drone_prefix = prefix
+        self._quad = None
+        self._reset_pool = None  # snapshots depend on the model layout
 
     def _generate_waypoints(
         self, rng: np.random.Generator
-    ) -> tuple[list[NDArray[np.float64]], float]:
+    ) -> tuple[NDArray[np.float64], float]:
         """Generate waypoints with optional randomization.
 
-        Returns the fixed waypoint path with random yaw rotation applied first,
+        Returns the base course with random yaw rotation applied first,
         then noise added to each point. Noise is uniformly sampled from
         [-waypoint_noise, +waypoint_noise] for each axis (x, y, z), with z
         clamped to stay above ground. Rotation is disabled when
@@ -255,38 +490,49 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             rng: NumPy random generator
 
         Returns:
-            List of waypoint positions as numpy arrays and the applied yaw (rad)
+            (n, 3) waypoint positions and the applied yaw (rad)
         """
-        yaw = float(rng.uniform(0.0, 2 * math.pi)) if self.waypoint_yaw_random else 0.0
-        cos_yaw = math.cos(yaw)
-        sin_yaw = math.sin(yaw)
-
-        waypoints = []
-        for base_wp in self.FIXED_WAYPOINTS:
-            wp = np.array(base_wp, dtype=np.float64)
-
-            rotated_xy = np.array(
-                [
-                    wp[0] * cos_yaw - wp[1] * sin_yaw,
-                    wp[0] * sin_yaw + wp[1] * cos_yaw,
-                ]
-            )
-            wp[:2] = rotated_xy
+        waypoints, yaws = generate_courses(
+            self.base_course.positions,
+            1,
+            self.waypoint_noise,
+            self.waypoint_yaw_random,
+            rng,
+        )
+        return waypoints[0], float(yaws[0])
 
-            # Add random noise if waypoint_noise > 0
-            if self.waypoint_noise > 0:
-                noise = rng.uniform(-self.waypoint_noise, self.waypoint_noise, size=3)
-                wp = wp + noise
+    @property
+    def course_bank(self) -> CourseBank | None:
+        """Course bank episodes draw from (``env.course_bank_size`` > 0).
 
-                # Ensure z stays above minimum height (0.5m)
-                wp[2] = max(wp[2], 0.5)
+        Loaded on first use; banks with equal parameters are shared by all
+        envs in a process and, with ``env.course_bank_dir``, across processes.
+        """
+        if self._course_bank is None and self._course_bank_size > 0:
+            self._course_bank = CourseBank.load(
+                self.base_course.positions,
+                self._course_bank_size,
+                self.waypoint_noise,
+                self.waypoint_yaw_random,
+                seed=self._course_bank_seed,
+                bank_dir=self._course_bank_dir,
+            )
+        return self._course_bank
 
-            waypoints.append(wp)
+    def _get_observation(
+        self,
+        sensor_readings: SensorReadings,
+        out: NDArray[np.floating[Any]] | None = None,
+    ) -> NDArray[np.floating[Any]]:
+        """Write the observation for the sensor readings into ``out``.
 
-        return waypoints, yaw
+        Args:
+            sensor_readings: Current (noisy) readings
+            out: Destination buffer; a new ``dtype`` array when None
 
-    def _get_observation(self, sensor_readings: SensorReadings) -> NDArray[np.float64]:
-        """Construct observation from sensor readings and waypoint info."""
+        Returns:
+            ``out``, laid out by ``observation_layout``
+        """
         # Current waypoint relative position
         # If all waypoints completed, use last waypoint
         wp_idx = min(self._current_waypoint_idx, self.num_waypoints - 1)
@@ -308,66 +554,126 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         speed = float(np.linalg.norm(sensor_readings.velocity))
         speed_normalized = min(speed / self._speed_normalization, 1.0)
 
-        # Normalized waypoint progress (0 = first waypoint, 1 = last waypoint)
-        max_waypoints = max(1, self._max_waypoints_effective)
-        progress = min(self._current_waypoint_idx, max_waypoints - 1) / max(
-            1, max_waypoints - 1
+        # Arc-length progress along the path (0 = first waypoint, 1 = last)
+        progress = self._course.progress(
+            self._current_waypoint_idx, self._max_waypoints_effective
         )
 
-        # Build sensor observation (optionally exclude position)
-        if self.include_position:
-            sensor_obs = sensor_readings.to_array()
-        else:
-            sensor_obs = np.concatenate(
-                [
-                    sensor_readings.velocity,
-                    sensor_readings.orientation,
-                    sensor_readings.acceleration,
-                    sensor_readings.angular_velocity,
-                ]
-            )
-
-        # Combine all observations
-        obs = np.concatenate(
-            [
-                sensor_obs,
-                relative_wp_normalized,
-                np.array([progress]),
-                np.array([distance_normalized]),
-                np.array([speed_normalized]),
-            ]
+        if out is None:
+            out = self.observation_layout.new_buffer(dtype=self.dtype)
+        # Groups missing from the layout (e.g. position) are skipped
+        return self.observation_layout.write(
+            {
+                "position": sensor_readings.position,
+                "velocity": sensor_readings.velocity,
+                "orientation": sensor_readings.orientation,
+                "acceleration": sensor_readings.acceleration,
+                "angular_velocity": sensor_readings.angular_velocity,
+                "relative_waypoint": relative_wp_normalized,
+                "progress": progress,
+                "distance": distance_normalized,
+                "speed": speed_normalized,
+            },
+            out,
         )
 
-        return obs
-
     def reset(
         self,
         *,
         seed: int | None = None,
         options: dict[str, Any] | None = None,
-    ) -> tuple[NDArray[np.float64], dict[str, Any]]:
-        """Reset the environment."""
-        # Only seed on first reset to allow RNG to advance between episodes
-        # This ensures waypoint_yaw_random produces different yaws each reset
-        # If waypoint_yaw_random is disabled, we can reseed each reset for determinism
-        if not self._has_been_seeded:
+    ) -> tuple[NDArray[np.floating[Any]], dict[str, Any]]:
+        """Reset the environment.
+
+        With a course bank, ``options={"course_index": i}`` starts a fresh
+        episode on bank course ``i`` (bypassing the reset pool), so evaluation
+        can map episode seeds to exact courses.
+        """
+        self._requested_course = (options or {}).get("course_index")
+        if self._requested_course is not None and self.course_bank is None:
+            raise ValueError("course_index needs env.course_bank_size > 0")
+
+        # Seed on the first reset and whenever a seed is given (e.g. one per
+        # evaluation episode); unseeded resets let the RNG continue its
+        # sequence, so waypoint_yaw_random produces different yaws each reset
+        if seed is not None or not self._has_been_seeded:
             super().reset(seed=seed)
             self._has_been_seeded = True
-        elif self.waypoint_yaw_random:
-            # Don't pass seed to allow RNG to continue its sequence for randomization
-            super().reset(seed=None)
+
+        # Quadcopter and SensorModel are built once and reused across episodes
+        self._ensure_simulation()
+        assert self._sensor is not None
+        assert self._quad is not None
+        self._sensor.reset(seed)
+
+        if self._reset_pool_size > 0 and self._requested_course is None:
+            if self._reset_pool is None:
+                self._reset_pool = ResetPool.build(self, self._reset_pool_size)
+            self._reset_pool.restore_random(self)
         else:
-            # If randomization is disabled, we can reseed for determinism
-            super().reset(seed=seed)
+            self._start_episode()
+
+        sensor_readings = self._sensor.get_readings(
+            self._data, self.dt, add_noise=self.add_sensor_noise
+        )
+        obs = self._get_observation(sensor_readings)
+
+        info: dict[str, Any] = {
+            "waypoint_yaw": self._waypoint_yaw,
+            "current_waypoint_idx": self._current_waypoint_idx,
+            "max_waypoints": self._max_waypoints_effective,
+        }
+        if self._course_index is not None:
+            info["course_index"] = self._course_index
+        if self.info_mode == "full":
+            info["waypoints"] = self._waypoints.copy()
+
+        return obs, info
+
+    def get_ground_truth(self) -> dict[str, Any]:
+        """True drone state and course, independent of ``info_mode``.
+
+        Returns copies, so the result stays valid after further steps. Use it
+        for evaluation and visualization when step infos are lean; through a
+        VecEnv, call ``env_method("get_ground_truth")``.
+        """
+        assert self._quad is not None
+        state = self._quad.kinematics
+        return {
+            "position": state.position.copy(),
+            "velocity": state.velocity.copy(),
+            "orientation": state.orientation.copy(),
+            "angular_velocity": state.angular_velocity.copy(),
+            "waypoints": self._waypoints.copy(),
+            "current_waypoint_idx": self._current_waypoint_idx,
+            "waypoint_yaw": self._waypoint_yaw,
+            "course_index": self._course_index,
+        }
 
-        # Initialize physics if needed
+    def _ensure_simulation(self) -> None:
+        """Create the physics model, quadcopter and sensor model if missing."""
         if self._model is None:
             self._setup_physics()
-
         assert self._model is not None
         assert self._data is not None
 
-        # Create quadcopter wrapper
+        if self._sensor is None:
+            self._sensor = SensorModel(params=self._sensor_params)
+        if self._quad is None:
+            self._quad = Quadcopter(
+                self._model,
+                self._data,
+                params=self._quad_params,
+                prefix=self._drone_prefix,
+            )
+            # Sensordata addresses depend on the model and drone prefix
+            self._sensor.bind(self._model, self._drone_prefix)
+
+    def _start_episode(self) -> None:
+        """Sample a start position and waypoints and reset the drone."""
+        assert self._quad is not None
+        assert self.np_random is not None
+
         start_pos = np.array([0.0, 0.0, 1.0])
         if self.random_start_position and self.start_position_noise > 0:
             start_pos = start_pos + self.np_random.uniform(
@@ -378,19 +684,19 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             jitter = self._ground_threshold + 0.1
             start_pos = start_pos + self.np_random.uniform(-jitter, jitter, size=3)
             start_pos[2] = max(start_pos[2], self._ground_threshold + 0.1)
-        self._quad = Quadcopter(
-            self._model,
-            self._data,
-            params=self._quad_params,
-            start_position=start_pos,
-        )
-
-        # Create sensor model
-        self._sensor = SensorModel(params=self._sensor_params, seed=seed)
 
-        # Generate fixed waypoints
-        assert self.np_random is not None
-        self._waypoints, self._waypoint_yaw = self._generate_waypoints(self.np_random)
+        # Draw the course from the bank, or generate a fresh one
+        bank = self.course_bank
+        if bank is not None:
+            index = self._requested_course
+            if index is None:
+                index = int(self.np_random.integers(len(bank)))
+            waypoints, self._waypoint_yaw = bank.course(index)
+            self._course_index = index
+        else:
+            waypoints, self._waypoint_yaw = self._generate_waypoints(self.np_random)
+            self._course_index = None
+        self._set_course(self.base_course.with_positions(waypoints))
         max_waypoints = (
             self.max_waypoints if self.max_waypoints is not None else self.num_waypoints
         )
@@ -409,94 +715,144 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         self._time_to_first_wp = None
 
         # Reset quadcopter
-        state = self._quad.reset()
-        sensor_readings = self._sensor.get_readings(
-            state, self.dt, add_noise=self.add_sensor_noise
+        self._quad.reset(position=start_pos)
+
+    def _set_course(self, course: Course) -> None:
+        """Make ``course`` the course of the current episode."""
+        self._course = course
+        self._waypoints = course.positions
+
+    def snapshot(self) -> EnvSnapshot:
+        """Capture physics, motor-lag, sensor and episode state.
+
+        Take snapshots between steps (after ``reset`` or ``step``). Restoring
+        one with ``restore_snapshot`` resumes the episode exactly, so it can be
+        used to branch several rollouts from one mid-episode state.
+        """
+        assert self._quad is not None
+        assert self._sensor is not None
+        return EnvSnapshot(
+            quad=self._quad.snapshot(),
+            sensor=self._sensor.snapshot(),
+            course=self._course,
+            waypoint_yaw=self._waypoint_yaw,
+            current_waypoint_idx=self._current_waypoint_idx,
+            max_waypoints_effective=self._max_waypoints_effective,
+            episode_step=self._episode_step,
+            total_reward=self._total_reward,
+            prev_distance=self._prev_distance,
+            episode_speed_sum=self._episode_speed_sum,
+            episode_speed_steps=self._episode_speed_steps,
+            episode_max_tilt=self._episode_max_tilt,
+            time_to_first_wp=self._time_to_first_wp,
+            course_index=self._course_index,
         )
-        obs = self._get_observation(sensor_readings)
 
-        info = {
-            "waypoints": self._waypoints.copy(),
-            "waypoint_yaw": self._waypoint_yaw,
-            "current_waypoint_idx": self._current_waypoint_idx,
-            "max_waypoints": max_waypoints,
-        }
+    def restore_snapshot(
+        self, snapshot: EnvSnapshot, restore_rng: bool = True
+    ) -> None:
+        """Restore a state captured by ``snapshot``.
 
-        return obs, info
+        Args:
+            snapshot: Env state to resume from
+            restore_rng: Also rewind the sensor noise RNG so the continuation
+                replays identically; False draws fresh noise
+        """
+        self._ensure_simulation()
+        assert self._quad is not None
+        assert self._sensor is not None
+
+        self._quad.restore(snapshot.quad)
+        self._sensor.restore(snapshot.sensor, restore_rng=restore_rng)
+        self._set_course(snapshot.course)
+        self._waypoint_yaw = snapshot.waypoint_yaw
+        self._current_waypoint_idx = snapshot.current_waypoint_idx
+        self._max_waypoints_effective = snapshot.max_waypoints_effective
+        self._episode_step = snapshot.episode_step
+        self._total_reward = snapshot.total_reward
+        self._prev_distance = snapshot.prev_distance
+        self._episode_speed_sum = snapshot.episode_speed_sum
+        self._episode_speed_steps = snapshot.episode_speed_steps
+        self._episode_max_tilt = snapshot.episode_max_tilt
+        self._time_to_first_wp = snapshot.time_to_first_wp
+        self._course_index = snapshot.course_index
 
     def step(
         self, action: NDArray[np.float64]
-    ) -> tuple[NDArray[np.float64], SupportsFloat, bool, bool, dict[str, Any]]:
-        """Execute one step in the environment."""
-        assert self._quad is not None
-        assert self._sensor is not None
+    ) -> tuple[NDArray[np.floating[Any]], SupportsFloat, bool, bool, dict[str, Any]]:
+        """Execute one control step (``n_substeps`` physics ticks)."""
         assert self._model is not None
         assert self._data is not None
 
+        self.apply_action(action)
+        for _ in range(self.n_substeps):
+            self.apply_motor_commands()
+            mujoco.mj_step(self._model, self._data)
+            # mj_step evaluates sensors before integrating; refresh them for
+            # the state the tick ended in
+            refresh_sensordata(self._model, self._data)
+            if self.finish_substep():
+                break
+
+        return self.finish_step()
+
+    def apply_action(self, action: NDArray[np.float64]) -> None:
+        """Latch a policy action for the next control step."""
         self._episode_step += 1
+        self._scaled_action = np.asarray(action, dtype=np.float64) * self.action_scale
 
-        # Apply action
-        scaled_action = action * self.action_scale
-        self._quad.apply_action(scaled_action, self.dt)
+        self._step_reward = 0.0
+        self._step_terminated = False
+        self._step_waypoint_reached = False
+        self._step_events = {}
 
-        # Step physics
-        mujoco.mj_step(self._model, self._data)
+    def apply_motor_commands(self) -> None:
+        """Advance the motor lag by one physics tick toward the latched action."""
+        assert self._quad is not None
+        self._quad.apply_action(self._scaled_action, self.physics_dt)
 
-        # Get state and sensor readings
-        state = self._quad.get_state()
-        sensor_readings = self._sensor.get_readings(
-            state, self.dt, add_noise=self.add_sensor_noise
-        )
+    def finish_substep(self) -> bool:
+        """Accumulate reward and check terminations after one physics tick.
+
+        Returns:
+            True once the episode has terminated; remaining ticks are skipped.
+        """
+        assert self._quad is not None
+        assert self._sensor is not None
+
+        self._quad.invalidate_kinematics()
+        self._sensor.tick(self._data, self.add_sensor_noise)
+        state = self._quad.kinematics
 
         # Current waypoint
         current_wp = self._waypoints[self._current_waypoint_idx]
+        radius = float(self._course.radii[self._current_waypoint_idx])
 
         # Distance and speed
         distance = float(np.linalg.norm(state.position - current_wp))
         speed = float(np.linalg.norm(state.velocity))
+        self._step_distance = distance
+        self._step_speed = speed
+        self._step_path_remaining = self._course.remaining_length(
+            self._current_waypoint_idx, distance, self._max_waypoints_effective
+        )
 
         self._episode_speed_sum += speed
         self._episode_speed_steps += 1
 
-        tilt = self._quad.get_tilt_angle()
+        tilt = state.tilt
         if tilt > self._episode_max_tilt:
             self._episode_max_tilt = tilt
 
         # Check if passed through waypoint (simple radius check)
-        waypoint_reached = distance < self.waypoint_radius
+        waypoint_reached = distance < radius
+        self._step_waypoint_reached |= waypoint_reached
 
         # Calculate reward
-        reward = self._compute_reward(distance, speed, waypoint_reached)
-        self._total_reward += float(reward)
-
-        max_waypoints = self._max_waypoints_effective
+        reward = self._compute_reward(distance, speed, waypoint_reached, radius)
 
-        # Check termination conditions
         terminated = False
-        truncated = False
-        mean_speed = (
-            self._episode_speed_sum / self._episode_speed_steps
-            if self._episode_speed_steps > 0
-            else 0.0
-        )
-
-        info: dict[str, Any] = {
-            "distance": distance,
-            "speed": speed,
-            "mean_speed": mean_speed,
-            "max_tilt_deg": math.degrees(self._episode_max_tilt),
-            "time_to_first_wp": self._time_to_first_wp,
-            "current_waypoint_idx": self._current_waypoint_idx,
-            "max_waypoints": max_waypoints,
-            "waypoint_reached": waypoint_reached,
-            "episode_step": self._episode_step,
-            "waypoint_yaw": self._waypoint_yaw,
-            # Ground truth for visualization (passed through info dict)
-            "position": state.position.copy(),
-            "velocity": state.velocity.copy(),
-            "orientation": state.orientation.copy(),
-            "waypoints": self._waypoints,
-        }
+        events = self._step_events
 
         # Waypoint reached - advance to next
         if waypoint_reached:
@@ -505,7 +861,7 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
             if self._time_to_first_wp is None:
                 self._time_to_first_wp = self._episode_step
 
-            if self._current_waypoint_idx >= max_waypoints:
+            if self._current_waypoint_idx >= self._max_waypoints_effective:
                 # All waypoints completed! Big time bonus
                 terminated = True
                 # Bonus inversely proportional to time taken
@@ -515,20 +871,21 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
                     / self._reward_cfg.completion_time_divisor,
                 )
                 reward += self._reward_cfg.path_complete_bonus + time_bonus
-                info["success"] = True
-                info["completion_steps"] = self._episode_step
+                events["success"] = True
+                events["completion_steps"] = self._episode_step
 
         # Check for crash (ground collision or excessive tilt)
-        if self._quad.check_collision():
+        collision_group = self._quad.collision_group()
+        if collision_group is not None:
             terminated = True
             reward -= self._reward_cfg.collision_penalty
-            info["crash"] = "collision"
+            events["crash"] = "collision"
+            events["collision_group"] = collision_group
 
-        tilt = self._quad.get_tilt_angle()
         if tilt > self.max_tilt_angle and not self.disable_tilt_termination:
             terminated = True
             reward -= self._reward_cfg.tilt_penalty
-            info["crash"] = "excessive_tilt"
+            events["crash"] = "excessive_tilt"
 
         # Check bounds (generous margins beyond waypoint area)
         pos = state.position
@@ -540,20 +897,74 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         ):
             terminated = True
             reward -= self._reward_cfg.out_of_bounds_penalty
-            info["crash"] = "out_of_bounds"
+            events["crash"] = "out_of_bounds"
+
+        self._step_reward += reward
+        self._total_reward += reward
+        self._step_terminated = terminated
+        return terminated
 
-        # Check time limit
-        if self._episode_step >= self.max_episode_steps:
-            truncated = True
+    def finish_step(
+        self,
+    ) -> tuple[NDArray[np.floating[Any]], SupportsFloat, bool, bool, dict[str, Any]]:
+        """Compute observation and info after the control step's physics ticks."""
+        assert self._quad is not None
+        assert self._sensor is not None
+
+        # Sensor readings (views, valid until the next reading)
+        sensor_readings = self._sensor.get_readings(
+            self._data, self.dt, add_noise=self.add_sensor_noise
+        )
+
+        terminated = self._step_terminated
+        # Check time limit (counted in control steps)
+        truncated = self._episode_step >= self.max_episode_steps
+
+        # Info verbosity follows info_mode; every mode reports the episode
+        # summary once the episode ends, which is all the callbacks read
+        info: dict[str, Any] = {}
+        if self.info_mode != "none":
+            info["distance"] = self._step_distance
+            info["path_remaining"] = self._step_path_remaining
+            info["speed"] = self._step_speed
+            info["current_waypoint_idx"] = self._current_waypoint_idx
+            info["waypoint_reached"] = self._step_waypoint_reached
+            info["episode_step"] = self._episode_step
+        if self.info_mode == "full" or terminated or truncated:
+            mean_speed = (
+                self._episode_speed_sum / self._episode_speed_steps
+                if self._episode_speed_steps > 0
+                else 0.0
+            )
+            info["distance"] = self._step_distance
+            info["mean_speed"] = mean_speed
+            info["max_tilt_deg"] = math.degrees(self._episode_max_tilt)
+            info["time_to_first_wp"] = self._time_to_first_wp
+            info["current_waypoint_idx"] = self._current_waypoint_idx
+            info["max_waypoints"] = self._max_waypoints_effective
+            info["episode_step"] = self._episode_step
+            info["waypoint_yaw"] = self._waypoint_yaw
+        if self.info_mode == "full":
+            # Ground truth for visualization (passed through info dict)
+            state = self._quad.kinematics
+            info["position"] = state.position.copy()
+            info["velocity"] = state.velocity.copy()
+            info["orientation"] = state.orientation.copy()
+            info["waypoints"] = self._waypoints
+        info.update(self._step_events)
+        if truncated:
             info["time_limit_reached"] = True
 
-        # Get observation
-        obs = self._get_observation(sensor_readings)
+        # Observation goes to the shared buffer; resets always build a new
+        # array, so a terminal observation survives the following reset
+        obs = self._get_observation(sensor_readings, self._obs_buffer)
+        if self.copy_observations:
+            obs = obs.copy()
 
-        return obs, reward, terminated, truncated, info
+        return obs, self._step_reward, terminated, truncated, info
 
     def _compute_reward(
-        self, distance: float, speed: float, waypoint_reached: bool
+        self, distance: float, speed: float, waypoint_reached: bool, radius: float
     ) -> float:
         """Compute reward for current step.
 
@@ -578,13 +989,10 @@ class QuadcopterEnv(gym.Env[NDArray[np.float64], NDArray[np.float64]]):
         if waypoint_reached:
             reward += self._reward_cfg.waypoint_bonus
 
-        # Graduated bonus for being close
-        if distance < self.waypoint_radius * self._reward_cfg.close_proximity_3x_radius:
+        # Graduated bonus for being close (relative to the gate radius)
+        if distance < radius * self._reward_cfg.close_proximity_3x_radius:
             reward += self._reward_cfg.close_proximity_3x_bonus
-            if (
-                distance
-                < self.waypoint_radius * self._reward_cfg.close_proximity_1_5x_radius
-            ):
+            if distance < radius * self._reward_cfg.close_proximity_1_5x_radius:
                 reward += self._reward_cfg.close_proximity_1_5x_bonus
 
         return reward
@@ -0,0 +1,42 @@
+"""Pre-built episode start states restored with ``QuadcopterEnv.restore_snapshot``."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from simhops.envs.quadcopter_env import EnvSnapshot, QuadcopterEnv
+
+
+class ResetPool:
+    """Fixed set of start-state snapshots drawn uniformly on reset.
+
+    Building runs the env's regular start sampling (start position, waypoint
+    yaw/noise, start waypoint) ``size`` times; afterwards a reset only restores
+    one snapshot, so start-state variety is limited to the pool. Sensor noise is
+    not rewound, so episodes starting from the same entry still differ.
+    """
+
+    def __init__(self, snapshots: list[EnvSnapshot]) -> None:
+        if not snapshots:
+            raise ValueError("ResetPool needs at least one snapshot")
+        self.snapshots = snapshots
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
+
+    @classmethod
+    def build(cls, env: QuadcopterEnv, size: int) -> ResetPool:
+        """Sample ``size`` start states with the env's own RNG."""
+        env._ensure_simulation()
+        snapshots = []
+        for _ in range(size):
+            env._start_episode()
+            snapshots.append(env.snapshot())
+        return cls(snapshots)
+
+    def restore_random(self, env: QuadcopterEnv) -> int:
+        """Restore a uniformly drawn entry into ``env``; returns its index."""
+        index = int(env.np_random.integers(len(self.snapshots)))
+        env.restore_snapshot(self.snapshots[index], restore_rng=False)
+        return index
@@ -0,0 +1,589 @@
+"""VecEnv whose worker processes exchange step data through shared memory.
+
+``SubprocVecEnv`` pickles every action, observation, reward, done flag and
+info dict through a pipe per worker and step. ``SharedMemoryVecEnv`` keeps
+one ``multiprocessing.shared_memory`` block per array instead: the main
+process writes actions into the shared action array and wakes the workers
+with a semaphore each, workers step their group of envs, write observations,
+rewards and done flags in place and post a shared "ready" semaphore. Pipes
+are only used for resets, attribute access and the info dicts of episodes
+that just ended.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+import traceback
+import warnings
+from collections.abc import Callable, Sequence
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from stable_baselines3.common.vec_env.base_vec_env import (
+    CloudpickleWrapper,
+    VecEnv,
+    VecEnvIndices,
+    VecEnvObs,
+    VecEnvStepReturn,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from multiprocessing.synchronize import Semaphore
+
+# Per-worker command slot, written by the main process before waking a worker
+_STEP = 0  # step with the shared action, reply through shared memory
+_PIPE = 1  # read the next command from the pipe
+_ERROR = 2  # set by a worker whose command raised; traceback follows on the pipe
+
+# Seconds between liveness checks while waiting for workers
+_POLL_INTERVAL = 1.0
+
+
+class _SharedArray:
+    """NumPy array backed by a named ``SharedMemory`` block.
+
+    The creating process owns the block and unlinks it on ``close``; other
+    processes attach by the ``spec`` tuple.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype[Any],
+        name: str | None = None,
+    ) -> None:
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self._owner = name is None
+        if name is None:
+            nbytes = max(1, int(np.prod(shape)) * self.dtype.itemsize)
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.array: np.ndarray = np.ndarray(
+            shape, dtype=self.dtype, buffer=self._shm.buf
+        )
+
+    @property
+    def spec(self) -> tuple[str, tuple[int, ...], str]:
+        return self._shm.name, self.shape, self.dtype.str
+
+    @classmethod
+    def attach(cls, spec: tuple[str, tuple[int, ...], str]) -> _SharedArray:
+        name, shape, dtype = spec
+        return cls(shape, np.dtype(dtype), name=name)
+
+    def close(self) -> None:
+        # The array view must go before the buffer can be released
+        del self.array
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+_ATTRIBUTE_COMMANDS = ("env_method", "get_attr", "set_attr", "has_attr")
+
+
+def _attribute_command(
+    envs: list[gym.Env], cmd: str, targets: list[int], data: Any
+) -> list[Any]:
+    """Run an attribute command on the group-local envs ``targets``."""
+    if cmd == "env_method":
+        name, args, kwargs = data
+        return [
+            envs[local].get_wrapper_attr(name)(*args, **kwargs) for local in targets
+        ]
+    if cmd == "get_attr":
+        return [envs[local].get_wrapper_attr(data) for local in targets]
+    if cmd == "has_attr":
+        replies = []
+        for local in targets:
+            try:
+                envs[local].get_wrapper_attr(data)
+            except AttributeError:
+                replies.append(False)
+            else:
+                replies.append(True)
+        return replies
+    for local in targets:
+        setattr(envs[local], data[0], data[1])
+    return [None for _ in targets]
+
+
+def _worker(  # noqa: C901
+    remote: Connection,
+    parent_remote: Connection,
+    env_fns_wrapper: CloudpickleWrapper,
+    worker: int,
+    start: int,
+    wake: Semaphore,
+    ready: Semaphore,
+) -> None:
+    # Import here to avoid a circular import
+    from stable_baselines3.common.env_util import is_wrapped
+
+    parent_remote.close()
+    envs = [env_fn() for env_fn in env_fns_wrapper.var]
+    remote.send((envs[0].observation_space, envs[0].action_space))
+    shared = {key: _SharedArray.attach(spec) for key, spec in remote.recv().items()}
+    stop = start + len(envs)
+    observations = shared["observations"].array[start:stop]
+    actions = shared["actions"].array[start:stop]
+    rewards = shared["rewards"].array[start:stop]
+    dones = shared["dones"].array[start:stop]
+    commands = shared["commands"].array
+    stepped = shared["stepped"].array
+
+    try:
+        while True:
+            wake.acquire()
+            if commands[worker] == _STEP:
+                # Step the whole group, then report once; infos of finished
+                # episodes follow on the pipe as (env index, info, reset info)
+                ended = []
+                try:
+                    for local, env in enumerate(envs):
+                        obs, reward, terminated, truncated, info = env.step(
+                            actions[local].copy()
+                        )
+                        done = terminated or truncated
+                        if done:
+                            info["TimeLimit.truncated"] = truncated and not terminated
+                            info["terminal_observation"] = obs
+                            obs, reset_info = env.reset()
+                            ended.append((start + local, info, reset_info))
+                        observations[local] = obs
+                        rewards[local] = reward
+                        dones[local] = done
+                except Exception:
+                    commands[worker] = _ERROR
+                    stepped[worker] = True
+                    ready.release()
+                    remote.send(traceback.format_exc())
+                    continue
+                stepped[worker] = True
+                ready.release()
+                if ended:
+                    remote.send(ended)
+                continue
+
+            # Pipe commands address envs by their index within the group
+            cmd, targets, data = remote.recv()
+            if cmd == "reset":
+                replies = []
+                for local, (seed, options) in zip(targets, data):
+                    maybe_options = {"options": options} if options else {}
+                    obs, reset_info = envs[local].reset(seed=seed, **maybe_options)
+                    observations[local] = obs
+                    replies.append(reset_info)
+                remote.send(replies)
+            elif cmd == "render":
+                remote.send([envs[local].render() for local in targets])
+            elif cmd == "close":
+                for env in envs:
+                    env.close()
+                remote.send(None)
+                break
+            elif cmd in _ATTRIBUTE_COMMANDS:
+                # Errors raised by env code are the caller's, not the worker's:
+                # report them like a failed step and keep serving commands
+                try:
+                    replies = _attribute_command(envs, cmd, targets, data)
+                except Exception:
+                    commands[worker] = _ERROR
+                    remote.send(traceback.format_exc())
+                    continue
+                remote.send(replies)
+            elif cmd == "is_wrapped":
+                remote.send([is_wrapped(envs[local], data) for local in targets])
+            else:
+                raise NotImplementedError(f"`{cmd}` is not implemented in the worker")
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del observations, actions, rewards, dones, commands, stepped
+        for array in shared.values():
+            array.close()
+        remote.close()
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """Drop-in ``SubprocVecEnv`` replacement with shared-memory step data.
+
+    Each worker process runs a group of ``envs_per_worker`` envs in a local
+    loop. Observations (stacked in ``observation_space.dtype``), float64
+    rewards (as ``SubprocVecEnv`` returns them), done flags and actions live
+    in shared memory, so a step costs two semaphore operations per worker
+    instead of a pickled round trip per env. Info dicts are only sent for
+    envs whose episode ended; other steps report empty infos, which is all
+    ``VecMonitor``, ``VecNormalize`` and the training callbacks need. Wrap
+    the result in ``VecMonitor`` for episode statistics.
+
+    Besides the synchronous ``VecEnv`` API the pool can be driven
+    asynchronously, EnvPool style: after ``reset``, ``send`` actions for some
+    envs and ``recv`` the first ``batch_size`` envs that finished stepping,
+    together with their env ids, so slow workers do not hold up the rest.
+    Batches consist of whole worker groups. Do not mix ``step`` with
+    ``send``/``recv`` while envs are in flight. See ``AsyncPPO`` for a
+    training loop built on it.
+
+    Exceptions raised by ``env_method``, ``get_attr`` and ``set_attr`` are
+    re-raised in the main process as ``RuntimeError`` with the worker's
+    traceback; the worker keeps serving its envs.
+
+    Only ``Box`` observation and action spaces are supported.
+
+    Args:
+        env_fns: Factories for the environments
+        start_method: ``multiprocessing`` start method; defaults to
+            ``forkserver`` where available and ``spawn`` otherwise, like
+            ``SubprocVecEnv``
+        envs_per_worker: Envs hosted by each worker process; the last worker
+            takes the remainder
+        batch_size: Minimum number of envs returned by ``recv``; defaults to
+            all envs
+    """
+
+    def __init__(
+        self,
+        env_fns: list[Callable[[], gym.Env]],
+        start_method: str | None = None,
+        envs_per_worker: int = 1,
+        batch_size: int | None = None,
+    ) -> None:
+        if envs_per_worker < 1:
+            raise ValueError(f"envs_per_worker must be >= 1, got {envs_per_worker}")
+        self.batch_size = batch_size if batch_size is not None else len(env_fns)
+        if not 1 <= self.batch_size <= len(env_fns):
+            raise ValueError(
+                f"batch_size must be in [1, {len(env_fns)}], got {batch_size}"
+            )
+        self.waiting = False
+        self.closed = False
+        n_envs = len(env_fns)
+
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+
+        # Worker w hosts envs [starts[w], starts[w + 1])
+        self._starts = list(range(0, n_envs, envs_per_worker)) + [n_envs]
+        n_workers = len(self._starts) - 1
+        self._worker_of = np.repeat(
+            np.arange(n_workers), np.diff(self._starts)
+        ).tolist()
+
+        self.remotes, self.work_remotes = zip(*[ctx.Pipe() for _ in range(n_workers)])
+        self._wakes = [ctx.Semaphore(0) for _ in range(n_workers)]
+        self._ready = ctx.Semaphore(0)
+        self.processes = []
+        for worker, (work_remote, remote) in enumerate(
+            zip(self.work_remotes, self.remotes)
+        ):
+            start, stop = self._starts[worker], self._starts[worker + 1]
+            args = (
+                work_remote,
+                remote,
+                CloudpickleWrapper(env_fns[start:stop]),
+                worker,
+                start,
+                self._wakes[worker],
+                self._ready,
+            )
+            # daemon=True: a crashed main process must not leave workers behind
+            process = ctx.Process(target=_worker, args=args, daemon=True)
+            process.start()
+            self.processes.append(process)
+            work_remote.close()
+
+        spaces_per_worker = [remote.recv() for remote in self.remotes]
+        observation_space, action_space = spaces_per_worker[0]
+        for space in (observation_space, action_space):
+            if not isinstance(space, spaces.Box):
+                self._terminate()
+                raise ValueError(
+                    f"SharedMemoryVecEnv only supports Box spaces, got {space}"
+                )
+
+        self._shared = {
+            "observations": _SharedArray(
+                (n_envs, *observation_space.shape), observation_space.dtype
+            ),
+            "actions": _SharedArray((n_envs, *action_space.shape), action_space.dtype),
+            "rewards": _SharedArray((n_envs,), np.dtype(np.float64)),
+            "dones": _SharedArray((n_envs,), np.dtype(np.bool_)),
+            "commands": _SharedArray((n_workers,), np.dtype(np.int8)),
+            # Set by a worker when its step results are written
+            "stepped": _SharedArray((n_workers,), np.dtype(np.bool_)),
+        }
+        specs = {key: array.spec for key, array in self._shared.items()}
+        for remote in self.remotes:
+            remote.send(specs)
+        self._observations = self._shared["observations"].array
+        self._actions = self._shared["actions"].array
+        self._rewards = self._shared["rewards"].array
+        self._dones = self._shared["dones"].array
+        self._commands = self._shared["commands"].array
+        self._stepped = self._shared["stepped"].array
+        # Workers stepping for send/recv, in the order they were sent
+        self._in_flight: list[int] = []
+        # The base class queries render_mode, so workers must be attached first
+        super().__init__(n_envs, observation_space, action_space)
+
+    @property
+    def n_workers(self) -> int:
+        return len(self.processes)
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._check_idle()
+        self._actions[:] = actions
+        self._commands[:] = _STEP
+        for wake in self._wakes:
+            wake.release()
+        self.waiting = True
+
+    def step_wait(self) -> VecEnvStepReturn:
+        self._wait_ready(self.n_workers)
+        self.waiting = False
+        self._stepped[:] = False
+        self._raise_failed(range(self.n_workers))
+
+        infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+        ended = {self._worker_of[index] for index in np.flatnonzero(self._dones)}
+        for index, info in self._receive_infos(ended).items():
+            infos[index] = info
+        return (
+            self._observations.copy(),
+            self._rewards.copy(),
+            self._dones.copy(),
+            infos,
+        )
+
+    def send(self, actions: np.ndarray, env_ids: np.ndarray) -> None:
+        """Start stepping ``env_ids`` with ``actions`` without waiting.
+
+        Args:
+            actions: (len(env_ids), *action_shape) actions
+            env_ids: Envs to step; must cover whole worker groups, as the
+                ids returned by ``recv`` do
+
+        Raises:
+            ValueError: If ``env_ids`` splits a worker group or includes
+                envs that are already stepping
+        """
+        env_ids = np.asarray(env_ids, dtype=np.intp)
+        workers = list(dict.fromkeys(self._worker_of[index] for index in env_ids))
+        expected = sum(self._starts[w + 1] - self._starts[w] for w in workers)
+        if len(env_ids) != expected or len(set(env_ids.tolist())) != len(env_ids):
+            raise ValueError("env_ids must cover whole worker groups exactly once")
+        if any(worker in self._in_flight for worker in workers):
+            raise ValueError("send called for envs that are already stepping")
+        self._actions[env_ids] = actions
+        for worker in workers:
+            self._commands[worker] = _STEP
+            self._wakes[worker].release()
+        self._in_flight.extend(workers)
+
+    def recv(
+        self, batch_size: int | None = None
+    ) -> tuple[
+        VecEnvObs, np.ndarray, np.ndarray, list[dict[str, Any]], np.ndarray
+    ]:
+        """Collect the first envs that finished the step started by ``send``.
+
+        Waits until at least ``batch_size`` envs (``self.batch_size`` when
+        None, at most the envs in flight) are done, in whole worker groups.
+        Finished episodes are reset automatically, as in ``step``.
+
+        Returns:
+            observations, rewards, dones, infos and env ids of the batch, all
+            aligned; the arrays are copies
+        """
+        in_flight = sum(self._starts[w + 1] - self._starts[w] for w in self._in_flight)
+        if in_flight == 0:
+            raise RuntimeError("recv called with no envs in flight")
+        target = min(batch_size or self.batch_size, in_flight)
+
+        # Every acquired token belongs to a worker whose flag is already set
+        workers: list[int] = []
+        count = 0
+        while count < target:
+            self._wait_ready(1)
+            worker = next(w for w in self._in_flight if self._stepped[w])
+            self._in_flight.remove(worker)
+            self._stepped[worker] = False
+            workers.append(worker)
+            count += self._starts[worker + 1] - self._starts[worker]
+        self._raise_failed(workers)
+
+        # Batches are ordered by env id, whatever order the workers finished in
+        workers.sort()
+        env_ids = np.concatenate(
+            [np.arange(self._starts[w], self._starts[w + 1]) for w in workers]
+        )
+        dones = self._dones[env_ids]
+        ended = self._receive_infos(
+            {self._worker_of[index] for index in env_ids[dones]}
+        )
+        infos = [ended.get(int(index), {}) for index in env_ids]
+        return (
+            self._observations[env_ids],
+            self._rewards[env_ids],
+            dones,
+            infos,
+            env_ids,
+        )
+
+    def reset(self) -> VecEnvObs:
+        self._check_idle()
+        self.reset_infos = self._call(
+            "reset", None, None, list(zip(self._seeds, self._options))
+        )
+        # Seeds and options are only used once
+        self._reset_seeds()
+        self._reset_options()
+        return self._observations.copy()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self.waiting:
+            self.step_wait()
+        while self._in_flight:
+            self.recv(self.num_envs)
+        for remote in self.remotes:
+            remote.send(("close", [], None))
+        self._wake(range(self.n_workers))
+        for remote in self.remotes:
+            remote.recv()
+        for process in self.processes:
+            process.join()
+        del self._observations, self._actions, self._rewards, self._dones
+        del self._commands, self._stepped
+        for array in self._shared.values():
+            array.close()
+        self.closed = True
+
+    def get_images(self) -> Sequence[np.ndarray | None]:
+        if self.render_mode != "rgb_array":
+            warnings.warn(
+                f"The render mode is {self.render_mode}, but this method assumes "
+                "it is `rgb_array` to obtain images."
+            )
+            return [None for _ in range(self.num_envs)]
+        return self._call("render", None, None)
+
+    def has_attr(self, attr_name: str) -> bool:
+        return all(self._call("has_attr", attr_name, None))
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> list[Any]:
+        return self._call("get_attr", attr_name, indices)
+
+    def set_attr(
+        self, attr_name: str, value: Any, indices: VecEnvIndices = None
+    ) -> None:
+        self._call("set_attr", (attr_name, value), indices)
+
+    def env_method(
+        self,
+        method_name: str,
+        *method_args: Any,
+        indices: VecEnvIndices = None,
+        **method_kwargs: Any,
+    ) -> list[Any]:
+        return self._call(
+            "env_method", (method_name, method_args, method_kwargs), indices
+        )
+
+    def env_is_wrapped(
+        self, wrapper_class: type[gym.Wrapper], indices: VecEnvIndices = None
+    ) -> list[bool]:
+        return self._call("is_wrapped", wrapper_class, indices)
+
+    def _call(
+        self,
+        cmd: str,
+        data: Any,
+        indices: VecEnvIndices,
+        per_env: list[Any] | None = None,
+    ) -> list[Any]:
+        """Run a pipe command on the selected envs and collect their replies.
+
+        Each involved worker gets one message with its envs' group-local
+        indices; ``per_env`` (aligned with ``indices``) replaces ``data`` with
+        the entries of that worker's envs.
+        """
+        self._check_idle()
+        targets = list(self._get_indices(indices))
+        by_worker: dict[int, list[int]] = {}
+        for position, index in enumerate(targets):
+            by_worker.setdefault(self._worker_of[index], []).append(position)
+        for worker, positions in by_worker.items():
+            local = [targets[p] - self._starts[worker] for p in positions]
+            payload = data if per_env is None else [per_env[p] for p in positions]
+            self.remotes[worker].send((cmd, local, payload))
+        self._wake(list(by_worker))
+        replies: list[Any] = [None] * len(targets)
+        failures: list[tuple[int, str]] = []
+        for worker, positions in by_worker.items():
+            received = self.remotes[worker].recv()
+            if self._commands[worker] == _ERROR:
+                failures.append((worker, received))
+                continue
+            for position, reply in zip(positions, received):
+                replies[position] = reply
+        # Raise only once every worker has replied so the pipes stay in step
+        if failures:
+            worker, message = failures[0]
+            raise RuntimeError(f"SharedMemoryVecEnv worker {worker} failed:\n{message}")
+        return replies
+
+    def _receive_infos(self, workers: set[int]) -> dict[int, dict[str, Any]]:
+        """Episode-end infos that ``workers`` sent after a step, by env id."""
+        ended: dict[int, dict[str, Any]] = {}
+        for worker in workers:
+            for index, info, reset_info in self.remotes[worker].recv():
+                ended[index] = info
+                self.reset_infos[index] = reset_info
+        return ended
+
+    def _raise_failed(self, workers: Sequence[int] | range) -> None:
+        """Raise the traceback of the first worker whose step raised."""
+        for worker in workers:
+            if self._commands[worker] == _ERROR:
+                message = self.remotes[worker].recv()
+                raise RuntimeError(
+                    f"SharedMemoryVecEnv worker {worker} failed:\n{message}"
+                )
+
+    def _check_idle(self) -> None:
+        if self._in_flight:
+            raise RuntimeError(
+                "Envs are still stepping asynchronously; recv them first"
+            )
+
+    def _wake(self, workers: Sequence[int] | range) -> None:
+        """Wake workers to read their next command from the pipe."""
+        for worker in workers:
+            self._commands[worker] = _PIPE
+            self._wakes[worker].release()
+
+    def _wait_ready(self, count: int) -> None:
+        """Wait for ``count`` step replies, failing if a worker died."""
+        for _ in range(count):
+            while not self._ready.acquire(timeout=_POLL_INTERVAL):
+                dead = [p.pid for p in self.processes if not p.is_alive()]
+                if dead:
+                    raise EOFError(f"SharedMemoryVecEnv workers {dead} exited")
+
+    def _terminate(self) -> None:
+        """Stop workers that never received their shared-memory specs."""
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self.closed = True
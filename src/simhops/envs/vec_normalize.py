@@ -0,0 +1,98 @@
+"""``VecNormalize`` that keeps observations in the env's dtype."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+from pathlib import Path
+
+import numpy as np
+from stable_baselines3.common.running_mean_std import RunningMeanStd
+from stable_baselines3.common.vec_env import VecNormalize
+
+# Statistics restarted by ``transfer_normalization``
+STATS_RESET_MODES = ("none", "obs", "reward", "all")
+
+# Initial ``RunningMeanStd`` count; decayed counts never go below it
+_MIN_COUNT = 1e-4
+
+
+class DtypeVecNormalize(VecNormalize):
+    """``VecNormalize`` returning observations in ``observation_space.dtype``.
+
+    Stable-Baselines3 always casts normalized observations to float32; this
+    follows the wrapped env instead (see ``env.dtype``), so the dtype seen by
+    the policy does not depend on whether normalization is enabled.
+    Statistics are still accumulated in float64.
+    """
+
+    def normalize_obs(
+        self, obs: np.ndarray | dict[str, np.ndarray]
+    ) -> np.ndarray | dict[str, np.ndarray]:
+        if not self.norm_obs or not isinstance(obs, np.ndarray):
+            return super().normalize_obs(obs)
+        assert isinstance(self.obs_rms, RunningMeanStd)
+        normalized = self._normalize_obs(obs, self.obs_rms)
+        return normalized.astype(self.observation_space.dtype, copy=False)
+
+
+def transfer_normalization(
+    source: VecNormalize,
+    target: VecNormalize,
+    decay: float = 1.0,
+    reset: str = "none",
+) -> None:
+    """Copy running observation/return statistics from ``source`` to ``target``.
+
+    Used at curriculum stage boundaries and on resume, so a new wrapper does
+    not restart from zero statistics. Observation statistics are carried only
+    when both wrappers normalize observations, return statistics only when
+    ``target`` normalizes rewards.
+
+    Args:
+        source: Wrapper (or unpickled ``VecNormalize``) to copy from
+        target: Wrapper to update; its env and settings are kept
+        decay: Factor on the carried sample counts in (0, 1]; smaller values
+            let statistics of the new stage take over sooner
+        reset: Statistics left at their initial values: ``"obs"`` when the
+            observation distribution changes, ``"reward"``, ``"all"`` or
+            ``"none"``
+
+    Raises:
+        ValueError: For an unknown ``reset``, a ``decay`` outside (0, 1] or
+            observation statistics of a different shape
+    """
+    if reset not in STATS_RESET_MODES:
+        raise ValueError(
+            f"Unknown statistics reset {reset!r}; expected one of {STATS_RESET_MODES}"
+        )
+    if not 0.0 < decay <= 1.0:
+        raise ValueError(f"decay must be in (0, 1], got {decay}")
+    # ``obs_rms`` only exists on wrappers created with ``norm_obs``
+    if source.norm_obs and target.norm_obs:
+        source_shape = np.shape(source.obs_rms.mean)
+        target_shape = np.shape(target.obs_rms.mean)
+        if source_shape != target_shape:
+            raise ValueError(
+                f"Observation statistics of shape {source_shape} do not match "
+                f"the target's {target_shape}"
+            )
+        if reset not in ("obs", "all"):
+            target.obs_rms = _decayed(source.obs_rms, decay)
+    if target.norm_reward and reset not in ("reward", "all"):
+        target.ret_rms = _decayed(source.ret_rms, decay)
+
+
+def _decayed(stats: RunningMeanStd, decay: float) -> RunningMeanStd:
+    stats = copy.deepcopy(stats)
+    stats.count = max(stats.count * decay, _MIN_COUNT)
+    return stats
+
+
+def load_normalization(path: str | Path) -> VecNormalize:
+    """Unpickle a ``VecNormalize`` saved with ``save`` (without an env)."""
+    with open(path, "rb") as f:
+        vec_normalize = pickle.load(f)
+    if not isinstance(vec_normalize, VecNormalize):
+        raise TypeError(f"{path} does not contain a VecNormalize")
+    return vec_normalize
@@ -1,25 +1,119 @@
 """Simple evaluation script with Rerun visualization.
 
 Runs a single episode and logs drone position, rotation, and goal waypoint to Rerun.
+With ``eval --parallel`` episodes instead run headless across a
+``SharedMemoryVecEnv`` with one batched policy call per step, for fast
+many-episode statistics.
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
+import json
+import multiprocessing as mp
+import os
+import pickle
 import time
+from collections import Counter
+from functools import partial
 from pathlib import Path
+from typing import Any
 
+import gymnasium as gym
 import numpy as np
 from stable_baselines3 import PPO
 from stable_baselines3.common.vec_env import VecNormalize
 
 import rerun as rr
 from simhops.config import Config
+from simhops.config.schema import DemoEnvConfig, EvaluationEnvConfig
 from simhops.logging import log, log_run_start, setup_run_logging
 from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
 from simhops.viz.rerun_viz import RerunVisualizer
 
+EVAL_CSV_FIELDS = [
+    "eval_run",
+    "model_path",
+    "episode",
+    "reward",
+    "length",
+    "waypoints_reached",
+    "success",
+    "crash_type",
+    "completion_time_s",
+]
+
+
+def find_model_file(model_dir: Path) -> Path:
+    """Locate the saved PPO model inside a run or checkpoint directory."""
+    for candidate in [
+        model_dir / "ppo_quadcopter.zip",
+        model_dir / "ppo_quadcopter",
+        model_dir / "best_model.zip",
+        model_dir,
+    ]:
+        if candidate.exists() or Path(str(candidate) + ".zip").exists():
+            return candidate
+    raise FileNotFoundError(f"Could not find model in {model_dir}")
+
+
+def load_obs_rms(model_dir: Path) -> Any | None:
+    """Observation running mean/var from ``vec_normalize.pkl``, if present.
+
+    ``model_dir`` may also be the path of a saved ``VecNormalize`` ``.pkl``
+    (e.g. a checkpoint's ``*_vecnormalize_<steps>_steps.pkl``).
+    """
+    if model_dir.suffix == ".pkl":
+        vec_normalize_path = model_dir
+    else:
+        vec_normalize_path = model_dir / "vec_normalize.pkl"
+    if not vec_normalize_path.exists():
+        return None
+
+    with open(vec_normalize_path, "rb") as f:
+        vec_normalize = pickle.load(f)
+    try:
+        if isinstance(vec_normalize, VecNormalize):
+            return vec_normalize.obs_rms
+        if hasattr(vec_normalize, "mean") and hasattr(vec_normalize, "var"):
+            return vec_normalize
+    except (AttributeError, RecursionError) as error:
+        log(f"Warning: Could not load obs_rms: {error}")
+    return None
+
+
+def normalize_observation(obs: np.ndarray, obs_rms: Any | None) -> np.ndarray:
+    """Apply VecNormalize observation statistics (clip at 10 like training).
+
+    The result keeps the dtype of ``obs`` (the env's ``dtype``).
+    """
+    if obs_rms is None or not (hasattr(obs_rms, "mean") and hasattr(obs_rms, "var")):
+        return obs
+    obs_normalized = (obs - obs_rms.mean) / np.sqrt(obs_rms.var + 1e-8)
+    return np.clip(obs_normalized, -10.0, 10.0).astype(obs.dtype, copy=False)
+
+
+def make_eval_env(
+    info_mode: str = "full",
+    copy_observations: bool = True,
+    env_cfg: EvaluationEnvConfig | DemoEnvConfig | None = None,
+) -> QuadcopterEnv:
+    """``QuadcopterEnv`` with the ``evaluation.env`` (or ``env_cfg``) overrides."""
+    if env_cfg is None:
+        env_cfg = Config.schema().evaluation.env
+    return QuadcopterEnv(
+        render_mode=None,
+        add_sensor_noise=env_cfg.add_sensor_noise,
+        disable_tilt_termination=env_cfg.disable_tilt_termination,
+        include_position=env_cfg.include_position,
+        waypoint_noise=env_cfg.waypoint_noise,
+        waypoint_yaw_random=env_cfg.waypoint_yaw_random,
+        info_mode=info_mode,
+        copy_observations=copy_observations,
+    )
+
 
 def eval_to_rrd(
     model_path: str,
@@ -28,6 +122,7 @@ def eval_to_rrd(
     recording_name: str | None = None,
     spawn_viewer: bool = True,
     run_id: str | None = None,
+    vec_normalize_path: Path | None = None,
 ) -> dict:
     """Run evaluation and save to .rrd file, optionally spawning viewer.
 
@@ -38,65 +133,61 @@ def eval_to_rrd(
         recording_name: Optional name for the recording
         spawn_viewer: Whether to spawn Rerun viewer (default: True)
         run_id: Optional run ID for logging
+        vec_normalize_path: Normalization stats; defaults to the model
+            directory's ``vec_normalize.pkl``
 
     Returns:
         Dictionary with episode statistics
     """
-    cfg = Config.schema()
-    eval_cfg = cfg.evaluation
     model_dir = Path(model_path)
+    model = PPO.load(str(find_model_file(model_dir)))
+    env = make_eval_env()
+    obs_rms = load_obs_rms(vec_normalize_path or model_dir)
+    try:
+        return record_episodes(
+            model,
+            env,
+            obs_rms,
+            output_rrd,
+            episodes=episodes,
+            recording_name=recording_name or f"eval:{model_dir.name}",
+            spawn_viewer=spawn_viewer,
+            model_path=model_path,
+        )
+    finally:
+        env.close()
 
-    # Find model file
-    model_file = None
-    for candidate in [
-        model_dir / "ppo_quadcopter.zip",
-        model_dir / "ppo_quadcopter",
-        model_dir / "best_model.zip",
-        model_dir,
-    ]:
-        if candidate.exists() or Path(str(candidate) + ".zip").exists():
-            model_file = candidate
-            break
-
-    if model_file is None:
-        raise FileNotFoundError(f"Could not find model in {model_path}")
-
-    # Load model
-    model = PPO.load(str(model_file))
-
-    # Create environment
-    env_cfg = eval_cfg.env
-    env = QuadcopterEnv(
-        render_mode=None,
-        add_sensor_noise=env_cfg.add_sensor_noise,
-        disable_tilt_termination=env_cfg.disable_tilt_termination,
-        include_position=env_cfg.include_position,
-        waypoint_noise=env_cfg.waypoint_noise,
-        waypoint_yaw_random=env_cfg.waypoint_yaw_random,
-    )
 
-    # Load normalization stats if available
-    vec_normalize_path = model_dir / "vec_normalize.pkl"
-    obs_rms = None
-    if vec_normalize_path.exists():
-        import pickle
+def record_episodes(
+    model: PPO,
+    env: QuadcopterEnv,
+    obs_rms: Any | None,
+    output_rrd: Path,
+    episodes: int,
+    recording_name: str,
+    spawn_viewer: bool = True,
+    model_path: str | None = None,
+) -> dict:
+    """Run deterministic episodes of a loaded model into a new .rrd recording.
 
-        with open(vec_normalize_path, "rb") as f:
-            vec_normalize = pickle.load(f)
-            try:
-                if isinstance(vec_normalize, VecNormalize):
-                    obs_rms = vec_normalize.obs_rms
-                elif hasattr(vec_normalize, "mean") and hasattr(vec_normalize, "var"):
-                    obs_rms = vec_normalize
-            except (AttributeError, RecursionError):
-                pass
+    The model and env are left open, so callers evaluating many checkpoints
+    can reuse them.
 
-    # Initialize Rerun for saving (and optionally spawning viewer)
-    if recording_name is None:
-        recording_name = f"eval:{model_dir.name}"
+    Args:
+        model: Policy to evaluate
+        env: Env to run (see ``make_eval_env``); reset for every episode
+        obs_rms: Observation statistics from ``load_obs_rms``, or None
+        output_rrd: Path to save .rrd file
+        episodes: Number of evaluation episodes to run
+        recording_name: Name for the recording
+        spawn_viewer: Whether to spawn Rerun viewer
+        model_path: Model path shown in the session notes
 
-    rr.init(cfg.visualization.eval_app_id, spawn=spawn_viewer)
-    rr.save(str(output_rrd))
+    Returns:
+        Dictionary with episode statistics
+    """
+    cfg = Config.schema()
+    env_cfg = cfg.evaluation.env
 
     session_markdown = "\n".join(
         [
@@ -115,18 +206,58 @@ def eval_to_rrd(
         spawn=spawn_viewer,
         recording_name=recording_name,
         session_markdown=session_markdown,
+        save_path=output_rrd,
     )
     viz.init()
+    episode_stats = _run_episodes(model, env, obs_rms, viz, episodes)
+    viz.close()
+
+    # Return aggregated stats
+    return {
+        "episodes": episode_stats,
+        "mean_reward": float(np.mean([ep["reward"] for ep in episode_stats])),
+        "mean_length": float(np.mean([ep["length"] for ep in episode_stats])),
+        "success_rate": float(
+            np.mean([ep["success"] for ep in episode_stats])
+        ),
+    }
+
 
-    # Run evaluation episodes
+def _run_episodes(
+    model: PPO,
+    env: QuadcopterEnv,
+    obs_rms: Any | None,
+    viz: RerunVisualizer,
+    episodes: int,
+    step_delay: float = 0.0,
+    verbose: bool = False,
+) -> list[dict[str, Any]]:
+    """Run deterministic episodes and log every step to ``viz``.
+
+    Args:
+        model: Policy to evaluate
+        env: Env to run, reset for every episode; ``verbose`` needs
+            ``info_mode="full"`` (the ``make_eval_env`` default)
+        obs_rms: Observation statistics from ``load_obs_rms``, or None
+        viz: Initialized visualizer
+        episodes: Number of episodes
+        step_delay: Seconds to sleep after each step (real-time playback)
+        verbose: Print progress every 100 steps and each episode's outcome
+
+    Returns:
+        Statistics of each episode (see ``_episode_stats``)
+    """
     episode_stats = []
     for episode_idx in range(1, episodes + 1):
+        if verbose:
+            print("\n--- Running evaluation episode ---")
         obs, info = env.reset()
         viz.reset()
 
+        truth = env.get_ground_truth()
         viz.log_waypoints(
-            info["waypoints"],
-            info["current_waypoint_idx"],
+            truth["waypoints"],
+            truth["current_waypoint_idx"],
             radius=env.waypoint_radius,
         )
 
@@ -135,18 +266,7 @@ def eval_to_rrd(
         step = 0
 
         while not done:
-            if (
-                obs_rms is not None
-                and hasattr(obs_rms, "mean")
-                and hasattr(obs_rms, "var")
-            ):
-                obs_mean = getattr(obs_rms, "mean")
-                obs_var = getattr(obs_rms, "var")
-                obs_normalized = (obs - obs_mean) / np.sqrt(obs_var + 1e-8)
-                obs_normalized = np.clip(obs_normalized, -10.0, 10.0)
-            else:
-                obs_normalized = obs
-
+            obs_normalized = normalize_observation(obs, obs_rms)
             action, _ = model.predict(obs_normalized, deterministic=True)
 
             obs, reward, terminated, truncated, info = env.step(action)
@@ -154,57 +274,61 @@ def eval_to_rrd(
             total_reward += float(reward)
             step += 1
 
-            if env._quad is not None:
-                state = env._quad.get_state()
-                current_waypoint_idx = info["current_waypoint_idx"]
+            truth = env.get_ground_truth()
+            rr.set_time("step", sequence=step)
+            rr.set_time("episode", sequence=episode_idx)
 
-                rr.set_time("step", sequence=step)
-                rr.set_time("episode", sequence=episode_idx)
+            # Log drone state
+            viz.env.log_drone(
+                position=truth["position"],
+                velocity=truth["velocity"],
+                orientation=truth["orientation"],
+            )
 
-                # Log drone state
-                viz.env.log_drone(
-                    position=state.position,
-                    velocity=state.velocity,
-                    orientation=state.orientation,
-                )
+            # Update waypoints with progress
+            viz.env.log_waypoints(
+                truth["waypoints"],
+                truth["current_waypoint_idx"],
+                radius=env.waypoint_radius,
+            )
 
-                # Update waypoints with progress
-                viz.env.log_waypoints(
-                    env._waypoints,
-                    current_waypoint_idx,
-                    radius=env.waypoint_radius,
+            if step_delay > 0:
+                time.sleep(step_delay)
+
+            if verbose and step % 100 == 0:
+                print(
+                    f"  Step {step}: "
+                    f"waypoint={info['current_waypoint_idx']}/{env.num_waypoints}, "
+                    f"dist={info['distance']:.2f}m, speed={info['speed']:.2f}m/s"
                 )
 
-        # Store episode stats
-        success = info.get("success", False)
-        crash = info.get("crash", None)
-        completion_steps = info.get("completion_steps", step) if success else None
-
-        episode_stats.append(
-            {
-                "episode": episode_idx,
-                "reward": total_reward,
-                "length": step,
-                "waypoints_reached": info.get("current_waypoint_idx", 0),
-                "success": bool(success),
-                "crash_type": crash,
-                "completion_time_s": completion_steps * env.dt
-                if completion_steps is not None
-                else None,
-            }
-        )
+        stats = _episode_stats(episode_idx, total_reward, step, info, env.dt)
+        episode_stats.append(stats)
+        if verbose:
+            _print_episode(stats, info, env.num_waypoints)
 
-    env.close()
+    return episode_stats
 
-    # Return aggregated stats
-    return {
-        "episodes": episode_stats,
-        "mean_reward": float(np.mean([ep["reward"] for ep in episode_stats])),
-        "mean_length": float(np.mean([ep["length"] for ep in episode_stats])),
-        "success_rate": float(
-            np.mean([ep["success"] for ep in episode_stats])
-        ),
-    }
+
+def _print_episode(
+    stats: dict[str, Any], info: dict[str, Any], num_waypoints: int
+) -> None:
+    """Print the outcome of one ``_run_episodes`` episode."""
+    print(f"\n=== Episode Results ===")
+    print(f"Steps: {stats['length']}")
+    print(f"Total reward: {stats['reward']:.1f}")
+    print(f"Waypoints reached: {stats['waypoints_reached']}/{num_waypoints}")
+
+    if stats["success"]:
+        completion_steps = info.get("completion_steps", stats["length"])
+        print(
+            f"SUCCESS! Completed in {completion_steps} steps "
+            f"({stats['completion_time_s']:.1f}s)"
+        )
+    elif stats["crash_type"]:
+        print(f"CRASH: {stats['crash_type']}")
+    else:
+        print("TIMEOUT: Did not complete all waypoints")
 
 
 def evaluate(
@@ -215,67 +339,38 @@ def evaluate(
 ) -> None:
     """Evaluate trained model with Rerun visualization.
 
-    Runs a single episode on the fixed 10-waypoint path.
-    Logs: drone position, drone rotation, current goal waypoint.
+    Runs episodes on the evaluation course (``evaluation.env``), printing
+    progress and logging the drone and waypoints to Rerun. With
+    ``evaluation.realtime`` steps are played back at ``slow_motion`` times
+    real time.
 
     Args:
         model_path: Path to saved model directory
-        realtime: Sleep between steps to match real-time
-        slow_motion: Slow motion factor (1.0 = realtime)
-        disable_tilt_termination: If True, don't terminate on excessive tilt
+        eval_output: Optional CSV path for per-episode results
+        episodes: Number of evaluation episodes
+        run_id: Optional run ID for logging
     """
     cfg = Config.schema()
     eval_cfg = cfg.evaluation
     model_dir = Path(model_path)
 
-    # Find model file
-    model_file = None
-    for candidate in [
-        model_dir / "ppo_quadcopter.zip",
-        model_dir / "ppo_quadcopter",
-        model_dir / "best_model.zip",
-        model_dir,
-    ]:
-        if candidate.exists() or Path(str(candidate) + ".zip").exists():
-            model_file = candidate
-            break
-
-    if model_file is None:
-        raise FileNotFoundError(f"Could not find model in {model_path}")
+    model_file = find_model_file(model_dir)
 
     print(f"Loading model from {model_file}")
     model = PPO.load(str(model_file))
 
     # Create environment (optionally rotated waypoints, no noise by default)
     env_cfg = eval_cfg.env
-    env = QuadcopterEnv(
-        render_mode=None,
-        add_sensor_noise=env_cfg.add_sensor_noise,
-        disable_tilt_termination=env_cfg.disable_tilt_termination,
-        include_position=env_cfg.include_position,
-        waypoint_noise=env_cfg.waypoint_noise,
-        waypoint_yaw_random=env_cfg.waypoint_yaw_random,
-    )
+    env = make_eval_env()
     print(f"Environment: {env.num_waypoints} waypoints (no randomization by default)")
     if env_cfg.disable_tilt_termination:
         print("Tilt termination disabled for evaluation")
 
     # Load normalization stats if available
     vec_normalize_path = model_dir / "vec_normalize.pkl"
-    obs_rms = None
     if vec_normalize_path.exists():
         print(f"Loading normalization stats from {vec_normalize_path}")
-        import pickle
-
-        with open(vec_normalize_path, "rb") as f:
-            vec_normalize = pickle.load(f)
-            try:
-                if isinstance(vec_normalize, VecNormalize):
-                    obs_rms = vec_normalize.obs_rms
-                elif hasattr(vec_normalize, "mean") and hasattr(vec_normalize, "var"):
-                    obs_rms = vec_normalize
-            except (AttributeError, RecursionError) as error:
-                print(f"Warning: Could not load obs_rms: {error}")
+    obs_rms = load_obs_rms(model_dir)
 
     # Initialize Rerun visualizer
     session_markdown = "\n".join(
@@ -301,132 +396,224 @@ def evaluate(
     )
     viz.init()
 
-    eval_writer = None
-    eval_file = None
-    if eval_output is not None:
-        eval_output.parent.mkdir(parents=True, exist_ok=True)
-        eval_file = eval_output.open("w", newline="", encoding="utf-8")
-        eval_writer = csv.DictWriter(
-            eval_file,
-            fieldnames=[
-                "eval_run",
-                "model_path",
-                "episode",
-                "reward",
-                "length",
-                "waypoints_reached",
-                "success",
-                "crash_type",
-                "completion_time_s",
-            ],
+    try:
+        episode_stats = _run_episodes(
+            model,
+            env,
+            obs_rms,
+            viz,
+            episodes,
+            step_delay=env.dt * eval_cfg.slow_motion if eval_cfg.realtime else 0.0,
+            verbose=True,
         )
-        eval_writer.writeheader()
-
-    for episode_idx in range(1, episodes + 1):
-        print("\n--- Running evaluation episode ---")
-        obs, info = env.reset()
-        viz.reset()
+    finally:
+        env.close()
 
-        viz.log_waypoints(
-            info["waypoints"],
-            info["current_waypoint_idx"],
-            radius=env.waypoint_radius,
-        )
+    if eval_output is not None:
+        eval_output.parent.mkdir(parents=True, exist_ok=True)
+        with eval_output.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=EVAL_CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(
+                _csv_row(str(model_dir), stats) for stats in episode_stats
+            )
 
-        done = False
-        total_reward = 0.0
-        step = 0
 
-        while not done:
-            if (
-                obs_rms is not None
-                and hasattr(obs_rms, "mean")
-                and hasattr(obs_rms, "var")
-            ):
-                obs_mean = getattr(obs_rms, "mean")
-                obs_var = getattr(obs_rms, "var")
-                obs_normalized = (obs - obs_mean) / np.sqrt(obs_var + 1e-8)
-                obs_normalized = np.clip(obs_normalized, -10.0, 10.0)
-            else:
-                obs_normalized = obs
+class _EpisodeSeeds(gym.Wrapper):
+    """Resets with the next seed of a fixed schedule, then unseeded."""
 
-            action, _ = model.predict(obs_normalized, deterministic=True)
+    def __init__(self, env: gym.Env, seeds: list[int]) -> None:
+        super().__init__(env)
+        self._seeds = list(seeds)
 
-            obs, reward, terminated, truncated, info = env.step(action)
-            done = terminated or truncated
-            total_reward += float(reward)
-            step += 1
+    def reset(
+        self, *, seed: int | None = None, options: dict[str, Any] | None = None
+    ) -> tuple[Any, dict[str, Any]]:
+        if self._seeds:
+            seed = self._seeds.pop(0)
+        return self.env.reset(seed=seed, options=options)
 
-            if env._quad is not None:
-                state = env._quad.get_state()
-                current_waypoint_idx = info["current_waypoint_idx"]
 
-                rr.set_time("step", sequence=step)
-                rr.set_time("episode", sequence=episode_idx)
+def _make_seeded_eval_env(config_path: str | None, seeds: list[int]) -> gym.Env:
+    """Headless eval env for one ``evaluate_parallel`` slot (runs in workers)."""
+    if config_path is not None and Config.path() != Path(config_path):
+        Config.load(config_path)
+    env = make_eval_env(info_mode="episode_end", copy_observations=False)
+    return _EpisodeSeeds(env, seeds)
 
-                # Log drone state
-                viz.env.log_drone(
-                    position=state.position,
-                    velocity=state.velocity,
-                    orientation=state.orientation,
-                )
 
-                # Update waypoints with progress
-                viz.env.log_waypoints(
-                    env._waypoints,
-                    current_waypoint_idx,
-                    radius=env.waypoint_radius,
-                )
+def summarize_episodes(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate statistics of per-episode evaluation rows."""
+    rewards = np.array([row["reward"] for row in rows], dtype=np.float64)
+    lengths = np.array([row["length"] for row in rows], dtype=np.float64)
+    completion_times = [
+        row["completion_time_s"] for row in rows if row["completion_time_s"] is not None
+    ]
+    crashes = Counter(row["crash_type"] for row in rows if row["crash_type"])
+    return {
+        "episodes": len(rows),
+        "mean_reward": float(rewards.mean()),
+        "std_reward": float(rewards.std()),
+        "min_reward": float(rewards.min()),
+        "max_reward": float(rewards.max()),
+        "mean_length": float(lengths.mean()),
+        "success_rate": float(np.mean([row["success"] for row in rows])),
+        "crash_rate": sum(crashes.values()) / len(rows),
+        "crash_types": dict(crashes),
+        "mean_waypoints_reached": float(
+            np.mean([row["waypoints_reached"] for row in rows])
+        ),
+        "mean_completion_time_s": float(np.mean(completion_times))
+        if completion_times
+        else None,
+    }
 
-            if eval_cfg.realtime:
-                time.sleep(env.dt * eval_cfg.slow_motion)
 
-            if step % 100 == 0:
-                print(
-                    f"  Step {step}: waypoint={info['current_waypoint_idx']}/{env.num_waypoints}, "
-                    f"dist={info['distance']:.2f}m, speed={info['speed']:.2f}m/s"
-                )
-
-        success = info.get("success", False)
-        crash = info.get("crash", None)
+def evaluate_parallel(
+    model_path: str,
+    eval_output: Path | None = None,
+    episodes: int = 100,
+    n_envs: int | None = None,
+    envs_per_worker: int = 1,
+    seed: int = 0,
+    summary_output: Path | None = None,
+) -> dict[str, Any]:
+    """Evaluate many episodes headless across a vectorized env.
+
+    Episode ``i`` (1-based) is reset with seed ``seed + i - 1`` and always
+    runs in env slot ``(i - 1) % n_envs``, so results do not depend on
+    timing. Every step makes one deterministic ``predict`` call on the
+    (normalized) observations of all envs with episodes left.
 
-        print(f"\n=== Episode Results ===")
-        print(f"Steps: {step}")
-        print(f"Total reward: {total_reward:.1f}")
-        print(f"Waypoints reached: {info['current_waypoint_idx']}/{env.num_waypoints}")
+    Args:
+        model_path: Path to saved model directory or file
+        eval_output: Optional CSV path (same columns as ``evaluate``)
+        episodes: Number of evaluation episodes
+        n_envs: Parallel envs; defaults to the CPU count (at most
+            ``episodes``)
+        envs_per_worker: Envs stepped by each worker process
+        seed: Reset seed of the first episode
+        summary_output: Optional JSON path for the aggregated statistics
 
-        completion_steps = None
-        if success:
-            completion_steps = info.get("completion_steps", step)
-            print(
-                f"SUCCESS! Completed in {completion_steps} steps ({completion_steps * env.dt:.1f}s)"
-            )
-        elif crash:
-            print(f"CRASH: {crash}")
-        else:
-            print("TIMEOUT: Did not complete all waypoints")
-
-        if eval_writer is not None:
-            eval_writer.writerow(
-                {
-                    "eval_run": episode_idx,
-                    "model_path": str(model_dir),
-                    "episode": episode_idx,
-                    "reward": total_reward,
-                    "length": step,
-                    "waypoints_reached": info.get("current_waypoint_idx", 0),
-                    "success": bool(success),
-                    "crash_type": crash,
-                    "completion_time_s": completion_steps * env.dt
-                    if completion_steps is not None
-                    else None,
-                }
+    Returns:
+        Aggregated statistics (see ``summarize_episodes``)
+    """
+    model_dir = Path(model_path)
+    model_file = find_model_file(model_dir)
+    print(f"Loading model from {model_file}")
+    model = PPO.load(str(model_file))
+    obs_rms = load_obs_rms(model_dir)
+
+    n_envs = max(1, min(episodes, n_envs or os.cpu_count() or 1))
+    schedules = [list(range(slot, episodes, n_envs)) for slot in range(n_envs)]
+    config_path = Config.path()
+    env_fns = [
+        partial(
+            _make_seeded_eval_env,
+            str(config_path) if config_path is not None else None,
+            [seed + episode for episode in schedule],
+        )
+        for schedule in schedules
+    ]
+    print(f"Evaluating {episodes} episodes on {n_envs} envs")
+    start = time.perf_counter()
+    if "forkserver" in mp.get_all_start_methods():
+        # Workers fork from a server that has imported the env stack once,
+        # instead of each importing torch, SB3 and MuJoCo (no effect if the
+        # forkserver is already running)
+        mp.set_forkserver_preload(["simhops.evaluate"])
+    vec_env = SharedMemoryVecEnv(
+        env_fns,  # type: ignore[arg-type]
+        envs_per_worker=envs_per_worker,
+    )
+    try:
+        dt = vec_env.get_attr("dt", [0])[0]
+        obs = vec_env.reset()
+        actions = np.zeros(
+            (n_envs, *vec_env.action_space.shape), dtype=vec_env.action_space.dtype
+        )
+        returns = np.zeros(n_envs)
+        lengths = np.zeros(n_envs, dtype=np.int64)
+        done_count = np.zeros(n_envs, dtype=np.int64)
+        active = np.ones(n_envs, dtype=bool)
+        rows: list[dict[str, Any] | None] = [None] * episodes
+        while active.any():
+            ids = np.flatnonzero(active)
+            actions[ids], _ = model.predict(
+                normalize_observation(obs[ids], obs_rms), deterministic=True
             )
+            obs, rewards, dones, infos = vec_env.step(actions)
+            returns[active] += rewards[active]
+            lengths[active] += 1
+            for slot in np.flatnonzero(dones & active):
+                episode = schedules[slot][done_count[slot]]
+                rows[episode] = _csv_row(
+                    str(model_dir),
+                    _episode_stats(
+                        episode + 1, returns[slot], lengths[slot], infos[slot], dt
+                    ),
+                )
+                returns[slot] = 0.0
+                lengths[slot] = 0
+                done_count[slot] += 1
+                active[slot] = done_count[slot] < len(schedules[slot])
+    finally:
+        vec_env.close()
+    elapsed = time.perf_counter() - start
+
+    episode_rows = [row for row in rows if row is not None]
+    if eval_output is not None:
+        eval_output.parent.mkdir(parents=True, exist_ok=True)
+        with eval_output.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=EVAL_CSV_FIELDS)
+            writer.writeheader()
+            writer.writerows(episode_rows)
+
+    summary = summarize_episodes(episode_rows)
+    summary.update(model_path=str(model_dir), seed=seed, n_envs=n_envs)
+    if summary_output is not None:
+        summary_output.parent.mkdir(parents=True, exist_ok=True)
+        summary_output.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+
+    print(f"\n=== {episodes} episodes in {elapsed:.1f}s ===")
+    print(
+        f"Reward: {summary['mean_reward']:.1f} +/- {summary['std_reward']:.1f} "
+        f"(min {summary['min_reward']:.1f}, max {summary['max_reward']:.1f})"
+    )
+    print(f"Length: {summary['mean_length']:.1f} steps")
+    print(f"Success rate: {summary['success_rate']:.1%}")
+    print(f"Crash rate: {summary['crash_rate']:.1%} {summary['crash_types']}")
+    if summary["mean_completion_time_s"] is not None:
+        print(f"Mean completion time: {summary['mean_completion_time_s']:.1f}s")
+    return summary
+
+
+def _episode_stats(
+    episode: int,
+    reward: float,
+    length: int,
+    info: dict[str, Any],
+    dt: float,
+) -> dict[str, Any]:
+    """Statistics of a finished episode from its final info."""
+    success = bool(info.get("success", False))
+    completion_steps = info.get("completion_steps", length) if success else None
+    return {
+        "episode": episode,
+        "reward": float(reward),
+        "length": int(length),
+        "waypoints_reached": info.get("current_waypoint_idx", 0),
+        "success": success,
+        "crash_type": info.get("crash"),
+        "completion_time_s": completion_steps * dt
+        if completion_steps is not None
+        else None,
+    }
 
-    if eval_file is not None:
-        eval_file.close()
 
-    env.close()
+def _csv_row(model_path: str, stats: dict[str, Any]) -> dict[str, Any]:
+    """``EVAL_CSV_FIELDS`` row of an episode's ``_episode_stats``."""
+    return {"eval_run": stats["episode"], "model_path": model_path, **stats}
 
 
 def demo_random() -> None:
@@ -436,14 +623,7 @@ def demo_random() -> None:
     env_cfg = demo_cfg.env
     print("Running demo with random actions...")
 
-    env = QuadcopterEnv(
-        render_mode=None,
-        add_sensor_noise=env_cfg.add_sensor_noise,
-        disable_tilt_termination=env_cfg.disable_tilt_termination,
-        include_position=env_cfg.include_position,
-        waypoint_noise=env_cfg.waypoint_noise,
-        waypoint_yaw_random=env_cfg.waypoint_yaw_random,
-    )
+    env = make_eval_env(env_cfg=env_cfg)
 
     session_markdown = "\n".join(
         [
@@ -538,6 +718,35 @@ def main() -> None:
         default=1,
         help="Number of evaluation episodes",
     )
+    eval_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run episodes headless across parallel envs (no Rerun)",
+    )
+    eval_parser.add_argument(
+        "--n-envs",
+        type=int,
+        default=None,
+        help="Parallel envs for --parallel (default: CPU count)",
+    )
+    eval_parser.add_argument(
+        "--envs-per-worker",
+        type=int,
+        default=1,
+        help="Envs stepped by each worker process for --parallel",
+    )
+    eval_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the first --parallel episode (episode i uses seed + i - 1)",
+    )
+    eval_parser.add_argument(
+        "--summary",
+        type=str,
+        default=None,
+        help="Optional JSON path for --parallel aggregated statistics",
+    )
 
     # Demo subcommand
     subparsers.add_parser("demo", help="Run random action demo")
@@ -546,7 +755,17 @@ def main() -> None:
 
     Config.load(args.config)
 
-    if args.command == "eval":
+    if args.command == "eval" and args.parallel:
+        evaluate_parallel(
+            model_path=args.model_path,
+            eval_output=Path(args.output) if args.output else None,
+            episodes=args.episodes,
+            n_envs=args.n_envs,
+            envs_per_worker=args.envs_per_worker,
+            seed=args.seed,
+            summary_output=Path(args.summary) if args.summary else None,
+        )
+    elif args.command == "eval":
         output_path = Path(args.output) if args.output else None
         evaluate(
             model_path=args.model_path,
@@ -0,0 +1,208 @@
+"""PPO that collects rollouts from an asynchronously stepped env pool."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import torch as th
+from stable_baselines3 import PPO
+from stable_baselines3.common.buffers import RolloutBuffer
+from stable_baselines3.common.callbacks import BaseCallback
+from stable_baselines3.common.utils import obs_as_tensor
+from stable_baselines3.common.vec_env import VecEnv, VecNormalize
+
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+
+
+class AsyncPPO(PPO):
+    """PPO whose rollouts come from ``SharedMemoryVecEnv.send``/``recv``.
+
+    Every env owns one column of the rollout buffer and fills it at its own
+    pace: a batch returned by ``recv`` completes the pending transition of
+    each of its envs, and envs whose column is not yet full are immediately
+    sent their next action. Each column therefore holds ``n_steps``
+    consecutive transitions of a single env, so GAE is computed exactly as
+    for synchronous collection while fast workers never wait for stragglers
+    (only the end of a rollout waits for the last column).
+
+    The training env must be a ``SharedMemoryVecEnv``, optionally wrapped in
+    ``VecNormalize`` (whose statistics are updated per batch). Other VecEnv
+    wrappers would be bypassed, so wrap the envs in ``Monitor`` inside the
+    workers for episode statistics instead of using ``VecMonitor``.
+
+    Callbacks run once per ``num_envs`` collected transitions, like one
+    synchronous step, and see the infos and dones of every batch since the
+    previous call.
+    """
+
+    def _setup_model(self) -> None:
+        if self.use_sde:
+            raise ValueError("AsyncPPO does not support gSDE (use_sde=True)")
+        super()._setup_model()
+
+    def collect_rollouts(
+        self,
+        env: VecEnv,
+        callback: BaseCallback,
+        rollout_buffer: RolloutBuffer,
+        n_rollout_steps: int,
+    ) -> bool:
+        assert self._last_obs is not None, "No previous observation was provided"
+        assert isinstance(self._last_obs, np.ndarray)
+        assert self._last_episode_starts is not None
+        normalizer = env if isinstance(env, VecNormalize) else None
+        pool = env.venv if normalizer is not None else env
+        if not isinstance(pool, SharedMemoryVecEnv):
+            raise TypeError(
+                "AsyncPPO needs a SharedMemoryVecEnv, optionally wrapped in "
+                f"VecNormalize only; got {env}"
+            )
+        self.policy.set_training_mode(False)
+        rollout_buffer.reset()
+        callback.on_rollout_start()
+
+        # Latest (normalized) observation and episode start flag of every env
+        # and the number of transitions stored in each env's buffer column
+        obs = self._last_obs.copy()
+        episode_starts = np.asarray(self._last_episode_starts, dtype=bool).copy()
+        filled = np.zeros(env.num_envs, dtype=np.intp)
+
+        self._send_actions(
+            pool, rollout_buffer, np.arange(env.num_envs), obs, episode_starts, filled
+        )
+        in_flight = env.num_envs
+        pending_infos: list[dict[str, Any]] = []
+        pending_dones: list[np.ndarray] = []
+        while in_flight:
+            new_obs, rewards, batch_dones, batch_infos, env_ids = pool.recv()
+            in_flight -= len(env_ids)
+            if normalizer is not None:
+                new_obs, rewards = _normalize_batch(
+                    normalizer, new_obs, rewards, batch_dones, batch_infos, env_ids
+                )
+            self.num_timesteps += len(env_ids)
+            self._update_info_buffer(batch_infos, batch_dones)
+
+            # Handle timeout by bootstrapping with value function
+            for position, done in enumerate(batch_dones):
+                info = batch_infos[position]
+                if (
+                    done
+                    and info.get("terminal_observation") is not None
+                    and info.get("TimeLimit.truncated", False)
+                ):
+                    terminal_obs = self.policy.obs_to_tensor(
+                        info["terminal_observation"]
+                    )[0]
+                    with th.no_grad():
+                        terminal_value = self.policy.predict_values(terminal_obs)[0]
+                    rewards[position] += self.gamma * terminal_value.item()
+
+            rollout_buffer.rewards[filled[env_ids], env_ids] = rewards
+            filled[env_ids] += 1
+            obs[env_ids] = new_obs
+            episode_starts[env_ids] = batch_dones
+
+            pending_infos.extend(batch_infos)
+            pending_dones.append(batch_dones)
+            if len(pending_infos) >= env.num_envs:
+                # Give access to local variables, as for one synchronous step
+                infos = pending_infos
+                dones = np.concatenate(pending_dones)
+                callback.update_locals(locals())
+                pending_infos, pending_dones = [], []
+                if not callback.on_step():
+                    while in_flight:
+                        in_flight -= len(pool.recv(in_flight)[4])
+                    return False
+
+            active = env_ids[filled[env_ids] < n_rollout_steps]
+            if active.size:
+                self._send_actions(
+                    pool, rollout_buffer, active, obs, episode_starts, filled
+                )
+                in_flight += active.size
+
+        rollout_buffer.pos = rollout_buffer.buffer_size
+        rollout_buffer.full = True
+        self._last_obs = obs
+        self._last_episode_starts = episode_starts
+
+        with th.no_grad():
+            # Compute value for the last timestep
+            values = self.policy.predict_values(obs_as_tensor(obs, self.device))
+
+        dones = episode_starts
+        rollout_buffer.compute_returns_and_advantage(last_values=values, dones=dones)
+
+        callback.update_locals(locals())
+
+        callback.on_rollout_end()
+
+        return True
+
+    def _send_actions(
+        self,
+        pool: SharedMemoryVecEnv,
+        rollout_buffer: RolloutBuffer,
+        env_ids: np.ndarray,
+        obs: np.ndarray,
+        episode_starts: np.ndarray,
+        filled: np.ndarray,
+    ) -> None:
+        """Act for ``env_ids``, store their pending transitions and send them."""
+        with th.no_grad():
+            obs_tensor = obs_as_tensor(obs[env_ids], self.device)
+            actions, values, log_probs = self.policy(obs_tensor)
+        actions = actions.cpu().numpy()
+
+        # Rescale and perform action
+        if self.policy.squash_output:
+            clipped_actions = self.policy.unscale_action(actions)
+        else:
+            clipped_actions = np.clip(
+                actions, self.action_space.low, self.action_space.high
+            )
+
+        rows = filled[env_ids]
+        rollout_buffer.observations[rows, env_ids] = obs[env_ids]
+        rollout_buffer.actions[rows, env_ids] = actions.reshape(len(env_ids), -1)
+        rollout_buffer.episode_starts[rows, env_ids] = episode_starts[env_ids]
+        rollout_buffer.values[rows, env_ids] = values.cpu().numpy().flatten()
+        rollout_buffer.log_probs[rows, env_ids] = log_probs.cpu().numpy()
+        pool.send(clipped_actions, env_ids)
+
+
+def _normalize_batch(
+    normalizer: VecNormalize,
+    obs: np.ndarray,
+    rewards: np.ndarray,
+    dones: np.ndarray,
+    infos: list[dict[str, Any]],
+    env_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Apply ``VecNormalize.step_wait`` to a partial batch of envs.
+
+    Observation statistics are updated with the batch; discounted returns
+    for the reward statistics are tracked per env id.
+    """
+    normalizer.old_obs = obs
+    normalizer.old_reward = rewards
+    if normalizer.training and normalizer.norm_obs:
+        normalizer.obs_rms.update(obs)
+    obs = normalizer.normalize_obs(obs)
+
+    if normalizer.training:
+        returns = normalizer.returns[env_ids] * normalizer.gamma + rewards
+        normalizer.returns[env_ids] = returns
+        normalizer.ret_rms.update(returns)
+    rewards = normalizer.normalize_reward(rewards)
+
+    for position, done in enumerate(dones):
+        if done and "terminal_observation" in infos[position]:
+            infos[position]["terminal_observation"] = normalizer.normalize_obs(
+                infos[position]["terminal_observation"]
+            )
+    normalizer.returns[env_ids[dones]] = 0
+    return obs, rewards
@@ -1,5 +1,6 @@
 """Training callbacks for Stable-Baselines3."""
 
+from simhops.train.callbacks.async_eval_callback import AsyncEvalCallback
 from simhops.train.callbacks.eval_checkpoint_callback import EvalCheckpointCallback
 from simhops.train.callbacks.metrics_callback import MetricsLoggerCallback
 from simhops.train.callbacks.rerun_callback import TrainingMetricsCallback
@@ -7,6 +8,7 @@ from simhops.train.callbacks.reward_callback import RewardLoggerCallback
 from simhops.train.callbacks.snapshot_callback import ExperimentSnapshotCallback
 
 __all__ = [
+    "AsyncEvalCallback",
     "EvalCheckpointCallback",
     "MetricsLoggerCallback",
     "TrainingMetricsCallback",
@@ -0,0 +1,206 @@
+"""Periodic evaluation that runs in an ``EvalService`` instead of inline."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from pathlib import Path
+
+import numpy as np
+from stable_baselines3.common.callbacks import BaseCallback
+
+from simhops.config.schema import EnvConfig
+from simhops.logging import log
+from simhops.train.eval_service import EvalResult, EvalService, PendingEval
+
+
+class AsyncEvalCallback(BaseCallback):
+    """Non-blocking replacement for SB3's ``EvalCallback``.
+
+    Every ``eval_freq`` calls the current model and ``VecNormalize``
+    statistics are saved to ``snapshot_dir`` and handed to an
+    ``EvalService``; training continues while the episodes run. Finished
+    evaluations are picked up on later steps (in submission order) and, like
+    ``EvalCallback``, are logged under ``eval/``, appended to
+    ``<log_path>/evaluations.npz`` and saved as ``best_model.zip`` (with its
+    ``vec_normalize.pkl``) when they beat the stage's best mean reward. The
+    ``.npz`` has ``EvalCallback``'s arrays (``timesteps``, ``results``,
+    ``ep_lengths`` and per-episode ``successes``) plus ``stages``, the
+    curriculum stage index of each evaluation.
+
+    At most ``max_pending`` evaluations are in flight; evaluations falling
+    due while the service is saturated are skipped rather than queued, so
+    the service never falls behind training. The callback can be kept
+    across curriculum stages (see ``set_stage``); results of a finished
+    stage are still logged but no longer compete for ``best_model``.
+    """
+
+    def __init__(
+        self,
+        service: EvalService,
+        env_cfg: EnvConfig,
+        snapshot_dir: Path,
+        eval_freq: int,
+        n_eval_episodes: int = 5,
+        best_model_save_path: Path | None = None,
+        log_path: Path | None = None,
+        seed: int = 0,
+        max_pending: int = 2,
+        stage_index: int = 1,
+        verbose: int = 1,
+    ) -> None:
+        """Initialize the callback.
+
+        Args:
+            service: Pool the evaluations run in
+            env_cfg: Env config of the evaluation episodes
+            snapshot_dir: Directory for the snapshots handed to the service
+            eval_freq: Evaluate every ``eval_freq`` calls
+            n_eval_episodes: Episodes per evaluation
+            best_model_save_path: Directory for ``best_model.zip``
+            log_path: Directory for ``evaluations.npz``
+            seed: Reset seed of the first episode of every evaluation
+            max_pending: Evaluations allowed in flight at once
+            stage_index: Current curriculum stage index
+            verbose: Verbosity level
+        """
+        super().__init__(verbose)
+        self._service = service
+        self._env_cfg = env_cfg
+        self._snapshot_dir = snapshot_dir
+        self._eval_freq = eval_freq
+        self._n_eval_episodes = n_eval_episodes
+        self._best_model_save_path = best_model_save_path
+        self._log_path = log_path
+        self._seed = seed
+        self._max_pending = max(1, max_pending)
+        self._stage_index = stage_index
+        self._pending: deque[tuple[int, PendingEval]] = deque()
+        self.best_mean_reward = -np.inf
+        self.last_mean_reward = -np.inf
+        self.evaluations_timesteps: list[int] = []
+        self.evaluations_results: list[list[float]] = []
+        self.evaluations_length: list[list[int]] = []
+        self.evaluations_successes: list[list[bool]] = []
+        self.evaluations_stages: list[int] = []
+        self._snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    def set_stage(self, stage_index: int, env_cfg: EnvConfig) -> None:
+        """Start a new curriculum stage: new eval env config, fresh best."""
+        self._stage_index = stage_index
+        self._env_cfg = env_cfg
+        self.best_mean_reward = -np.inf
+
+    def _on_step(self) -> bool:
+        self._collect()
+        if self._eval_freq > 0 and self.n_calls % self._eval_freq == 0:
+            self._submit()
+        return True
+
+    def wait(self) -> None:
+        """Block until every pending evaluation has been recorded and logged."""
+        if not self._pending:
+            return
+        while self._pending:
+            stage_index, pending = self._pending.popleft()
+            self._record(stage_index, pending)
+        # Training has stopped, so no rollout end dumps these records
+        self.logger.dump(self.num_timesteps)
+
+    def _submit(self) -> None:
+        if len(self._pending) >= self._max_pending:
+            if self.verbose > 0:
+                log(
+                    f"[AsyncEval] Skipping evaluation at {self.num_timesteps} "
+                    f"steps: {len(self._pending)} evaluations still running"
+                )
+            return
+        model_path = self._snapshot_dir / f"snapshot_{self.num_timesteps}_steps.zip"
+        self.model.save(model_path)
+        vec_normalize = self.model.get_vec_normalize_env()
+        stats_path = None
+        if vec_normalize is not None:
+            stats_path = model_path.with_name(
+                f"snapshot_{self.num_timesteps}_steps_vecnormalize.pkl"
+            )
+            vec_normalize.save(str(stats_path))
+        pending = self._service.submit(
+            self.num_timesteps,
+            model_path,
+            stats_path,
+            self._env_cfg,
+            self._n_eval_episodes,
+            seed=self._seed,
+        )
+        self._pending.append((self._stage_index, pending))
+
+    def _collect(self) -> None:
+        while self._pending and self._pending[0][1].done():
+            stage_index, pending = self._pending.popleft()
+            self._record(stage_index, pending)
+
+    def _record(self, stage_index: int, pending: PendingEval) -> None:
+        try:
+            result = pending.result()
+        except Exception as exc:
+            log(
+                f"[AsyncEval] Evaluation at {pending.timesteps} steps failed: {exc}",
+                level="warning",
+            )
+            self._remove_snapshot(pending.model_path, pending.stats_path)
+            return
+
+        self.evaluations_timesteps.append(result.timesteps)
+        self.evaluations_results.append(result.rewards)
+        self.evaluations_length.append(result.lengths)
+        self.evaluations_successes.append(result.successes)
+        self.evaluations_stages.append(stage_index)
+        if self._log_path is not None:
+            self._log_path.mkdir(parents=True, exist_ok=True)
+            np.savez(
+                self._log_path / "evaluations",
+                timesteps=self.evaluations_timesteps,
+                results=self.evaluations_results,
+                ep_lengths=self.evaluations_length,
+                successes=self.evaluations_successes,
+                stages=self.evaluations_stages,
+            )
+
+        self.last_mean_reward = result.mean_reward
+        self.logger.record("eval/timesteps", result.timesteps)
+        self.logger.record("eval/mean_reward", result.mean_reward)
+        self.logger.record("eval/mean_ep_length", result.mean_length)
+        self.logger.record("eval/success_rate", result.success_rate)
+        if self.verbose > 0:
+            log(
+                f"[AsyncEval] {result.timesteps} steps: "
+                f"reward={result.mean_reward:.2f} +/- {np.std(result.rewards):.2f}, "
+                f"length={result.mean_length:.1f}, "
+                f"success={result.success_rate:.0%}"
+            )
+
+        is_best = result.mean_reward > self.best_mean_reward
+        if stage_index == self._stage_index and is_best:
+            self.best_mean_reward = result.mean_reward
+            if self._best_model_save_path is not None:
+                self._save_best(result)
+                return
+        self._remove_snapshot(result.model_path, result.stats_path)
+
+    def _save_best(self, result: EvalResult) -> None:
+        assert self._best_model_save_path is not None
+        self._best_model_save_path.mkdir(parents=True, exist_ok=True)
+        os.replace(result.model_path, self._best_model_save_path / "best_model.zip")
+        stats_target = self._best_model_save_path / "vec_normalize.pkl"
+        if result.stats_path is not None:
+            os.replace(result.stats_path, stats_target)
+        elif stats_target.exists():
+            stats_target.unlink()
+        if self.verbose > 0:
+            log(f"[AsyncEval] New best mean reward {result.mean_reward:.2f}")
+
+    @staticmethod
+    def _remove_snapshot(model_path: Path, stats_path: Path | None) -> None:
+        model_path.unlink(missing_ok=True)
+        if stats_path is not None:
+            stats_path.unlink(missing_ok=True)
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
-import subprocess
-import sys
+import re
 from pathlib import Path
 
 from stable_baselines3.common.callbacks import BaseCallback
 
+from simhops.train.checkpoint_eval import CheckpointEvalDaemon, CheckpointJob
+
 
 class EvalCheckpointCallback(BaseCallback):
     """Callback that runs evaluation on checkpoints and saves to .rrd files.
 
-    Triggers at checkpoint save frequency and spawns a subprocess to run
-    evaluation, saving results to .rrd files for visualization correlation.
+    Triggers at checkpoint save frequency and queues the new checkpoint on a
+    ``CheckpointEvalDaemon``, whose persistent workers record the evaluation
+    to .rrd files for visualization correlation. Checkpoints arriving while
+    the daemon's backlog is full are skipped.
     """
 
     def __init__(
         self,
+        daemon: CheckpointEvalDaemon,
         checkpoint_dir: Path,
         eval_rrd_dir: Path,
         checkpoint_freq: int,
@@ -29,6 +33,7 @@ class EvalCheckpointCallback(BaseCallback):
         """Initialize evaluation checkpoint callback.
 
         Args:
+            daemon: Evaluation workers the checkpoints are queued on
             checkpoint_dir: Directory where checkpoints are saved
             eval_rrd_dir: Directory to save evaluation .rrd files
             checkpoint_freq: Checkpoint frequency (in timesteps)
@@ -38,6 +43,7 @@ class EvalCheckpointCallback(BaseCallback):
             verbose: Verbosity level
         """
         super().__init__(verbose)
+        self._daemon = daemon
         self._checkpoint_dir = checkpoint_dir
         self._eval_rrd_dir = eval_rrd_dir
         self._checkpoint_freq = checkpoint_freq
@@ -45,10 +51,16 @@ class EvalCheckpointCallback(BaseCallback):
         self._stage_index = stage_index
         self._stage_name = stage_name
         self._last_eval_timestep = 0
+        self._prefix = f"ppo_quadcopter_stage_{stage_index}"
+        self._evaluated_steps = -1
 
         # Create eval recording directory
         self._eval_rrd_dir.mkdir(parents=True, exist_ok=True)
 
+    def _on_training_start(self) -> None:
+        # Timesteps carry over between curriculum stages
+        self._last_eval_timestep = self.num_timesteps
+
     def _on_step(self) -> bool:
         """Check if we should trigger evaluation."""
         # Check if we've passed a checkpoint boundary
@@ -58,50 +70,58 @@ class EvalCheckpointCallback(BaseCallback):
 
         return True
 
-    def _run_evaluation(self) -> None:
-        """Spawn subprocess to run evaluation and save to .rrd."""
-        # Find the most recent checkpoint
-        checkpoint_pattern = f"ppo_quadcopter_stage_{self._stage_index}_{self.num_timesteps}_steps.zip"
-        checkpoint_path = self._checkpoint_dir / checkpoint_pattern
+    def _latest_checkpoint(self) -> tuple[int, Path] | None:
+        """Step count and path of the newest checkpoint of this stage."""
+        pattern = re.compile(rf"{re.escape(self._prefix)}_(\d+)_steps\.zip")
+        checkpoints = [
+            (int(match.group(1)), path)
+            for path in self._checkpoint_dir.glob(f"{self._prefix}_*_steps.zip")
+            if (match := pattern.fullmatch(path.name)) is not None
+        ]
+        return max(checkpoints, default=None)
 
-        if not checkpoint_path.exists():
+    def _run_evaluation(self) -> None:
+        """Queue the latest checkpoint for evaluation to .rrd."""
+        # Find the most recent checkpoint (CheckpointCallback names it after
+        # its own step count, which need not match ours)
+        latest = self._latest_checkpoint()
+        if latest is None or latest[0] <= self._evaluated_steps:
             if self.verbose > 0:
-                print(f"[EvalCheckpoint] Checkpoint not found: {checkpoint_path}")
+                print(
+                    f"[EvalCheckpoint] No new checkpoint in {self._checkpoint_dir} "
+                    f"at {self.num_timesteps} steps"
+                )
             return
+        steps, checkpoint_path = latest
 
-        # Output .rrd file path
-        output_rrd = self._eval_rrd_dir / f"eval_stage_{self._stage_index}_{self.num_timesteps}.rrd"
-
-        # Build command to run evaluation
-        # We'll call eval_to_rrd directly via Python
-        cmd = [
-            sys.executable,
-            "-c",
-            f"from pathlib import Path; "
-            f"from simhops.evaluate import eval_to_rrd; "
-            f"eval_to_rrd("
-            f"'{checkpoint_path}', "
-            f"Path('{output_rrd}'), "
-            f"episodes={self._n_eval_episodes}, "
-            f"recording_name='eval:{self._stage_name}:{self.num_timesteps}', "
-            f"spawn_viewer=True"
-            f")",
-        ]
+        vec_normalize_path = (
+            self._checkpoint_dir / f"{self._prefix}_vecnormalize_{steps}_steps.pkl"
+        )
 
-        if self.verbose > 0:
+        # Output .rrd file path
+        output_rrd = self._eval_rrd_dir / f"eval_stage_{self._stage_index}_{steps}.rrd"
+
+        job = CheckpointJob(
+            checkpoint_path=str(checkpoint_path),
+            output_rrd=str(output_rrd),
+            episodes=self._n_eval_episodes,
+            recording_name=f"eval:{self._stage_name}:{steps}",
+            vec_normalize_path=str(vec_normalize_path)
+            if vec_normalize_path.exists()
+            else None,
+            stage_index=self._stage_index,
+            stage_name=self._stage_name,
+            timesteps=steps,
+        )
+        if self._daemon.submit(job):
+            self._evaluated_steps = steps
+            if self.verbose > 0:
+                print(
+                    f"[EvalCheckpoint] Queued evaluation at {steps} steps "
+                    f"-> {output_rrd.name}"
+                )
+        elif self.verbose > 0:
             print(
-                f"[EvalCheckpoint] Running evaluation at {self.num_timesteps} steps "
-                f"-> {output_rrd.name}"
+                f"[EvalCheckpoint] Skipping {checkpoint_path.name}: "
+                f"{self._daemon.backlog} evaluations already pending"
             )
-
-        # Run subprocess in background (non-blocking)
-        try:
-            subprocess.Popen(
-                cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
-        except Exception as e:
-            if self.verbose > 0:
-                print(f"[EvalCheckpoint] Failed to spawn evaluation: {e}")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 
 from stable_baselines3.common.callbacks import BaseCallback
@@ -9,6 +11,12 @@ from stable_baselines3.common.callbacks import BaseCallback
 from simhops.train.metrics import MetricsLogger
 
 
+def _train_value(name_to_value: dict[str, Any], key: str) -> float | None:
+    """Logged ``train/<key>`` as a plain float (SB3 logs NumPy scalars)."""
+    value = name_to_value.get(f"train/{key}")
+    return float(value) if value is not None else None
+
+
 class MetricsLoggerCallback(BaseCallback):
     """Callback that writes agent-friendly CSV/JSON logs."""
 
@@ -121,12 +129,12 @@ class MetricsLoggerCallback(BaseCallback):
         row = {
             "update": self._update_count,
             "timestep": int(self.num_timesteps),
-            "policy_loss": name_to_value.get("train/policy_gradient_loss"),
-            "value_loss": name_to_value.get("train/value_loss"),
-            "entropy": name_to_value.get("train/entropy_loss"),
-            "kl_divergence": name_to_value.get("train/approx_kl"),
-            "clip_fraction": name_to_value.get("train/clip_fraction"),
-            "explained_variance": name_to_value.get("train/explained_variance"),
+            "policy_loss": _train_value(name_to_value, "policy_gradient_loss"),
+            "value_loss": _train_value(name_to_value, "value_loss"),
+            "entropy": _train_value(name_to_value, "entropy_loss"),
+            "kl_divergence": _train_value(name_to_value, "approx_kl"),
+            "clip_fraction": _train_value(name_to_value, "clip_fraction"),
+            "explained_variance": _train_value(name_to_value, "explained_variance"),
             "learning_rate": learning_rate,
             "mean_episode_reward": mean_reward,
         }
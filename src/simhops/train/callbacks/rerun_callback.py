@@ -56,10 +56,22 @@ class TrainingMetricsCallback(BaseCallback):
         # Log waypoints from first environment (static reference)
         if not self._waypoints_logged:
             infos = self.locals.get("infos", [])
+            waypoints = None
             if infos and "waypoints" in infos[0]:
                 waypoints = infos[0]["waypoints"]
+            elif hasattr(self.training_env, "env_method"):
+                # Lean info modes leave waypoints out of the step infos
+                try:
+                    truth = self.training_env.env_method(
+                        "get_ground_truth", indices=[0]
+                    )[0]
+                except AttributeError:
+                    truth = None
+                if truth is not None:
+                    waypoints = truth["waypoints"]
+            if waypoints is not None:
                 self._viz.env.log_waypoints(waypoints, 0, radius=1.0)
-                self._waypoints_logged = True
+            self._waypoints_logged = True
         
         # Check for completed episodes
         for info in self.locals.get("infos", []):
@@ -0,0 +1,265 @@
+"""Long-lived worker processes evaluating training checkpoints to ``.rrd``.
+
+``CheckpointEvalDaemon`` starts its workers once per training run. Each
+worker loads the config and builds the evaluation env and a model once, then
+takes checkpoint jobs from a local queue, loads each checkpoint's parameters
+into that model and records its episodes with ``record_episodes``.
+Per-episode results come back to the training process, which appends them to
+a CSV.
+
+At most ``max_backlog`` checkpoints are queued or running at once; jobs
+submitted beyond that are rejected, so evaluation never lags more than
+``max_backlog`` checkpoints behind training and never blocks it.
+"""
+
+from __future__ import annotations
+
+import csv
+import multiprocessing as mp
+import queue
+import signal
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import torch as th
+from stable_baselines3 import PPO
+
+from simhops.config import Config
+from simhops.evaluate import load_obs_rms, make_eval_env, record_episodes
+from simhops.logging import log
+
+CSV_FIELDS = (
+    "checkpoint",
+    "stage_index",
+    "stage_name",
+    "timesteps",
+    "episode",
+    "reward",
+    "length",
+    "waypoints_reached",
+    "success",
+    "crash_type",
+    "completion_time_s",
+    "rrd",
+)
+
+
+@dataclass(frozen=True)
+class CheckpointJob:
+    """One checkpoint to evaluate into ``output_rrd``."""
+
+    checkpoint_path: str
+    output_rrd: str
+    episodes: int
+    recording_name: str
+    vec_normalize_path: str | None = None
+    stage_index: int = 1
+    stage_name: str = "default"
+    timesteps: int = 0
+
+
+class CheckpointEvalDaemon:
+    """Persistent checkpoint evaluation workers fed through a queue.
+
+    Args:
+        results_csv: CSV the per-episode results are appended to
+        n_workers: Worker processes (checkpoints evaluated at once)
+        max_backlog: Checkpoints allowed queued or running at once
+        spawn_viewer: Also stream every recording to a Rerun viewer
+        config_path: YAML config loaded by the workers; defaults to the
+            config loaded in this process
+        start_method: ``multiprocessing`` start method; defaults to
+            ``forkserver`` where available and ``spawn`` otherwise
+    """
+
+    def __init__(
+        self,
+        results_csv: Path,
+        n_workers: int = 1,
+        max_backlog: int = 2,
+        spawn_viewer: bool = True,
+        config_path: str | Path | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+        if max_backlog < 1:
+            raise ValueError(f"max_backlog must be >= 1, got {max_backlog}")
+        if config_path is None:
+            config_path = Config.path()
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        ctx = mp.get_context(start_method)
+        self.results_csv = results_csv
+        self.max_backlog = max_backlog
+        self._outstanding = 0
+        self._closed = False
+        self._jobs: mp.Queue[CheckpointJob | None] = ctx.Queue()
+        self._results: mp.Queue[
+            tuple[CheckpointJob, dict[str, Any] | None, str | None]
+        ] = ctx.Queue()
+        self._workers = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    str(config_path) if config_path is not None else None,
+                    self._jobs,
+                    self._results,
+                    spawn_viewer,
+                ),
+                daemon=True,
+                name=f"CheckpointEval-{index}",
+            )
+            for index in range(n_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def backlog(self) -> int:
+        """Checkpoints submitted but not yet finished (as of the last poll)."""
+        return self._outstanding
+
+    def submit(self, job: CheckpointJob) -> bool:
+        """Queue a checkpoint; False (job dropped) if the backlog is full."""
+        if self._closed:
+            raise RuntimeError("CheckpointEvalDaemon is closed")
+        self.poll()
+        if self._outstanding >= self.max_backlog:
+            return False
+        self._jobs.put(job)
+        self._outstanding += 1
+        return True
+
+    def poll(self, timeout: float | None = None) -> int:
+        """Record finished evaluations; returns how many were recorded.
+
+        Args:
+            timeout: Wait up to this many seconds for the first result;
+                None only takes results that are already available
+        """
+        finished = 0
+        while self._outstanding:
+            try:
+                if timeout is not None and finished == 0:
+                    job, stats, error = self._results.get(timeout=timeout)
+                else:
+                    job, stats, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._outstanding -= 1
+            finished += 1
+            self._record(job, stats, error)
+        return finished
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the workers, first finishing the backlog when ``wait``."""
+        if self._closed:
+            return
+        self._closed = True
+        if wait:
+            while self._outstanding and any(w.is_alive() for w in self._workers):
+                self.poll(timeout=1.0)
+            for _ in self._workers:
+                self._jobs.put(None)
+            for worker in self._workers:
+                worker.join()
+        else:
+            for worker in self._workers:
+                worker.terminate()
+                worker.join()
+        if self._outstanding:
+            log(
+                f"[CheckpointEval] {self._outstanding} checkpoint evaluations "
+                "did not finish",
+                level="warning",
+            )
+
+    def _record(
+        self, job: CheckpointJob, stats: dict[str, Any] | None, error: str | None
+    ) -> None:
+        if stats is None:
+            log(
+                f"[CheckpointEval] {job.checkpoint_path} failed: {error}",
+                level="warning",
+            )
+            return
+        log(
+            f"[CheckpointEval] {Path(job.checkpoint_path).name}: "
+            f"reward={stats['mean_reward']:.2f}, "
+            f"success={stats['success_rate']:.0%} -> {Path(job.output_rrd).name}"
+        )
+        self.results_csv.parent.mkdir(parents=True, exist_ok=True)
+        write_header = not self.results_csv.exists()
+        with self.results_csv.open("a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            if write_header:
+                writer.writeheader()
+            for episode in stats["episodes"]:
+                writer.writerow(
+                    {
+                        "checkpoint": job.checkpoint_path,
+                        "stage_index": job.stage_index,
+                        "stage_name": job.stage_name,
+                        "timesteps": job.timesteps,
+                        "rrd": job.output_rrd,
+                        **episode,
+                    }
+                )
+
+
+def _load_model(model: PPO | None, path: str) -> PPO:
+    """Load a checkpoint, reusing ``model`` when its architecture matches.
+
+    Every checkpoint of a run has the same policy, so only its parameters
+    need loading; a new model is built for the first checkpoint or when the
+    parameters do not fit.
+    """
+    if model is not None:
+        try:
+            model.set_parameters(path, device="cpu")
+            return model
+        except (RuntimeError, ValueError):
+            pass
+    return PPO.load(path, device="cpu")
+
+
+def _worker_main(
+    config_path: str | None,
+    jobs: mp.Queue[CheckpointJob | None],
+    results: mp.Queue[tuple[CheckpointJob, dict[str, Any] | None, str | None]],
+    spawn_viewer: bool,
+) -> None:
+    """Evaluate queued checkpoints until a None job arrives."""
+    # Ctrl+C is for the trainer, which finishes or stops the backlog itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if config_path is not None:
+        Config.load(config_path)
+    th.set_num_threads(1)
+    model: PPO | None = None
+    env = make_eval_env()
+    try:
+        while (job := jobs.get()) is not None:
+            try:
+                obs_rms = None
+                if job.vec_normalize_path is not None:
+                    obs_rms = load_obs_rms(Path(job.vec_normalize_path))
+                model = _load_model(model, job.checkpoint_path)
+                stats = record_episodes(
+                    model,
+                    env,
+                    obs_rms,
+                    Path(job.output_rrd),
+                    episodes=job.episodes,
+                    recording_name=job.recording_name,
+                    spawn_viewer=spawn_viewer,
+                    model_path=job.checkpoint_path,
+                )
+            except Exception as exc:
+                results.put((job, None, repr(exc)))
+            else:
+                results.put((job, stats, None))
+    finally:
+        env.close()
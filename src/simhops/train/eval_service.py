@@ -0,0 +1,244 @@
+"""Policy evaluation in a pool of worker processes.
+
+``EvalService`` runs evaluation episodes of saved policy snapshots off the
+training process: each evaluation is a model ``.zip`` plus the matching
+``VecNormalize`` statistics (both written with ``save``), and every episode
+is one task, so a pool of ``n_workers`` processes evaluates up to that many
+episodes at once. Workers keep their last model, statistics and env, so
+consecutive episodes of one snapshot only pay for the rollout.
+
+Episode ``i`` of every evaluation is reset with seed ``seed + i``, so all
+snapshots are scored on the same courses and start states.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import torch as th
+from stable_baselines3 import PPO
+from stable_baselines3.common.vec_env import VecNormalize
+
+from simhops.config import Config
+from simhops.config.schema import EnvConfig
+from simhops.envs.quadcopter_env import FIXED_ENV_SETTINGS, QuadcopterEnv
+from simhops.envs.vec_normalize import load_normalization
+
+
+@dataclass(frozen=True)
+class EpisodeResult:
+    """Outcome of one evaluation episode."""
+
+    reward: float
+    length: int
+    success: bool
+
+
+@dataclass
+class EvalResult:
+    """Episodes of one evaluated snapshot.
+
+    Attributes:
+        timesteps: Training timesteps at which the snapshot was taken
+        model_path: Snapshot model ``.zip``
+        stats_path: Snapshot ``VecNormalize`` statistics, if any
+        episodes: Per-episode outcomes, in seed order
+    """
+
+    timesteps: int
+    model_path: Path
+    stats_path: Path | None
+    episodes: list[EpisodeResult]
+
+    @property
+    def rewards(self) -> list[float]:
+        return [episode.reward for episode in self.episodes]
+
+    @property
+    def lengths(self) -> list[int]:
+        return [episode.length for episode in self.episodes]
+
+    @property
+    def mean_reward(self) -> float:
+        return float(np.mean(self.rewards))
+
+    @property
+    def mean_length(self) -> float:
+        return float(np.mean(self.lengths))
+
+    @property
+    def successes(self) -> list[bool]:
+        return [episode.success for episode in self.episodes]
+
+    @property
+    def success_rate(self) -> float:
+        return float(np.mean(self.successes))
+
+
+class PendingEval:
+    """Handle to an evaluation still running in the pool."""
+
+    def __init__(
+        self,
+        timesteps: int,
+        model_path: Path,
+        stats_path: Path | None,
+        futures: list[Future[EpisodeResult]],
+    ) -> None:
+        self.timesteps = timesteps
+        self.model_path = model_path
+        self.stats_path = stats_path
+        self._futures = futures
+
+    def done(self) -> bool:
+        """Whether every episode has finished (or failed)."""
+        return all(future.done() for future in self._futures)
+
+    def result(self, timeout: float | None = None) -> EvalResult:
+        """Wait for all episodes; re-raises the first worker error."""
+        episodes = [future.result(timeout) for future in self._futures]
+        return EvalResult(self.timesteps, self.model_path, self.stats_path, episodes)
+
+    def cancel(self) -> None:
+        """Cancel episodes that have not started yet."""
+        for future in self._futures:
+            future.cancel()
+
+
+class EvalService:
+    """Process pool evaluating policy snapshots asynchronously.
+
+    Args:
+        n_workers: Worker processes (episodes evaluated at once)
+        config_path: YAML config loaded by every worker; defaults to the
+            config loaded in this process
+        start_method: ``multiprocessing`` start method; defaults to
+            ``forkserver`` where available and ``spawn`` otherwise
+    """
+
+    def __init__(
+        self,
+        n_workers: int = 2,
+        config_path: str | Path | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        if n_workers < 1:
+            raise ValueError(f"n_workers must be >= 1, got {n_workers}")
+        if config_path is None:
+            config_path = Config.path()
+        if start_method is None:
+            forkserver_available = "forkserver" in mp.get_all_start_methods()
+            start_method = "forkserver" if forkserver_available else "spawn"
+        self.n_workers = n_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=mp.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(str(config_path) if config_path is not None else None,),
+        )
+
+    def submit(
+        self,
+        timesteps: int,
+        model_path: str | Path,
+        stats_path: str | Path | None,
+        env_cfg: EnvConfig,
+        n_episodes: int,
+        seed: int = 0,
+    ) -> PendingEval:
+        """Queue ``n_episodes`` deterministic episodes of a saved snapshot.
+
+        Args:
+            timesteps: Training timesteps the snapshot was taken at
+            model_path: Model saved with ``PPO.save``
+            stats_path: ``VecNormalize`` saved with ``save``; None evaluates
+                on raw observations
+            env_cfg: Env config of the evaluation episodes
+            n_episodes: Number of episodes
+            seed: Reset seed of the first episode
+        """
+        model_path = Path(model_path)
+        stats_path = Path(stats_path) if stats_path is not None else None
+        futures = [
+            self._executor.submit(
+                _run_episode,
+                str(model_path),
+                str(stats_path) if stats_path is not None else None,
+                env_cfg,
+                seed + episode,
+            )
+            for episode in range(n_episodes)
+        ]
+        return PendingEval(timesteps, model_path, stats_path, futures)
+
+    def close(self, wait: bool = True) -> None:
+        """Shut the pool down; queued episodes are cancelled."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+# Per-worker caches: the last model, statistics and env used
+_model: tuple[str, PPO] | None = None
+_stats: tuple[str | None, VecNormalize | None] = (None, None)
+_env: tuple[EnvConfig, QuadcopterEnv] | None = None
+
+
+def _init_worker(config_path: str | None) -> None:
+    if config_path is not None:
+        Config.load(config_path)
+    # Episodes run in parallel processes; one thread each avoids oversubscription
+    th.set_num_threads(1)
+
+
+def _worker_env(env_cfg: EnvConfig) -> QuadcopterEnv:
+    """Cached eval env, reconfigured or rebuilt when ``env_cfg`` changes."""
+    global _env
+    if _env is not None and _env[0] == env_cfg:
+        return _env[1]
+    if _env is not None and all(
+        getattr(_env[0], name) == getattr(env_cfg, name)
+        for name in FIXED_ENV_SETTINGS
+    ):
+        env = _env[1]
+    else:
+        if _env is not None:
+            _env[1].close()
+        env = QuadcopterEnv(
+            render_mode=None,
+            include_position=env_cfg.include_position,
+            copy_observations=False,
+        )
+    env.configure(env_cfg)
+    _env = (env_cfg, env)
+    return env
+
+
+def _run_episode(
+    model_path: str, stats_path: str | None, env_cfg: EnvConfig, seed: int
+) -> EpisodeResult:
+    """Run one deterministic episode in a worker process."""
+    global _model, _stats
+    if _model is None or _model[0] != model_path:
+        _model = (model_path, PPO.load(model_path, device="cpu"))
+    if _stats[0] != stats_path:
+        stats = load_normalization(stats_path) if stats_path is not None else None
+        _stats = (stats_path, stats)
+    model, normalizer = _model[1], _stats[1]
+    env = _worker_env(env_cfg)
+
+    obs, info = env.reset(seed=seed)
+    total_reward = 0.0
+    length = 0
+    done = False
+    while not done:
+        if normalizer is not None:
+            obs = normalizer.normalize_obs(obs)
+        action, _ = model.predict(obs, deterministic=True)
+        obs, reward, terminated, truncated, info = env.step(action)
+        total_reward += float(reward)
+        length += 1
+        done = terminated or truncated
+    return EpisodeResult(total_reward, length, bool(info.get("success", False)))
@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 import argparse
+import re
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import BaseCallback, CheckpointCallback, EvalCallback
 from stable_baselines3.common.env_util import make_vec_env
-from stable_baselines3.common.vec_env import SubprocVecEnv, VecNormalize
+from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import (
+    DummyVecEnv,
+    SubprocVecEnv,
+    VecEnv,
+    VecMonitor,
+    VecNormalize,
+)
 
 from simhops.config import Config
-from simhops.config.schema import CurriculumStageConfig, EnvConfig
+from simhops.config.schema import CurriculumStageConfig, EnvConfig, SimHopsConfig
+from simhops.envs.batched_env import BatchedQuadcopterVecEnv
+from simhops.envs.multi_drone_env import MultiDroneVecEnv
 from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+from simhops.envs.vec_normalize import (
+    DtypeVecNormalize,
+    load_normalization,
+    transfer_normalization,
+)
 from simhops.train.callbacks import (
+    AsyncEvalCallback,
     EvalCheckpointCallback,
     ExperimentSnapshotCallback,
     MetricsLoggerCallback,
@@ -22,6 +41,9 @@ from simhops.train.callbacks import (
 )
 from simhops.logging import log, log_run_start, setup_run_logging
 from simhops.logging import run_id as current_run_id
+from simhops.train.async_ppo import AsyncPPO
+from simhops.train.checkpoint_eval import CheckpointEvalDaemon
+from simhops.train.eval_service import EvalService
 from simhops.train.metrics import MetricsLogger
 
 
@@ -66,7 +88,211 @@ def _apply_stage_env(cfg: EnvConfig, stage: CurriculumStageConfig | None) -> Env
         speed_normalization=env_cfg.speed_normalization,
         bounds_margin=env_cfg.bounds_margin,
         ground_threshold=env_cfg.ground_threshold,
-        timestep=env_cfg.timestep,
+        physics_dt=env_cfg.physics_dt,
+        control_dt=env_cfg.control_dt,
+        integrator=env_cfg.integrator,
+        model_cache_dir=env_cfg.model_cache_dir,
+        reset_pool_size=env_cfg.reset_pool_size,
+        course_bank_size=env_cfg.course_bank_size,
+        course_bank_seed=env_cfg.course_bank_seed,
+        course_bank_dir=env_cfg.course_bank_dir,
+        course_file=env_cfg.course_file,
+        dtype=env_cfg.dtype,
+        info_mode=env_cfg.info_mode,
+    )
+
+
+def _make_env_fn(stage_env_cfg: EnvConfig) -> Callable[[], QuadcopterEnv]:
+    """Return a factory for training ``QuadcopterEnv`` instances.
+
+    Worker processes started with ``forkserver`` or ``spawn`` do not inherit
+    the loaded config; the factory loads this process's config file there
+    first, so settings read from ``Config`` (reward, quadcopter, sensor and
+    the remaining env settings) match the trainer's.
+    """
+    config_path = Config.path()
+
+    def _make_env() -> QuadcopterEnv:
+        if config_path is not None and Config.path() != config_path:
+            Config.load(config_path)
+        return QuadcopterEnv(
+            render_mode=None,
+            add_sensor_noise=stage_env_cfg.add_sensor_noise,
+            include_position=stage_env_cfg.include_position,
+            waypoint_noise=stage_env_cfg.waypoint_noise,
+            waypoint_yaw_random=stage_env_cfg.waypoint_yaw_random,
+            disable_tilt_termination=stage_env_cfg.disable_tilt_termination,
+            random_start_waypoint=stage_env_cfg.random_start_waypoint,
+            max_waypoints=stage_env_cfg.max_waypoints,
+            max_episode_steps=stage_env_cfg.max_episode_steps,
+            action_scale=stage_env_cfg.action_scale,
+            random_start_position=stage_env_cfg.random_start_position,
+            start_position_noise=stage_env_cfg.start_position_noise,
+            info_mode=stage_env_cfg.info_mode,
+            course_file=stage_env_cfg.course_file,
+            physics_dt=stage_env_cfg.physics_dt,
+            control_dt=stage_env_cfg.control_dt,
+            integrator=stage_env_cfg.integrator,
+            dtype=stage_env_cfg.dtype,
+            # Vec envs copy or pickle every observation they receive
+            copy_observations=False,
+        )
+
+    return _make_env
+
+
+def _eval_env_config(cfg: SimHopsConfig, stage_env_cfg: EnvConfig) -> EnvConfig:
+    """Stage env config with the evaluation overrides applied."""
+    eval_env_cfg = cfg.evaluation.env
+    return replace(
+        stage_env_cfg,
+        add_sensor_noise=eval_env_cfg.add_sensor_noise,
+        include_position=eval_env_cfg.include_position,
+        waypoint_noise=eval_env_cfg.waypoint_noise,
+        waypoint_yaw_random=eval_env_cfg.waypoint_yaw_random,
+        disable_tilt_termination=eval_env_cfg.disable_tilt_termination,
+    )
+
+
+def _make_eval_env(
+    cfg: SimHopsConfig, eval_env_cfg: EnvConfig, train_env: VecEnv
+) -> VecEnv:
+    """Single-env eval VecEnv with the same wrapper chain as ``train_env``.
+
+    ``EvalCallback`` syncs VecNormalize statistics by walking both wrapper
+    chains in step, so a VecMonitor-wrapped training env needs a
+    VecMonitor-wrapped eval env.
+    """
+    seed = cfg.training.seed + 1000
+    if isinstance(train_env, VecMonitor):
+        eval_env = VecMonitor(DummyVecEnv([_make_env_fn(eval_env_cfg)]))
+        eval_env.seed(seed)
+        return eval_env
+    return make_vec_env(_make_env_fn(eval_env_cfg), n_envs=1, seed=seed)
+
+
+def _reconfigure_env(env: VecEnv, env_cfg: EnvConfig) -> None:
+    """Apply a stage's env config to every env of a live VecEnv in place.
+
+    Worker processes, physics models and wrappers are kept; the new settings
+    take effect from the next reset.
+    """
+    base_env = env.unwrapped
+    if isinstance(base_env, BatchedQuadcopterVecEnv):
+        base_env.configure(env_cfg)
+    else:
+        env.env_method("configure", env_cfg)
+
+
+def _find_resume_vecnormalize(cfg: SimHopsConfig, model_path: str) -> Path | None:
+    """VecNormalize statistics saved alongside the checkpoint being resumed.
+
+    Uses ``training.resume_vecnormalize`` when set; otherwise looks for, in
+    order, ``<model>_vecnormalize.pkl`` (stage checkpoints), the file
+    ``CheckpointCallback`` saves with ``<prefix>_<steps>_steps`` models and
+    ``vec_normalize.pkl`` in the model's directory (final models).
+    """
+    if cfg.training.resume_vecnormalize is not None:
+        return Path(cfg.training.resume_vecnormalize)
+    model = Path(model_path)
+    stem = model.name.removesuffix(".zip")
+    candidates = [model.with_name(f"{stem}_vecnormalize.pkl")]
+    match = re.fullmatch(r"(.+)_(\d+)_steps", stem)
+    if match is not None:
+        prefix, steps = match.groups()
+        checkpoint_stats = f"{prefix}_vecnormalize_{steps}_steps.pkl"
+        candidates.append(model.with_name(checkpoint_stats))
+    candidates.append(model.with_name("vec_normalize.pkl"))
+    return next((path for path in candidates if path.exists()), None)
+
+
+def _carry_normalization(
+    cfg: SimHopsConfig,
+    env: VecNormalize,
+    previous: VecNormalize | None,
+    stage: CurriculumStageConfig | None,
+) -> None:
+    """Seed a stage's VecNormalize with the statistics gathered so far.
+
+    Statistics come from the previous stage's wrapper, decayed or reset as
+    configured for ``stage``; for the first stage of a resumed run they are
+    loaded unchanged from the resumed checkpoint.
+    """
+    if previous is not None:
+        decay = cfg.vecnormalize.stage_decay
+        reset = cfg.vecnormalize.stage_reset
+        if stage is not None and stage.vecnormalize_decay is not None:
+            decay = stage.vecnormalize_decay
+        if stage is not None and stage.vecnormalize_reset is not None:
+            reset = stage.vecnormalize_reset
+        log(f"Carrying VecNormalize statistics (decay={decay}, reset={reset})")
+        transfer_normalization(previous, env, decay=decay, reset=reset)
+        return
+    if not cfg.training.resume_from:
+        return
+    stats_path = _find_resume_vecnormalize(cfg, cfg.training.resume_from)
+    if stats_path is None:
+        log(
+            "No VecNormalize statistics found for the resumed model; "
+            "starting from fresh statistics",
+            level="warning",
+        )
+        return
+    log(f"Loading VecNormalize statistics from {stats_path}")
+    transfer_normalization(load_normalization(stats_path), env)
+
+
+def _make_train_env(cfg: SimHopsConfig, stage_env_cfg: EnvConfig) -> VecEnv:
+    """Create the vectorized training env for the configured backend."""
+    vec_env = cfg.training.vec_env
+    n_envs = cfg.training.n_envs
+    async_batch_size = cfg.training.async_batch_size
+    if async_batch_size is not None and vec_env != "shared_memory":
+        raise ValueError("training.async_batch_size needs vec_env: shared_memory")
+    if vec_env == "batched":
+        return VecMonitor(
+            BatchedQuadcopterVecEnv(
+                n_envs,
+                env_cfg=stage_env_cfg,
+                seed=cfg.training.seed,
+            )
+        )
+    if vec_env == "multi_drone":
+        env_fn = _make_env_fn(stage_env_cfg)
+        multi_env = MultiDroneVecEnv([env_fn for _ in range(n_envs)])
+        multi_env.seed(cfg.training.seed)
+        return VecMonitor(multi_env)
+    if vec_env == "shared_memory":
+        env_fn = _make_env_fn(stage_env_cfg)
+        if async_batch_size is not None:
+            # AsyncPPO bypasses VecEnv wrappers, so episode statistics come
+            # from a Monitor inside each worker instead of VecMonitor
+            make_env = env_fn
+
+            def env_fn() -> Monitor:
+                return Monitor(make_env())
+
+        shared_env = SharedMemoryVecEnv(
+            [env_fn for _ in range(n_envs)],
+            envs_per_worker=cfg.training.envs_per_worker,
+            batch_size=async_batch_size,
+        )
+        shared_env.seed(cfg.training.seed)
+        if async_batch_size is not None:
+            return shared_env
+        return VecMonitor(shared_env)
+    if vec_env != "subproc":
+        raise ValueError(f"Unknown training.vec_env: {vec_env}")
+    if cfg.training.envs_per_worker != 1:
+        raise ValueError(
+            "training.envs_per_worker > 1 needs training.vec_env: shared_memory"
+        )
+
+    return make_vec_env(
+        _make_env_fn(stage_env_cfg),
+        n_envs=n_envs,
+        seed=cfg.training.seed,
+        vec_env_cls=SubprocVecEnv,
     )
 
 
@@ -98,183 +324,223 @@ def train() -> None:
     )
 
     model: PPO | None = None
-
-    for stage_index, stage in enumerate(stages, start=1):
-        stage_env_cfg = _apply_stage_env(cfg.env, stage)
-        stage_label = stage.name if stage is not None else "default"
-        stage_timesteps = (
-            stage.total_timesteps if stage is not None else cfg.training.total_timesteps
+    # Created for the first stage and reconfigured in place for later ones,
+    # so workers are not re-spawned at every stage boundary
+    train_env: VecEnv | None = None
+    eval_base_env: VecEnv | None = None
+    # Previous stage's wrapper, whose statistics seed the next stage's
+    vec_normalize: VecNormalize | None = None
+    # Async evaluation keeps one worker pool and callback for all stages
+    eval_service: EvalService | None = None
+    async_eval_callback: AsyncEvalCallback | None = None
+    if cfg.callbacks.async_eval:
+        eval_service = EvalService(n_workers=cfg.callbacks.async_eval_workers)
+    # One set of checkpoint evaluation workers for the whole run
+    eval_rrd_dir = run_path / "eval_recordings"
+    eval_rrd_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_eval: CheckpointEvalDaemon | None = None
+    if cfg.callbacks.eval_checkpoint_enabled:
+        checkpoint_eval = CheckpointEvalDaemon(
+            eval_rrd_dir / "eval_results.csv",
+            n_workers=cfg.callbacks.eval_checkpoint_workers,
+            max_backlog=cfg.callbacks.eval_checkpoint_max_backlog,
+            spawn_viewer=cfg.visualization.spawn,
         )
 
-        log(
-            f"Starting stage {stage_index}/{len(stages)}: {stage_label} ({stage_timesteps} timesteps)"
-        )
-        log(
-            "Env: noise={:.2f}, yaw_random={}, sensor_noise={}, random_start={}, max_waypoints={}, action_scale={}, start_pos_random={}, start_pos_noise={}".format(
-                stage_env_cfg.waypoint_noise,
-                stage_env_cfg.waypoint_yaw_random,
-                stage_env_cfg.add_sensor_noise,
-                stage_env_cfg.random_start_waypoint,
-                stage_env_cfg.max_waypoints,
-                stage_env_cfg.action_scale,
-                stage_env_cfg.random_start_position,
-                stage_env_cfg.start_position_noise,
+    try:
+        for stage_index, stage in enumerate(stages, start=1):
+            stage_env_cfg = _apply_stage_env(cfg.env, stage)
+            stage_label = stage.name if stage is not None else "default"
+            stage_timesteps = (
+                stage.total_timesteps if stage is not None else cfg.training.total_timesteps
             )
-        )
-        if stage_index == 1 and current_run_id() is not None:
-            log(f"Rerun TextLog entity: logs (run {current_run_id()})")
-
-        env = make_vec_env(
-            lambda: QuadcopterEnv(
-                render_mode=None,
-                add_sensor_noise=stage_env_cfg.add_sensor_noise,
-                include_position=stage_env_cfg.include_position,
-                waypoint_noise=stage_env_cfg.waypoint_noise,
-                waypoint_yaw_random=stage_env_cfg.waypoint_yaw_random,
-                random_start_waypoint=stage_env_cfg.random_start_waypoint,
-                max_waypoints=stage_env_cfg.max_waypoints,
-                max_episode_steps=stage_env_cfg.max_episode_steps,
-                action_scale=stage_env_cfg.action_scale,
-                random_start_position=stage_env_cfg.random_start_position,
-                start_position_noise=stage_env_cfg.start_position_noise,
-            ),
-            n_envs=cfg.training.n_envs,
-            seed=cfg.training.seed,
-            vec_env_cls=SubprocVecEnv,
-        )
 
-        env = VecNormalize(
-            env,
-            norm_obs=cfg.vecnormalize.norm_obs,
-            norm_reward=cfg.vecnormalize.norm_reward,
-            clip_obs=cfg.vecnormalize.clip_obs,
-            clip_reward=cfg.vecnormalize.clip_reward,
-            gamma=cfg.ppo.gamma,
-        )
-
-        eval_env_cfg = cfg.evaluation.env
-        eval_env = make_vec_env(
-            lambda: QuadcopterEnv(
-                render_mode=None,
-                add_sensor_noise=eval_env_cfg.add_sensor_noise,
-                include_position=eval_env_cfg.include_position,
-                waypoint_noise=eval_env_cfg.waypoint_noise,
-                waypoint_yaw_random=eval_env_cfg.waypoint_yaw_random,
-                disable_tilt_termination=eval_env_cfg.disable_tilt_termination,
-                random_start_waypoint=stage_env_cfg.random_start_waypoint,
-                max_waypoints=stage_env_cfg.max_waypoints,
-                max_episode_steps=stage_env_cfg.max_episode_steps,
-                action_scale=stage_env_cfg.action_scale,
-                random_start_position=stage_env_cfg.random_start_position,
-                start_position_noise=stage_env_cfg.start_position_noise,
-            ),
-            n_envs=1,
-            seed=cfg.training.seed + 1000,
-        )
-        eval_env = VecNormalize(
-            eval_env,
-            norm_obs=cfg.vecnormalize.norm_obs,
-            norm_reward=cfg.vecnormalize.eval_norm_reward,
-            clip_obs=cfg.vecnormalize.clip_obs,
-            training=False,
-        )
-
-        checkpoint_path = run_path / "checkpoints" / f"stage_{stage_index}"
-        checkpoint_path.mkdir(parents=True, exist_ok=True)
-        checkpoint_callback = CheckpointCallback(
-            save_freq=cfg.callbacks.checkpoint_freq // cfg.training.n_envs,
-            save_path=str(checkpoint_path),
-            name_prefix=f"ppo_quadcopter_stage_{stage_index}",
-            save_vecnormalize=True,
-        )
+            log(
+                f"Starting stage {stage_index}/{len(stages)}: {stage_label} ({stage_timesteps} timesteps)"
+            )
+            log(
+                "Env: noise={:.2f}, yaw_random={}, sensor_noise={}, random_start={}, max_waypoints={}, action_scale={}, start_pos_random={}, start_pos_noise={}".format(
+                    stage_env_cfg.waypoint_noise,
+                    stage_env_cfg.waypoint_yaw_random,
+                    stage_env_cfg.add_sensor_noise,
+                    stage_env_cfg.random_start_waypoint,
+                    stage_env_cfg.max_waypoints,
+                    stage_env_cfg.action_scale,
+                    stage_env_cfg.random_start_position,
+                    stage_env_cfg.start_position_noise,
+                )
+            )
+            if stage_index == 1 and current_run_id() is not None:
+                log(f"Rerun TextLog entity: logs (run {current_run_id()})")
 
-        experiment_snapshot = ExperimentSnapshotCallback(
-            metrics_logger,
-            snapshot_freq=cfg.callbacks.checkpoint_freq // cfg.training.n_envs,
-        )
+            if train_env is None:
+                train_env = _make_train_env(cfg, stage_env_cfg)
+            else:
+                log("Reconfiguring training envs in place")
+                _reconfigure_env(train_env, stage_env_cfg)
+
+            env = DtypeVecNormalize(
+                train_env,
+                norm_obs=cfg.vecnormalize.norm_obs,
+                norm_reward=cfg.vecnormalize.norm_reward,
+                clip_obs=cfg.vecnormalize.clip_obs,
+                clip_reward=cfg.vecnormalize.clip_reward,
+                gamma=cfg.ppo.gamma,
+            )
+            _carry_normalization(cfg, env, vec_normalize, stage)
+            vec_normalize = env
+
+            eval_env_cfg = _eval_env_config(cfg, stage_env_cfg)
+            eval_callback: BaseCallback
+            if eval_service is not None:
+                if async_eval_callback is None:
+                    async_eval_callback = AsyncEvalCallback(
+                        eval_service,
+                        eval_env_cfg,
+                        snapshot_dir=run_path / "eval_snapshots",
+                        eval_freq=cfg.callbacks.eval_freq // cfg.training.n_envs,
+                        n_eval_episodes=cfg.callbacks.n_eval_episodes,
+                        best_model_save_path=run_path / "best_model",
+                        log_path=run_path / "eval_logs",
+                        seed=cfg.training.seed + 1000,
+                        max_pending=cfg.callbacks.async_eval_max_pending,
+                        stage_index=stage_index,
+                    )
+                else:
+                    async_eval_callback.set_stage(stage_index, eval_env_cfg)
+                eval_callback = async_eval_callback
+            else:
+                if eval_base_env is None:
+                    eval_base_env = _make_eval_env(cfg, eval_env_cfg, train_env)
+                else:
+                    _reconfigure_env(eval_base_env, eval_env_cfg)
+                eval_env = DtypeVecNormalize(
+                    eval_base_env,
+                    norm_obs=cfg.vecnormalize.norm_obs,
+                    norm_reward=cfg.vecnormalize.eval_norm_reward,
+                    clip_obs=cfg.vecnormalize.clip_obs,
+                    training=False,
+                )
+                eval_callback = EvalCallback(
+                    eval_env,
+                    best_model_save_path=str(run_path / "best_model"),
+                    log_path=str(run_path / "eval_logs"),
+                    eval_freq=cfg.callbacks.eval_freq // cfg.training.n_envs,
+                    n_eval_episodes=cfg.callbacks.n_eval_episodes,
+                    deterministic=True,
+                )
 
-        eval_callback = EvalCallback(
-            eval_env,
-            best_model_save_path=str(run_path / "best_model"),
-            log_path=str(run_path / "eval_logs"),
-            eval_freq=cfg.callbacks.eval_freq // cfg.training.n_envs,
-            n_eval_episodes=cfg.callbacks.n_eval_episodes,
-            deterministic=True,
-        )
+            checkpoint_path = run_path / "checkpoints" / f"stage_{stage_index}"
+            checkpoint_path.mkdir(parents=True, exist_ok=True)
+            checkpoint_callback = CheckpointCallback(
+                save_freq=cfg.callbacks.checkpoint_freq // cfg.training.n_envs,
+                save_path=str(checkpoint_path),
+                name_prefix=f"ppo_quadcopter_stage_{stage_index}",
+                save_vecnormalize=True,
+            )
 
-        # Create eval recordings directory and callback
-        eval_rrd_dir = run_path / "eval_recordings"
-        eval_rrd_dir.mkdir(parents=True, exist_ok=True)
-        eval_checkpoint_callback = None
-        if cfg.callbacks.eval_checkpoint_enabled:
-            eval_checkpoint_callback = EvalCheckpointCallback(
-                checkpoint_dir=checkpoint_path,
-                eval_rrd_dir=eval_rrd_dir,
-                checkpoint_freq=cfg.callbacks.checkpoint_freq,
-                n_eval_episodes=cfg.callbacks.eval_checkpoint_episodes,
-                stage_index=stage_index,
-                stage_name=stage_label,
-                verbose=1,
+            experiment_snapshot = ExperimentSnapshotCallback(
+                metrics_logger,
+                snapshot_freq=cfg.callbacks.checkpoint_freq // cfg.training.n_envs,
             )
 
-        callbacks: list[BaseCallback] = [
-            checkpoint_callback,
-            eval_callback,
-            metrics_callback,
-            experiment_snapshot,
-            RewardLoggerCallback(),
-        ]
-
-        if eval_checkpoint_callback is not None:
-            callbacks.append(eval_checkpoint_callback)
-
-        if model is None:
-            if cfg.training.resume_from:
-                log(f"Resuming from {cfg.training.resume_from}")
-                model = PPO.load(cfg.training.resume_from, env=env)
-            else:
-                log("Creating new PPO model...")
-                model = PPO(
-                    "MlpPolicy",
-                    env,
-                    learning_rate=cfg.ppo.learning_rate,
-                    n_steps=cfg.ppo.n_steps,
-                    batch_size=cfg.ppo.batch_size,
-                    n_epochs=cfg.ppo.n_epochs,
-                    gamma=cfg.ppo.gamma,
-                    gae_lambda=cfg.ppo.gae_lambda,
-                    clip_range=cfg.ppo.clip_range,
-                    ent_coef=cfg.ppo.ent_coef,
-                    vf_coef=cfg.ppo.vf_coef,
-                    max_grad_norm=cfg.ppo.max_grad_norm,
+            eval_checkpoint_callback = None
+            if checkpoint_eval is not None:
+                eval_checkpoint_callback = EvalCheckpointCallback(
+                    checkpoint_eval,
+                    checkpoint_dir=checkpoint_path,
+                    eval_rrd_dir=eval_rrd_dir,
+                    checkpoint_freq=cfg.callbacks.checkpoint_freq,
+                    n_eval_episodes=cfg.callbacks.eval_checkpoint_episodes,
+                    stage_index=stage_index,
+                    stage_name=stage_label,
                     verbose=1,
-                    tensorboard_log=str(run_path / "tensorboard"),
-                    seed=cfg.training.seed,
-                    policy_kwargs={
-                        "net_arch": {
-                            "pi": cfg.ppo.net_arch.pi,
-                            "vf": cfg.ppo.net_arch.vf,
-                        },
-                    },
                 )
-        else:
-            model.set_env(env)
 
-        log(f"Starting training for {stage_timesteps} timesteps...")
+            callbacks: list[BaseCallback] = [
+                checkpoint_callback,
+                eval_callback,
+                metrics_callback,
+                experiment_snapshot,
+                RewardLoggerCallback(),
+            ]
 
-        try:
-            model.learn(
-                total_timesteps=stage_timesteps,
-                callback=callbacks,
-                progress_bar=True,
-                reset_num_timesteps=False,
-            )
-        except KeyboardInterrupt:
-            log("Training interrupted by user.", level="warning")
-            break
-        finally:
-            env.close()
-            eval_env.close()
+            if eval_checkpoint_callback is not None:
+                callbacks.append(eval_checkpoint_callback)
+
+            if model is None:
+                algorithm = (
+                    AsyncPPO if cfg.training.async_batch_size is not None else PPO
+                )
+                if cfg.training.resume_from:
+                    log(f"Resuming from {cfg.training.resume_from}")
+                    model = algorithm.load(cfg.training.resume_from, env=env)
+                else:
+                    log("Creating new PPO model...")
+                    model = algorithm(
+                        "MlpPolicy",
+                        env,
+                        learning_rate=cfg.ppo.learning_rate,
+                        n_steps=cfg.ppo.n_steps,
+                        batch_size=cfg.ppo.batch_size,
+                        n_epochs=cfg.ppo.n_epochs,
+                        gamma=cfg.ppo.gamma,
+                        gae_lambda=cfg.ppo.gae_lambda,
+                        clip_range=cfg.ppo.clip_range,
+                        ent_coef=cfg.ppo.ent_coef,
+                        vf_coef=cfg.ppo.vf_coef,
+                        max_grad_norm=cfg.ppo.max_grad_norm,
+                        verbose=1,
+                        tensorboard_log=str(run_path / "tensorboard"),
+                        seed=cfg.training.seed,
+                        policy_kwargs={
+                            "net_arch": {
+                                "pi": cfg.ppo.net_arch.pi,
+                                "vf": cfg.ppo.net_arch.vf,
+                            },
+                        },
+                    )
+            else:
+                model.set_env(env)
+
+            log(f"Starting training for {stage_timesteps} timesteps...")
+
+            interrupted = False
+            try:
+                model.learn(
+                    total_timesteps=stage_timesteps,
+                    callback=callbacks,
+                    progress_bar=True,
+                    reset_num_timesteps=False,
+                )
+            except KeyboardInterrupt:
+                log("Training interrupted by user.", level="warning")
+                interrupted = True
+
+            # Model and normalization statistics at the end of the stage, so
+            # a run resumed from here continues with the same normalization
+            stage_model_path = checkpoint_path / "stage_final"
+            model.save(str(stage_model_path))
+            env.save(str(checkpoint_path / "stage_final_vecnormalize.pkl"))
+            log(f"Stage checkpoint saved to {stage_model_path}")
+            if interrupted:
+                break
+
+        if async_eval_callback is not None:
+            log("Waiting for pending evaluations...")
+            async_eval_callback.wait()
+        if checkpoint_eval is not None:
+            log("Waiting for checkpoint evaluations...")
+            checkpoint_eval.close()
+    finally:
+        if checkpoint_eval is not None:
+            checkpoint_eval.close(wait=False)
+        if eval_service is not None:
+            eval_service.close()
+        if train_env is not None:
+            train_env.close()
+        if eval_base_env is not None:
+            eval_base_env.close()
 
     metrics_callback.finalize()
 
@@ -179,14 +179,14 @@ class EnvLogger:
 
     def log_waypoints(
         self,
-        waypoints: list[NDArray[np.float64]],
+        waypoints: NDArray[np.float64] | list[NDArray[np.float64]],
         current_idx: int,
         radius: float = 0.5,
     ) -> None:
         """Log waypoints with progress coloring.
 
         Args:
-            waypoints: List of [x, y, z] waypoint positions
+            waypoints: (n, 3) array or list of [x, y, z] waypoint positions
             current_idx: Index of current target waypoint
             radius: Waypoint sphere radius for visualization
         """
@@ -257,7 +257,7 @@ class EnvLogger:
         self,
         positions: list[NDArray[np.float64]],
         orientations: list[NDArray[np.float64]] | None = None,
-        waypoints: list[NDArray[np.float64]] | None = None,
+        waypoints: NDArray[np.float64] | list[NDArray[np.float64]] | None = None,
         final_waypoint_idx: int = 0,
         episode_reward: float | None = None,
         arm_length: float = 0.17,
@@ -286,11 +286,11 @@ class EnvLogger:
         )
 
         # Log waypoints if provided (static)
-        if waypoints:
+        if waypoints is not None and len(waypoints) > 0:
             self.log_waypoints(waypoints, final_waypoint_idx)
 
         # Log episode summary (static)
-        if episode_reward is not None and waypoints:
+        if episode_reward is not None and waypoints is not None and len(waypoints):
             summary_text = (
                 f"**Episode Snapshot**\n\n"
                 f"- Reward: {episode_reward:.1f}\n"
@@ -5,6 +5,7 @@ Composes EnvLogger and TrainingLogger for unified visualization.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import rerun as rr
@@ -47,6 +48,7 @@ class RerunVisualizer:
         ground_size: float = 25.0,
         recording_name: str | None = None,
         session_markdown: str | None = None,
+        save_path: str | Path | None = None,
     ) -> None:
         """Initialize Rerun visualizer.
 
@@ -56,9 +58,12 @@ class RerunVisualizer:
             ground_size: Size of ground plane in meters
             recording_name: Optional name shown in the viewer
             session_markdown: Optional markdown text for session context
+            save_path: Optional .rrd file the recording is written to (in
+                addition to the viewer when ``spawn`` is set)
         """
         self.app_id = app_id
         self._spawn = spawn
+        self._save_path = Path(save_path) if save_path is not None else None
         self._recording_name = recording_name
         self._session_markdown = session_markdown
         self._initialized = False
@@ -72,7 +77,19 @@ class RerunVisualizer:
         if self._initialized:
             return
 
-        rr.init(self.app_id, spawn=self._spawn)
+        if self._save_path is None:
+            rr.init(self.app_id, spawn=self._spawn)
+        else:
+            # Sinks only receive data logged after they are set
+            rr.init(self.app_id)
+            self._save_path.parent.mkdir(parents=True, exist_ok=True)
+            sinks: list[rr.FileSink | rr.GrpcSink] = [
+                rr.FileSink(str(self._save_path))
+            ]
+            if self._spawn:
+                rr.spawn(connect=False)
+                sinks.append(rr.GrpcSink())
+            rr.set_sinks(*sinks)
         if self._recording_name:
             rr.send_recording_name(self._recording_name)
         self._initialized = True
@@ -95,6 +112,12 @@ class RerunVisualizer:
         """Reset for new episode."""
         self.env.reset_trajectory()
 
+    def close(self) -> None:
+        """Flush and close the recording's sinks (completes ``save_path``)."""
+        if self._initialized:
+            rr.disconnect()
+            self._initialized = False
+
     def _send_blueprint(self) -> None:
         try:
             import rerun.blueprint as rrb
@@ -159,14 +182,14 @@ class RerunVisualizer:
 
     def log_waypoints(
         self,
-        waypoints: list[NDArray[np.float64]],
+        waypoints: NDArray[np.float64] | list[NDArray[np.float64]],
         current_idx: int,
         radius: float = 0.5,
     ) -> None:
         """Log waypoint positions (for evaluation/demo).
 
         Args:
-            waypoints: List of waypoint positions
+            waypoints: (n, 3) array or list of waypoint positions
             current_idx: Current waypoint index
             radius: Waypoint visualization radius
         """
@@ -0,0 +1,17 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from simhops.config import Config
+
+DEFAULT_CONFIG = Path(__file__).resolve().parents[1] / "cfg_default.yaml"
+
+
+@pytest.fixture(autouse=True)
+def default_config() -> None:
+    """Start every test from the default config, like a fresh worker process."""
+    Config.load(DEFAULT_CONFIG)
@@ -0,0 +1,127 @@
+"""Asynchronous send/recv stepping and AsyncPPO rollout collection."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import numpy as np
+import pytest
+from stable_baselines3.common.callbacks import BaseCallback
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+from simhops.train.async_ppo import AsyncPPO
+
+N_ENVS = 4
+EPISODE_STEPS = 4
+# Episodes end by truncation only, well before the drone could reach the ground
+_make_env = partial(
+    QuadcopterEnv, max_episode_steps=EPISODE_STEPS, disable_tilt_termination=True
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    env = SharedMemoryVecEnv([_make_env] * N_ENVS, batch_size=2)
+    yield env
+    env.close()
+
+
+class _CountSteps(BaseCallback):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def _on_step(self) -> bool:
+        self.calls += 1
+        return True
+
+
+def test_recv_batches_match_synchronous_steps(pool: SharedMemoryVecEnv) -> None:
+    dummy = DummyVecEnv([_make_env] * N_ENVS)
+    try:
+        pool.seed(3)
+        dummy.seed(3)
+        np.testing.assert_array_equal(pool.reset(), dummy.reset())
+        rng = np.random.default_rng(0)
+        for _ in range(2 * EPISODE_STEPS):
+            actions = rng.uniform(-1.0, 1.0, size=(N_ENVS, 4)).astype(np.float32)
+            expected_obs, expected_rewards, expected_dones, _ = dummy.step(actions)
+
+            pool.send(actions, np.arange(N_ENVS))
+            received: list[int] = []
+            while len(received) < N_ENVS:
+                obs, rewards, dones, infos, env_ids = pool.recv()
+                assert len(env_ids) >= 2
+                np.testing.assert_array_equal(obs, expected_obs[env_ids])
+                np.testing.assert_allclose(
+                    rewards, expected_rewards[env_ids], rtol=1e-6
+                )
+                np.testing.assert_array_equal(dones, expected_dones[env_ids])
+                for done, info in zip(dones, infos):
+                    assert done == ("terminal_observation" in info)
+                received.extend(env_ids.tolist())
+            assert sorted(received) == list(range(N_ENVS))
+    finally:
+        dummy.close()
+
+
+def test_recv_without_send_and_busy_envs(pool: SharedMemoryVecEnv) -> None:
+    pool.reset()
+    with pytest.raises(RuntimeError, match="no envs in flight"):
+        pool.recv()
+    actions = np.zeros((2, 4), dtype=np.float32)
+    pool.send(actions, np.array([0, 1]))
+    try:
+        with pytest.raises(ValueError, match="already stepping"):
+            pool.send(actions, np.array([1, 2]))
+        with pytest.raises(RuntimeError, match="recv them first"):
+            pool.reset()
+    finally:
+        pool.recv(2)
+
+
+def test_send_needs_whole_worker_groups() -> None:
+    env = SharedMemoryVecEnv([_make_env] * 2, envs_per_worker=2)
+    try:
+        env.reset()
+        with pytest.raises(ValueError, match="whole worker groups"):
+            env.send(np.zeros((1, 4), dtype=np.float32), np.array([0]))
+    finally:
+        env.close()
+
+
+def test_async_ppo_fills_one_column_per_env(pool: SharedMemoryVecEnv) -> None:
+    pool.seed(0)
+    n_steps = 2 * EPISODE_STEPS
+    model = AsyncPPO(
+        "MlpPolicy",
+        pool,
+        n_steps=n_steps,
+        batch_size=n_steps * N_ENVS,
+        n_epochs=1,
+        policy_kwargs={"net_arch": [8]},
+        device="cpu",
+        seed=0,
+    )
+    callback = _CountSteps()
+    model.learn(total_timesteps=n_steps * N_ENVS, callback=callback)
+
+    assert model.num_timesteps == n_steps * N_ENVS
+    # One callback step per num_envs transitions, like synchronous collection
+    assert callback.calls == n_steps
+    # Each column holds consecutive transitions of one env: episodes restart
+    # every EPISODE_STEPS rows
+    starts = model.rollout_buffer.episode_starts
+    expected = (np.arange(n_steps) % EPISODE_STEPS == 0).astype(starts.dtype)
+    np.testing.assert_array_equal(starts, np.tile(expected[:, None], (1, N_ENVS)))
+
+
+def test_async_ppo_needs_shared_memory_pool() -> None:
+    env = DummyVecEnv([_make_env])
+    model = AsyncPPO("MlpPolicy", env, n_steps=4, batch_size=4, device="cpu")
+    with pytest.raises(TypeError, match="SharedMemoryVecEnv"):
+        model.learn(total_timesteps=4)
+    with pytest.raises(ValueError, match="gSDE"):
+        AsyncPPO("MlpPolicy", env, use_sde=True, device="cpu")
@@ -0,0 +1,130 @@
+"""Batched NumPy engine against the MuJoCo path, and its VecEnv backend."""
+
+from __future__ import annotations
+
+import mujoco
+import numpy as np
+import pytest
+
+from simhops.core.batched import BatchedQuadcopter
+from simhops.core.quadcopter import Quadcopter, create_quadcopter_model
+from simhops.envs.batched_env import BatchedQuadcopterVecEnv
+from simhops.envs.quadcopter_env import QuadcopterEnv
+
+START = np.array([0.0, 0.0, 2.0])
+
+
+def _mujoco_quad(
+    orientation: np.ndarray | None = None,
+) -> tuple[Quadcopter, mujoco.MjModel, mujoco.MjData]:
+    model, data = create_quadcopter_model()
+    quad = Quadcopter(model, data)
+    quad.reset(position=START, orientation=orientation)
+    return quad, model, data
+
+
+def _max_error(quad: Quadcopter, batched: BatchedQuadcopter) -> float:
+    kinematics = quad.kinematics
+    return max(
+        np.abs(kinematics.position - batched.position[0]).max(),
+        np.abs(kinematics.orientation - batched.orientation[0]).max(),
+        np.abs(kinematics.velocity - batched.velocity[0]).max(),
+        np.abs(kinematics.angular_velocity - batched.angular_velocity[0]).max(),
+    )
+
+
+def test_single_step_matches_mujoco() -> None:
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        orientation = rng.normal(size=4)
+        orientation /= np.linalg.norm(orientation)
+        action = rng.uniform(-1.0, 1.0, size=4)
+        quad, model, data = _mujoco_quad(orientation)
+        batched = BatchedQuadcopter(1, dt=model.opt.timestep)
+        batched.reset(np.array([0]), START[None], orientation[None])
+
+        quad.apply_action(action, model.opt.timestep)
+        mujoco.mj_step(model, data)
+        quad.invalidate_kinematics()
+        batched.apply_action(action[None])
+        batched.step()
+
+        assert _max_error(quad, batched) < 1e-5
+
+
+def test_open_loop_rollout_matches_mujoco() -> None:
+    quad, model, data = _mujoco_quad()
+    batched = BatchedQuadcopter(1, dt=model.opt.timestep)
+    batched.reset(np.array([0]), START[None])
+    hover_throttle = 2.0 * quad.frame.hover_motor_speeds()[0] - 1.0
+    rng = np.random.default_rng(1)
+
+    for _ in range(100):
+        action = np.array([hover_throttle, 0.0, 0.0, 0.0]) + rng.normal(0.0, 0.1, 4)
+        quad.apply_action(action, model.opt.timestep)
+        mujoco.mj_step(model, data)
+        quad.invalidate_kinematics()
+        batched.apply_action(action[None])
+        batched.step()
+
+    # The documented tolerance only holds while airborne
+    assert data.ncon == 0
+    kinematics = quad.kinematics
+    assert np.abs(kinematics.position - batched.position[0]).max() < 1e-4
+    assert np.abs(kinematics.orientation - batched.orientation[0]).max() < 1e-4
+
+
+def test_rows_step_independently() -> None:
+    rng = np.random.default_rng(2)
+    actions = rng.uniform(-1.0, 1.0, size=(3, 4))
+    together = BatchedQuadcopter(3)
+    together.reset(np.arange(3), np.tile(START, (3, 1)))
+    together.apply_action(actions)
+    together.step()
+    for row, action in enumerate(actions):
+        alone = BatchedQuadcopter(1)
+        alone.reset(np.array([0]), START[None])
+        alone.apply_action(action[None])
+        alone.step()
+        # Batched matmuls may round differently in the last bit
+        np.testing.assert_allclose(
+            together.position[row], alone.position[0], atol=1e-12
+        )
+        np.testing.assert_allclose(
+            together.orientation[row], alone.orientation[0], atol=1e-12
+        )
+
+
+def test_vec_env_spaces_match_quadcopter_env() -> None:
+    vec_env = BatchedQuadcopterVecEnv(4, seed=0)
+    env = QuadcopterEnv()
+    try:
+        assert vec_env.observation_space == env.observation_space
+        assert vec_env.action_space == env.action_space
+        obs = vec_env.reset()
+        assert obs.shape == (4, *env.observation_space.shape)
+        obs, rewards, dones, infos = vec_env.step(
+            np.zeros((4, 4), dtype=vec_env.action_space.dtype)
+        )
+        assert np.isfinite(obs).all() and np.isfinite(rewards).all()
+        assert len(infos) == 4
+    finally:
+        vec_env.close()
+        env.close()
+
+
+def test_ground_truth_is_per_env() -> None:
+    vec_env = BatchedQuadcopterVecEnv(3, seed=0)
+    vec_env.reset()
+    truths = vec_env.env_method("get_ground_truth", indices=[2, 0])
+    np.testing.assert_array_equal(truths[0]["position"], vec_env._quad.position[2])
+    np.testing.assert_array_equal(truths[1]["position"], vec_env._quad.position[0])
+
+
+def test_batch_level_calls_need_every_env() -> None:
+    vec_env = BatchedQuadcopterVecEnv(3, seed=0)
+    assert vec_env.get_attr("dt", indices=[1]) == [vec_env.dt]
+    with pytest.raises(ValueError, match="applies to every env"):
+        vec_env.set_attr("max_waypoints", 2, indices=[0])
+    vec_env.set_attr("max_waypoints", 2, indices=[2, 1, 0])
+    assert vec_env.max_waypoints == 2
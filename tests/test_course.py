@@ -0,0 +1,117 @@
+"""Course files and arc-length progress."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from simhops.envs.course import Course, arc_lengths, arc_progress, load_course
+from simhops.envs.quadcopter_env import QuadcopterEnv
+
+# Includes a repeated gate (zero-length segment)
+GATES = [
+    [0.0, 0.0, 1.0],
+    [3.0, 0.0, 1.0],
+    [3.0, 4.0, 1.0],
+    [3.0, 4.0, 1.0],
+    [0.0, 4.0, 2.0],
+]
+
+
+def test_geometry_is_precomputed() -> None:
+    course = Course.from_waypoints(GATES, radius=[1.0, 1.0, 2.0, 2.0, 1.0])
+    np.testing.assert_allclose(
+        course.segment_lengths, [0.0, 3.0, 4.0, 0.0, np.sqrt(10)]
+    )
+    np.testing.assert_allclose(course.arc_length, arc_lengths(GATES))
+    assert course.total_length == pytest.approx(7.0 + np.sqrt(10))
+    assert course.remaining_length(1, 0.5) == pytest.approx(0.5 + 4.0 + np.sqrt(10))
+    assert course.remaining_length(5, 0.5) == 0.0
+    assert course.remaining_length(1, 0.5, n_active=3) == pytest.approx(4.5)
+
+
+@pytest.mark.parametrize("n_active", [1, 2, 3, 5])
+def test_progress_is_monotone_from_zero_to_one(n_active: int) -> None:
+    course = Course.from_waypoints(GATES)
+    progress = [course.progress(index, n_active) for index in range(len(course) + 2)]
+    assert progress[0] == 0.0
+    assert np.all(np.diff(progress) >= 0.0)
+    assert progress[n_active - 1] == (1.0 if n_active > 1 else 0.0)
+    assert progress[-1] == progress[n_active - 1]
+
+
+@pytest.mark.parametrize("n_active", [1, 3, 5])
+def test_batched_progress_matches_course(n_active: int) -> None:
+    rng = np.random.default_rng(0)
+    positions = rng.uniform(-5.0, 5.0, size=(6, len(GATES), 3))
+    indices = rng.integers(0, len(GATES) + 1, size=6)
+    batched = arc_progress(arc_lengths(positions), indices, n_active)
+    expected = [
+        Course.from_waypoints(gates).progress(int(index), n_active)
+        for gates, index in zip(positions, indices)
+    ]
+    np.testing.assert_allclose(batched, expected)
+    for row in arc_lengths(positions):
+        path = arc_progress(
+            np.tile(row, (len(GATES), 1)), np.arange(len(GATES)), n_active
+        )
+        assert np.all(np.diff(path) >= 0.0)
+
+
+def test_load_yaml_course(tmp_path: Path) -> None:
+    path = tmp_path / "loop.yaml"
+    path.write_text(
+        "name: loop\nradius: 1.5\nwaypoints:\n"
+        "  - [0.0, 0.0, 1.0]\n  - [2.0, 0.0, 1.0, 0.5]\n"
+    )
+    course = load_course(path)
+    assert course.name == "loop"
+    np.testing.assert_array_equal(course.positions, [[0, 0, 1], [2, 0, 1]])
+    np.testing.assert_array_equal(course.radii, [1.5, 0.5])
+
+
+def test_load_csv_course(tmp_path: Path) -> None:
+    with_header = tmp_path / "gates.csv"
+    with_header.write_text("radius,z,y,x\n2.0,1.0,0.0,5.0\n3.0,2.0,1.0,6.0\n")
+    course = load_course(with_header, default_radius=9.0)
+    assert course.name == "gates"
+    np.testing.assert_array_equal(course.positions, [[5, 0, 1], [6, 1, 2]])
+    np.testing.assert_array_equal(course.radii, [2.0, 3.0])
+
+    bare = tmp_path / "bare.csv"
+    bare.write_text("5.0,0.0,1.0\n6.0,1.0,2.0\n")
+    np.testing.assert_array_equal(load_course(bare, 9.0).radii, [9.0, 9.0])
+
+
+@pytest.mark.parametrize(
+    ("name", "content", "message"),
+    [
+        ("course.txt", "", "Unsupported course file"),
+        ("empty.yaml", "waypoints: []\n", "no waypoints"),
+        ("short.yaml", "- [1.0, 2.0]\n", "waypoint 0"),
+    ],
+)
+def test_malformed_course_files(
+    tmp_path: Path, name: str, content: str, message: str
+) -> None:
+    path = tmp_path / name
+    path.write_text(content)
+    with pytest.raises(ValueError, match=message):
+        load_course(path)
+
+
+def test_env_flies_the_course_file(tmp_path: Path) -> None:
+    path = tmp_path / "course.csv"
+    path.write_text("x,y,z\n" + "\n".join(",".join(map(str, g)) for g in GATES))
+    env = QuadcopterEnv(
+        course_file=str(path), waypoint_noise=0.0, waypoint_yaw_random=False
+    )
+    try:
+        env.reset(seed=0)
+        assert env.num_waypoints == len(GATES)
+        waypoints = env.get_ground_truth()["waypoints"]
+        np.testing.assert_allclose(waypoints, np.array(GATES)[: len(waypoints)])
+    finally:
+        env.close()
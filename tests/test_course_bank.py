@@ -0,0 +1,116 @@
+"""Course bank generation, caching and episode course selection."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from simhops.config import Config
+from simhops.envs.course_bank import CourseBank, clear_course_bank_cache
+from simhops.envs.quadcopter_env import QuadcopterEnv
+
+BASE = np.array([[0.0, 0.0, 1.0], [2.0, 0.0, 1.5], [2.0, 3.0, 2.0]])
+PARAMS = {"n_courses": 16, "waypoint_noise": 0.3, "yaw_random": True, "seed": 4}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_course_bank_cache()
+    yield
+    clear_course_bank_cache()
+
+
+def test_generation_is_a_function_of_the_parameters() -> None:
+    bank = CourseBank.generate(BASE, **PARAMS)
+    again = CourseBank.generate(BASE, **PARAMS)
+    np.testing.assert_array_equal(bank.waypoints, again.waypoints)
+    np.testing.assert_array_equal(bank.yaws, again.yaws)
+    assert bank.key == again.key
+    other = CourseBank.generate(BASE, **{**PARAMS, "seed": 5})
+    assert other.key != bank.key
+    assert not np.array_equal(other.waypoints, bank.waypoints)
+    assert (bank.waypoints[:, :, 2] >= 0.5).all()
+    assert not bank.waypoints.flags.writeable
+
+
+def test_course_lookup() -> None:
+    bank = CourseBank.generate(BASE, **PARAMS)
+    waypoints, yaw = bank.course(3)
+    np.testing.assert_array_equal(waypoints, bank.waypoints[3])
+    assert yaw == bank.yaws[3]
+    with pytest.raises(IndexError):
+        bank.course(len(bank))
+
+
+def test_load_caches_in_process() -> None:
+    bank = CourseBank.load(BASE, **PARAMS)
+    assert CourseBank.load(BASE, **PARAMS) is bank
+    assert CourseBank.load(BASE, **{**PARAMS, "n_courses": 8}) is not bank
+
+
+def test_bank_file_is_reused_memory_mapped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bank = CourseBank.load(BASE, **PARAMS, bank_dir=tmp_path)
+    path = tmp_path / f"courses_{bank.key}.npy"
+    assert path.exists()
+    expected = CourseBank.generate(BASE, **PARAMS)
+    np.testing.assert_array_equal(bank.waypoints, expected.waypoints)
+
+    # A fresh process (empty cache) maps the file instead of regenerating
+    clear_course_bank_cache()
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("bank was regenerated")
+
+    monkeypatch.setattr(CourseBank, "generate", fail)
+    loaded = CourseBank.load(BASE, **PARAMS, bank_dir=tmp_path)
+    assert isinstance(loaded.waypoints.base, np.memmap)
+    assert not loaded.waypoints.flags.writeable
+    np.testing.assert_array_equal(loaded.waypoints, expected.waypoints)
+    np.testing.assert_array_equal(loaded.yaws, expected.yaws)
+
+
+def test_unreadable_bank_file_is_regenerated(tmp_path: Path) -> None:
+    key = CourseBank.generate(BASE, **PARAMS).key
+    path = tmp_path / f"courses_{key}.npy"
+    path.write_bytes(b"not a bank")
+    bank = CourseBank.load(BASE, **PARAMS, bank_dir=tmp_path)
+    np.testing.assert_array_equal(
+        bank.waypoints, CourseBank.generate(BASE, **PARAMS).waypoints
+    )
+    assert np.load(path).shape == (PARAMS["n_courses"],)
+
+
+def test_env_replays_bank_courses_by_index(tmp_path: Path) -> None:
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"env": {"course_bank_size": 8}}))
+    Config.load(config_path)
+    env = QuadcopterEnv()
+    try:
+        _, info = env.reset(seed=0, options={"course_index": 5})
+        truth = env.get_ground_truth()
+        waypoints, yaw = env.course_bank.course(5)
+        assert info["course_index"] == truth["course_index"] == 5
+        np.testing.assert_array_equal(
+            truth["waypoints"], waypoints[: len(truth["waypoints"])]
+        )
+        assert truth["waypoint_yaw"] == yaw
+        # Other envs in the process share the bank
+        other = QuadcopterEnv()
+        assert other.course_bank is env.course_bank
+        other.close()
+    finally:
+        env.close()
+
+
+def test_course_index_needs_a_bank() -> None:
+    env = QuadcopterEnv()
+    try:
+        with pytest.raises(ValueError, match="course_bank_size"):
+            env.reset(options={"course_index": 0})
+    finally:
+        env.close()
@@ -0,0 +1,67 @@
+"""VecNormalize statistics across curriculum stage boundaries."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from simhops.config import Config
+from simhops.envs.vec_normalize import load_normalization
+from simhops.train.trainer import train
+
+
+def _two_stage_config(output_dir: Path, vec_env: str) -> dict:
+    return {
+        "training": {
+            "output_dir": str(output_dir),
+            "n_envs": 2,
+            "device": "cpu",
+            "vec_env": vec_env,
+        },
+        "curriculum": {
+            "enabled": True,
+            "stages": [
+                {"name": "first", "total_timesteps": 64, "max_waypoints": 1},
+                {"name": "second", "total_timesteps": 64, "max_waypoints": 2},
+            ],
+        },
+        "ppo": {
+            "n_steps": 32,
+            "batch_size": 32,
+            "n_epochs": 1,
+            "net_arch": {"pi": [16], "vf": [16]},
+        },
+        "vecnormalize": {"norm_obs": False, "norm_reward": True, "stage_decay": 0.5},
+        "env": {"max_episode_steps": 50},
+        "callbacks": {
+            "checkpoint_freq": 10**9,
+            "eval_freq": 10**9,
+            "eval_checkpoint_enabled": False,
+        },
+    }
+
+
+@pytest.mark.parametrize("vec_env", ["batched", "subproc"])
+def test_curriculum_without_obs_normalization(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, vec_env: str
+) -> None:
+    # Run logs are written to ./data
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "config.yaml"
+    config = _two_stage_config(tmp_path / "models", vec_env)
+    config_path.write_text(yaml.safe_dump(config))
+    Config.load(config_path)
+
+    train()
+
+    (run_path,) = (tmp_path / "models").glob("run_*")
+    first = load_normalization(
+        run_path / "checkpoints" / "stage_1" / "stage_final_vecnormalize.pkl"
+    )
+    second = load_normalization(run_path / "final_model" / "vec_normalize.pkl")
+    assert not second.norm_obs
+    assert "obs_rms" not in vars(second)
+    # Stage 2 started from stage 1's (halved) return statistics
+    assert second.ret_rms.count > first.ret_rms.count * 0.5
@@ -0,0 +1,59 @@
+"""SharedMemoryVecEnv workers hosting groups of envs."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import numpy as np
+import pytest
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+
+N_ENVS = 5
+_make_env = partial(QuadcopterEnv, max_episode_steps=6)
+
+
+@pytest.fixture(scope="module")
+def grouped_env():
+    # Groups of 2, 2 and 1 envs
+    env = SharedMemoryVecEnv([_make_env] * N_ENVS, envs_per_worker=2)
+    yield env
+    env.close()
+
+
+def test_uneven_groups(grouped_env: SharedMemoryVecEnv) -> None:
+    assert grouped_env.n_workers == 3
+    assert grouped_env.num_envs == N_ENVS
+
+
+def test_grouped_steps_match_dummy_vec_env(grouped_env: SharedMemoryVecEnv) -> None:
+    dummy = DummyVecEnv([_make_env] * N_ENVS)
+    try:
+        grouped_env.seed(11)
+        dummy.seed(11)
+        np.testing.assert_array_equal(grouped_env.reset(), dummy.reset())
+        rng = np.random.default_rng(1)
+        for _ in range(15):
+            actions = rng.uniform(-1.0, 1.0, size=(N_ENVS, 4)).astype(np.float32)
+            obs, rewards, dones, _ = grouped_env.step(actions)
+            expected_obs, expected_rewards, expected_dones, _ = dummy.step(actions)
+            np.testing.assert_array_equal(obs, expected_obs)
+            np.testing.assert_allclose(rewards, expected_rewards, rtol=1e-6)
+            np.testing.assert_array_equal(dones, expected_dones)
+    finally:
+        dummy.close()
+
+
+def test_indices_address_envs_across_groups(grouped_env: SharedMemoryVecEnv) -> None:
+    for index in range(N_ENVS):
+        grouped_env.set_attr("tag", f"env{index}", indices=index)
+    assert grouped_env.get_attr("tag", indices=[4, 0, 3]) == ["env4", "env0", "env3"]
+    grouped_env.set_attr("tag", "changed", indices=[1, 4])
+    assert grouped_env.get_attr("tag") == ["env0", "changed", "env2", "env3", "changed"]
+
+
+def test_envs_per_worker_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="envs_per_worker"):
+        SharedMemoryVecEnv([_make_env], envs_per_worker=0)
@@ -0,0 +1,63 @@
+"""Rerun evaluation of a saved model."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+import yaml
+from stable_baselines3 import PPO
+
+from simhops.config import Config
+from simhops.evaluate import EVAL_CSV_FIELDS, evaluate, make_eval_env, record_episodes
+from simhops.train.checkpoint_eval import CSV_FIELDS
+
+
+@pytest.fixture
+def model_dir(tmp_path: Path) -> Path:
+    config_path = tmp_path / "config.yaml"
+    config = {
+        "env": {"max_episode_steps": 20},
+        "evaluation": {"realtime": False},
+        "visualization": {"spawn": False},
+    }
+    config_path.write_text(yaml.safe_dump(config))
+    Config.load(config_path)
+    env = make_eval_env()
+    PPO("MlpPolicy", env, device="cpu").save(tmp_path / "ppo_quadcopter")
+    env.close()
+    return tmp_path
+
+
+def test_evaluate_writes_episode_rows(model_dir: Path) -> None:
+    output = model_dir / "eval.csv"
+    evaluate(str(model_dir), eval_output=output, episodes=2)
+    with output.open(newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == EVAL_CSV_FIELDS
+    assert [row["episode"] for row in rows] == ["1", "2"]
+    assert all(row["model_path"] == str(model_dir) for row in rows)
+    assert all(row["length"] == "20" for row in rows)
+
+
+def test_record_episodes_matches_checkpoint_columns(model_dir: Path) -> None:
+    model = PPO.load(str(model_dir / "ppo_quadcopter"))
+    env = make_eval_env()
+    try:
+        stats = record_episodes(
+            model,
+            env,
+            None,
+            model_dir / "eval.rrd",
+            episodes=2,
+            recording_name="test",
+            spawn_viewer=False,
+        )
+    finally:
+        env.close()
+    assert (model_dir / "eval.rrd").exists()
+    assert stats["mean_length"] == 20
+    # Checkpoint evaluation writes every episode entry into its CSV
+    for episode in stats["episodes"]:
+        assert set(episode) <= set(CSV_FIELDS)
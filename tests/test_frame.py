@@ -0,0 +1,57 @@
+"""Frame layouts, mixer and wrench allocation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from simhops.core.frame import GRAVITY, FrameGeometry
+from simhops.core.quadcopter import QuadcopterParams
+
+
+def _baseline_plus_mixer(action: np.ndarray) -> np.ndarray:
+    """Motor targets of the original hand-written "+" mixer."""
+    throttle, roll, pitch, yaw = np.clip(action, -1.0, 1.0)
+    base = (throttle + 1.0) / 2.0
+    speeds = np.array(
+        [
+            base - pitch * 0.3 + yaw * 0.2,
+            base + pitch * 0.3 + yaw * 0.2,
+            base - roll * 0.3 - yaw * 0.2,
+            base + roll * 0.3 - yaw * 0.2,
+        ]
+    )
+    return np.clip(speeds, 0.0, 1.0)
+
+
+def test_plus_mixer_matches_baseline() -> None:
+    frame = FrameGeometry(QuadcopterParams())
+    rng = np.random.default_rng(0)
+    for action in rng.uniform(-1.2, 1.2, size=(200, 4)):
+        clipped = np.clip(action, -1.0, 1.0)
+        np.testing.assert_allclose(
+            frame.motor_targets(clipped), _baseline_plus_mixer(action), atol=1e-12
+        )
+
+
+@pytest.mark.parametrize("name", ["+", "x", "hex"])
+def test_hover_balances_gravity(name: str) -> None:
+    params = QuadcopterParams(frame=name)
+    frame = FrameGeometry(params)
+    wrench = frame.body_wrench(frame.hover_motor_speeds())
+    assert wrench[2] == pytest.approx(params.mass * GRAVITY)
+    np.testing.assert_allclose(wrench[3:], 0.0, atol=1e-12)
+
+
+def test_frame_names_ignore_case() -> None:
+    upper = FrameGeometry(QuadcopterParams(frame="X"))
+    lower = FrameGeometry(QuadcopterParams(frame="x"))
+    assert upper.frame == "x"
+    assert QuadcopterParams(frame="HEX").num_motors == 6
+    np.testing.assert_array_equal(upper.mixer, lower.mixer)
+    np.testing.assert_array_equal(upper.allocation, lower.allocation)
+
+
+def test_unknown_frame_raises() -> None:
+    with pytest.raises(ValueError, match="Unknown frame layout"):
+        FrameGeometry(QuadcopterParams(frame="octo"))
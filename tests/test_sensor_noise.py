@@ -0,0 +1,99 @@
+"""Block-drawn sensor noise and the exact bias drift discretization."""
+
+from __future__ import annotations
+
+import math
+
+import mujoco
+import numpy as np
+import pytest
+
+from simhops.core.quadcopter import create_quadcopter_model
+from simhops.core.sensors import (
+    NOISE_BLOCK_STEPS,
+    SensorModel,
+    SensorNoiseParams,
+    noise_scale,
+)
+
+DT = 0.01
+
+
+@pytest.fixture(scope="module")
+def physics() -> tuple[mujoco.MjModel, mujoco.MjData]:
+    model, data = create_quadcopter_model()
+    mujoco.mj_forward(model, data)
+    return model, data
+
+
+def _sensor(model: mujoco.MjModel, seed: int) -> SensorModel:
+    sensor = SensorModel(seed=seed)
+    sensor.bind(model)
+    return sensor
+
+
+def _readings(sensor: SensorModel, data: mujoco.MjData, count: int) -> np.ndarray:
+    return np.stack([sensor.get_readings(data, DT).to_array() for _ in range(count)])
+
+
+@pytest.mark.parametrize("dt", [0.001, 0.01, 1.0, 50.0])
+def test_bias_drift_is_exact_for_any_dt(dt: float) -> None:
+    params = SensorNoiseParams()
+    scale, decay = noise_scale(params, dt)
+    scale2, decay2 = noise_scale(params, 2.0 * dt)
+    tau = params.accel_bias_time_constant
+    assert decay[0] == pytest.approx(math.exp(-dt / tau))
+    # Two steps of dt are one step of 2 dt: same decay and variance
+    np.testing.assert_allclose(decay2, decay**2)
+    np.testing.assert_allclose(scale2[:6] ** 2, scale[:6] ** 2 * (1.0 + decay**2))
+    # The stationary spread does not depend on dt
+    stationary = scale[:6] ** 2 / (1.0 - decay**2)
+    expected = np.repeat([params.accel_bias_std, params.gyro_bias_std], 3) ** 2 / 2
+    np.testing.assert_allclose(stationary, expected)
+
+
+def test_bias_reaches_stationary_std(
+    physics: tuple[mujoco.MjModel, mujoco.MjData],
+) -> None:
+    model, _ = physics
+    params = SensorNoiseParams()
+    sensor = _sensor(model, seed=0)
+    # Half a time constant per update decorrelates the samples quickly
+    dt = 0.5 * params.accel_bias_time_constant
+    biases = []
+    for _ in range(4 * NOISE_BLOCK_STEPS):
+        sensor.update_biases(dt)
+        biases.append(sensor.state.accel_bias.copy())
+    std = np.std(biases[100:], axis=0)
+    np.testing.assert_allclose(std, params.accel_bias_std / math.sqrt(2), rtol=0.1)
+
+
+def test_noise_is_a_function_of_the_seed(
+    physics: tuple[mujoco.MjModel, mujoco.MjData],
+) -> None:
+    model, data = physics
+    count = NOISE_BLOCK_STEPS + 10  # crosses a block boundary
+    first = _readings(_sensor(model, seed=3), data, count)
+    np.testing.assert_array_equal(first, _readings(_sensor(model, seed=3), data, count))
+    assert not np.array_equal(first, _readings(_sensor(model, seed=4), data, count))
+
+    reseeded = _sensor(model, seed=4)
+    _readings(reseeded, data, 5)
+    reseeded.reset(seed=3)
+    np.testing.assert_array_equal(first, _readings(reseeded, data, count))
+
+
+@pytest.mark.parametrize("offset", [0, 100, NOISE_BLOCK_STEPS - 5])
+def test_snapshot_replays_the_noise_stream(
+    physics: tuple[mujoco.MjModel, mujoco.MjData], offset: int
+) -> None:
+    model, data = physics
+    sensor = _sensor(model, seed=5)
+    for _ in range(offset):
+        sensor.get_readings(data, DT)
+    snapshot = sensor.snapshot()
+    expected = _readings(sensor, data, 20)
+    _readings(sensor, data, 7)
+
+    sensor.restore(snapshot)
+    np.testing.assert_array_equal(_readings(sensor, data, 20), expected)
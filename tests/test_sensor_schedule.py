@@ -0,0 +1,82 @@
+"""Multi-rate sensor channels with transport delays."""
+
+from __future__ import annotations
+
+import mujoco
+import numpy as np
+import pytest
+
+from simhops.core.quadcopter import create_quadcopter_model
+from simhops.core.sensors import (
+    CHANNEL_SLICES,
+    SENSOR_CHANNELS,
+    ChannelTiming,
+    SensorModel,
+    SensorNoiseParams,
+    channel_timings,
+    refresh_sensordata,
+)
+
+PHYSICS_DT = 0.01
+SCHEDULED = SensorNoiseParams(
+    position_rate=25.0,  # every 4 ticks
+    position_delay=0.02,  # 2 ticks
+    velocity_delay=0.03,  # every tick, 3 ticks late
+    imu_rate=50.0,  # every 2 ticks
+)
+
+
+def test_timings_round_to_physics_ticks() -> None:
+    timings = channel_timings(SCHEDULED, PHYSICS_DT)
+    assert timings is not None
+    assert timings["position"] == ChannelTiming(period=4, delay=2)
+    assert timings["velocity"] == ChannelTiming(period=1, delay=3)
+    assert timings["orientation"] == ChannelTiming(period=1, delay=0)
+    assert timings["imu"] == ChannelTiming(period=2, delay=0)
+    # At most one sample per tick
+    fast = channel_timings(SensorNoiseParams(imu_rate=1000.0), PHYSICS_DT)
+    assert fast is None
+
+
+def test_unscheduled_and_invalid_timings() -> None:
+    assert channel_timings(SensorNoiseParams(), PHYSICS_DT) is None
+    with pytest.raises(ValueError, match="non-negative"):
+        channel_timings(SensorNoiseParams(position_delay=-0.1), PHYSICS_DT)
+
+
+def test_ring_buffer_holds_enough_samples() -> None:
+    timing = ChannelTiming(period=4, delay=9)
+    assert timing.capacity == 4
+    ticks = (0, 8, 9, 12, 13, 17)
+    assert [timing.delayed_sample(tick) for tick in ticks] == [0, 0, 0, 0, 1, 2]
+
+
+def test_readings_are_delayed_samples_of_the_true_signal() -> None:
+    model, data = create_quadcopter_model()
+    assert model.opt.timestep == PHYSICS_DT
+    data.qpos[:3] = (0.0, 0.0, 2.0)
+    data.qvel[:6] = (1.0, -0.5, 2.0, 0.3, -0.2, 0.5)
+    mujoco.mj_forward(model, data)
+
+    scheduled = SensorModel(SCHEDULED)
+    scheduled.bind(model)
+    truth = SensorModel()
+    truth.bind(model)
+    timings = channel_timings(SCHEDULED, PHYSICS_DT)
+    assert scheduled.scheduled and not truth.scheduled and timings is not None
+
+    history = []
+    for tick in range(40):
+        if tick > 0:
+            mujoco.mj_step(model, data)
+            refresh_sensordata(model, data)
+        scheduled.tick(data, add_noise=False)
+        history.append(truth.get_readings(data, PHYSICS_DT, add_noise=False).to_array())
+        reading = scheduled.get_readings(data, PHYSICS_DT, add_noise=False).to_array()
+        for name in SENSOR_CHANNELS:
+            timing = timings[name]
+            sample_tick = timing.delayed_sample(tick) * timing.period
+            channel = CHANNEL_SLICES[name]
+            np.testing.assert_array_equal(
+                reading[channel], history[sample_tick][channel], err_msg=name
+            )
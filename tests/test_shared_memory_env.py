@@ -0,0 +1,73 @@
+"""SharedMemoryVecEnv against DummyVecEnv and worker error handling."""
+
+from __future__ import annotations
+
+from functools import partial
+
+import numpy as np
+import pytest
+from stable_baselines3.common.vec_env import DummyVecEnv
+
+from simhops.envs.quadcopter_env import QuadcopterEnv
+from simhops.envs.shared_memory_env import SharedMemoryVecEnv
+
+N_ENVS = 3
+# Short episodes so the rollout crosses automatic resets
+_make_env = partial(QuadcopterEnv, max_episode_steps=8)
+
+
+@pytest.fixture
+def shared_env():
+    env = SharedMemoryVecEnv([_make_env] * N_ENVS, envs_per_worker=2)
+    yield env
+    env.close()
+
+
+def test_matches_dummy_vec_env(shared_env: SharedMemoryVecEnv) -> None:
+    dummy = DummyVecEnv([_make_env] * N_ENVS)
+    try:
+        shared_env.seed(7)
+        dummy.seed(7)
+        np.testing.assert_array_equal(shared_env.reset(), dummy.reset())
+        rng = np.random.default_rng(0)
+        episodes_ended = 0
+        for _ in range(20):
+            actions = rng.uniform(-1.0, 1.0, size=(N_ENVS, 4)).astype(np.float32)
+            obs, rewards, dones, infos = shared_env.step(actions)
+            expected_obs, expected_rewards, expected_dones, expected_infos = (
+                dummy.step(actions)
+            )
+            np.testing.assert_array_equal(obs, expected_obs)
+            np.testing.assert_allclose(rewards, expected_rewards, rtol=1e-6)
+            np.testing.assert_array_equal(dones, expected_dones)
+            episodes_ended += int(dones.sum())
+            for info, expected in zip(infos, expected_infos):
+                if "terminal_observation" in expected:
+                    np.testing.assert_array_equal(
+                        info["terminal_observation"], expected["terminal_observation"]
+                    )
+        assert episodes_ended >= N_ENVS
+    finally:
+        dummy.close()
+
+
+def test_failing_env_method_leaves_env_usable(
+    shared_env: SharedMemoryVecEnv,
+) -> None:
+    shared_env.reset()
+    with pytest.raises(RuntimeError, match="AttributeError"):
+        shared_env.env_method("no_such_method")
+    with pytest.raises(RuntimeError, match="AttributeError"):
+        shared_env.get_attr("no_such_attribute", indices=[2])
+
+    # Every worker still answers pipe and step commands
+    assert shared_env.get_attr("max_episode_steps") == [8] * N_ENVS
+    obs, rewards, dones, _ = shared_env.step(np.zeros((N_ENVS, 4), np.float32))
+    assert obs.shape[0] == N_ENVS
+    assert np.isfinite(rewards).all()
+
+
+def test_has_attr(shared_env: SharedMemoryVecEnv) -> None:
+    assert shared_env.has_attr("max_episode_steps")
+    assert not shared_env.has_attr("no_such_attribute")
+    assert shared_env.get_attr("max_episode_steps") == [8] * N_ENVS
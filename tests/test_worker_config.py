@@ -0,0 +1,42 @@
+"""Training envs in worker processes use the trainer's config."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from simhops.config import Config
+from simhops.train.trainer import _apply_stage_env, _make_train_env, _reconfigure_env
+
+
+@pytest.mark.parametrize("vec_env", ["subproc", "shared_memory"])
+def test_worker_envs_follow_custom_config(tmp_path: Path, vec_env: str) -> None:
+    config_path = tmp_path / "config.yaml"
+    config = {
+        "training": {"n_envs": 2, "vec_env": vec_env},
+        "curriculum": {
+            "enabled": True,
+            "stages": [{"max_waypoints": 1}, {"max_waypoints": 2}],
+        },
+        "env": {"physics_dt": 0.005, "control_dt": 0.01, "dtype": "float32"},
+        "reward": {"time_penalty": 0.77},
+    }
+    config_path.write_text(yaml.safe_dump(config))
+    cfg = Config.load(config_path)
+    first, second = cfg.curriculum.stages
+
+    env = _make_train_env(cfg, _apply_stage_env(cfg.env, first))
+    try:
+        assert env.get_attr("physics_dt") == [0.005, 0.005]
+        assert env.get_attr("dt") == [0.01, 0.01]
+        assert env.observation_space.dtype == "float32"
+        assert all(dtype == "float32" for dtype in env.get_attr("dtype"))
+        rewards = env.get_attr("_reward_cfg")
+        assert [reward.time_penalty for reward in rewards] == [0.77, 0.77]
+        # Fixed settings match the stage config, so the next stage reuses the envs
+        _reconfigure_env(env, _apply_stage_env(cfg.env, second))
+        assert env.get_attr("max_waypoints") == [2, 2]
+    finally:
+        env.close()